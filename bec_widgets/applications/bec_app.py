@@ -0,0 +1,45 @@
+"""
+Standalone BEC Widgets application with a dock area, optionally restored from a layout snapshot.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from qtpy.QtWidgets import QApplication
+
+from bec_widgets.utils.colors import set_theme
+from bec_widgets.widgets.containers.dock.dock_area import BECDockArea
+from bec_widgets.widgets.containers.main_window.main_window import BECMainWindow
+
+
+def main():
+    """
+    Main entry point of the bec-app script.
+    """
+    parser = argparse.ArgumentParser(description="BEC Widgets application")
+    parser.add_argument(
+        "--snapshot",
+        type=str,
+        help="Layout snapshot to restore, as written by BECDockArea.save_snapshot.",
+    )
+    parser.add_argument(
+        "--trusted", action="store_true", help="Skip the validation of the configs in the snapshot."
+    )
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    app.setApplicationName("BEC")
+    set_theme("auto")
+    window = BECMainWindow()
+    dock_area = BECDockArea(parent=window, root_widget=True)
+    window.setCentralWidget(dock_area)
+    if args.snapshot:
+        dock_area.load_snapshot(args.snapshot, trusted=args.trusted)
+    window.show()
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -21,14 +21,15 @@ from qtpy.QtWidgets import (
 
 import bec_widgets
 from bec_widgets.cli.rpc.rpc_register import RPCRegister
-from bec_widgets.utils.bec_plugin_helper import get_all_plugin_widgets
 from bec_widgets.utils.container_utils import WidgetContainerUtils
 from bec_widgets.utils.error_popups import SafeSlot
 from bec_widgets.utils.name_utils import pascal_to_snake
 from bec_widgets.utils.plugin_utils import get_plugin_auto_updates
 from bec_widgets.utils.round_frame import RoundedFrame
+from bec_widgets.utils.slot_profiler import get_slot_profiler
 from bec_widgets.utils.toolbar import ModularToolBar
 from bec_widgets.utils.ui_loader import UILoader
+from bec_widgets.utils.widget_manifest import WidgetManifestEntry, get_plugin_widget_manifest
 from bec_widgets.widgets.containers.auto_update.auto_updates import AutoUpdates
 from bec_widgets.widgets.containers.dock.dock_area import BECDockArea
 from bec_widgets.widgets.containers.main_window.main_window import BECMainWindow, UILaunchWindow
@@ -137,7 +138,7 @@ class LaunchTile(RoundedFrame):
 class LaunchWindow(BECMainWindow):
     RPC = True
     TILE_SIZE = (250, 300)
-    USER_ACCESS = ["show_launcher", "hide_launcher"]
+    USER_ACCESS = ["show_launcher", "hide_launcher", "set_slot_profiling", "get_slot_profile"]
 
     def __init__(
         self, parent=None, gui_id: str = None, window_title="BEC Launcher", *args, **kwargs
@@ -196,9 +197,9 @@ class LaunchWindow(BECMainWindow):
         )
 
         # plugin widgets
-        self.available_widgets: dict[str, BECWidget] = get_all_plugin_widgets()
+        self.available_widgets: dict[str, WidgetManifestEntry] = get_plugin_widget_manifest()
         if self.available_widgets:
-            plugin_repo_name = next(iter(self.available_widgets.values())).__module__.split(".")[0]
+            plugin_repo_name = next(iter(self.available_widgets.values())).module.split(".")[0]
             plugin_repo_name = plugin_repo_name.removesuffix("_bec").upper()
             self.register_tile(
                 name="widget",
@@ -427,7 +428,7 @@ class LaunchWindow(BECMainWindow):
         widget = self.tiles["widget"].selector.currentText()
         if widget not in self.available_widgets:
             raise ValueError(f"Widget {widget} not found in available widgets.")
-        return self.launch("widget", widget=self.available_widgets[widget])
+        return self.launch("widget", widget=self.available_widgets[widget].load())
 
     @SafeSlot(popup_error=True)
     def _open_custom_ui_file(self):
@@ -464,6 +465,36 @@ class LaunchWindow(BECMainWindow):
         """
         self.hide()
 
+    def set_slot_profiling(self, enabled: bool = True, reset: bool = False):
+        """
+        Enable or disable the profiling of the slots of the GUI server.
+
+        Args:
+            enabled(bool): Whether to profile the slots.
+            reset(bool): If True, the statistics collected so far are removed.
+        """
+        profiler = get_slot_profiler()
+        if reset:
+            profiler.reset()
+        if enabled:
+            profiler.enable()
+        else:
+            profiler.disable()
+
+    def get_slot_profile(self, count: int | None = None) -> list[dict]:
+        """
+        Get the slot statistics of the GUI server, sorted by total execution time.
+
+        Args:
+            count(int, optional): Only return the given number of slowest slots.
+
+        Returns:
+            list[dict]: Calls, drops, errors, queue depth, queue latency and execution time
+                histograms per slot and topic.
+        """
+        stats = get_slot_profiler().snapshot()
+        return stats if count is None else stats[:count]
+
     def showEvent(self, event):
         super().showEvent(event)
         self.setFixedSize(self.size())
@@ -42,6 +42,7 @@ _Widgets = {
     "Minesweeper": "Minesweeper",
     "MotorMap": "MotorMap",
     "MultiWaveform": "MultiWaveform",
+    "PerformanceDashboard": "PerformanceDashboard",
     "PositionIndicator": "PositionIndicator",
     "PositionerBox": "PositionerBox",
     "PositionerBox2D": "PositionerBox2D",
@@ -406,15 +407,45 @@ class BECDockArea(RPCBase):
 
     @rpc_call
     def restore_state(
-        self, state: "dict" = None, missing: "Literal['ignore', 'error']" = "ignore", extra="bottom"
+        self,
+        state: "dict" = None,
+        missing: "Literal['ignore', 'error']" = "ignore",
+        extra="bottom",
+        lazy: "bool" = True,
     ):
         """
         Restore the state of the dock area. If no state is provided, the last state is restored.
+        Docks of the state which do not exist in the dock area are created from their config in
+        config.docks, e.g. when the dock area was created from a saved config.
 
         Args:
             state(dict): The state to restore.
             missing(Literal['ignore','error']): What to do if a dock is missing.
             extra(str): Extra docks that are in the dockarea but that are not mentioned in state will be added to the bottom of the dockarea, unless otherwise specified by the extra argument.
+            lazy(bool): Only build the widgets of created docks once the dock is shown for the first time or its elements are accessed.
+        """
+
+    @rpc_call
+    def save_snapshot(self, path: "str") -> "None":
+        """
+        Save the layout of the dock area together with the configs of all docks and widgets
+        to a binary snapshot file.
+
+        Args:
+            path(str): The path of the snapshot file.
+        """
+
+    @rpc_call
+    def load_snapshot(self, path: "str", trusted: "bool" = False, lazy: "bool" = True) -> "None":
+        """
+        Replace all docks of the dock area by the layout and docks of a snapshot file.
+
+        Args:
+            path(str): The path of the snapshot file, as written by save_snapshot.
+            trusted(bool): Skip the validation of the configs in the snapshot, for snapshots
+                written by this application.
+            lazy(bool): Only build the widgets of a dock once the dock is shown for the first
+                time or its elements are accessed.
         """
 
 
@@ -633,7 +664,7 @@ class Curve(RPCBase):
     @rpc_call
     def get_data(self) -> "tuple[np.ndarray | None, np.ndarray | None]":
         """
-        Get the data of the curve.
+        Get the data of the curve, including data which is scheduled but not drawn yet.
         Returns:
             tuple[np.ndarray,np.ndarray]: X and Y data of the curve.
         """
@@ -2192,6 +2223,41 @@ class MultiWaveform(RPCBase):
         """
 
 
+class PerformanceDashboard(RPCBase):
+    """Dashboard of the GUI performance: frame rates, event loop lag, messages and memory."""
+
+    @rpc_call
+    def snapshot(self) -> "dict":
+        """
+        Get the metrics of the last update.
+
+        Returns:
+            dict: The frame rate per plot, the event loop lag, the message rates per topic, the
+                memory usage, the number and size of the plotted curves and images, the hits and
+                misses of the icon cache, and the slowest slots if slot profiling is enabled.
+        """
+
+    @property
+    @rpc_call
+    def update_interval(self) -> "int":
+        """
+        Interval in milliseconds in which the metrics are sampled.
+        """
+
+    @update_interval.setter
+    @rpc_call
+    def update_interval(self) -> "int":
+        """
+        Interval in milliseconds in which the metrics are sampled.
+        """
+
+    @rpc_call
+    def remove(self):
+        """
+        Cleanup the BECConnector
+        """
+
+
 class PositionIndicator(RPCBase):
     """Display a position within a defined range, e.g. motor limits."""
 
@@ -3403,6 +3469,20 @@ class Waveform(RPCBase):
             Curve: The curve object.
         """
 
+    @rpc_call
+    def plot_many(self, configs: "list[dict]") -> "list[Curve]":
+        """
+        Plot several curves at once. Colors, the categorisation of the device curves and the
+        data refresh are done once for all curves instead of once per curve.
+
+        Args:
+            configs(list[dict]): The keyword arguments of `plot` for every curve, e.g.
+                [{"arg1": "samx"}, {"y_name": "bpm4i", "dap": "GaussianModel"}].
+
+        Returns:
+            list[Curve]: The curve objects.
+        """
+
     @rpc_call
     def add_dap_curve(
         self,
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import select
 import subprocess
 import threading
 import time
+import uuid
 from contextlib import contextmanager
 from threading import Lock
 from typing import TYPE_CHECKING, Literal, TypeAlias, cast
@@ -31,6 +33,9 @@ logger = bec_logger.logger
 
 IGNORE_WIDGETS = ["LaunchWindow"]
 
+# Set to "1" to keep a pre-started, idle GUI server around that is adopted on the next start
+WARM_SPARE_ENV = "BEC_WIDGETS_WARM_SPARE"
+
 RegistryState: TypeAlias = dict[
     Literal["gui_id", "name", "widget_class", "config", "__rpc__", "container_proxy"],
     str | bool | dict,
@@ -76,7 +81,7 @@ def _start_plot_process(
     gui_id: str,
     gui_class_id: str,
     config: dict | str,
-    gui_class: str = "dock_area",
+    gui_class: str | None = "dock_area",
     logger=None,  # FIXME change gui_class back to "launcher" later
 ) -> tuple[subprocess.Popen[str], threading.Thread | None]:
     """
@@ -85,18 +90,14 @@ def _start_plot_process(
     Logger must be a logger object with "debug" and "error" functions,
     or it can be left to "None" as default. None means output from the
     process will not be captured.
+
+    If gui_class is None, the server only starts the launcher and stays idle.
     """
     # pylint: disable=subprocess-run-check
-    command = [
-        "bec-gui-server",
-        "--id",
-        gui_id,
-        "--gui_class",
-        gui_class,
-        "--gui_class_id",
-        gui_class_id,
-        "--hide",
-    ]
+    command = ["bec-gui-server", "--id", gui_id]
+    if gui_class:
+        command.extend(["--gui_class", gui_class])
+    command.extend(["--gui_class_id", gui_class_id, "--hide"])
     if config:
         if isinstance(config, dict):
             config = json.dumps(config)
@@ -130,12 +131,88 @@ def _start_plot_process(
     return process, process_output_processing_thread
 
 
-class RepeatTimer(threading.Timer):
-    """RepeatTimer class."""
+class WarmSpareServer:
+    """
+    A pre-started, idle GUI server. The server only runs the launcher and can be adopted by
+    BECGuiClient.start, which then only needs to launch the dock area instead of starting a
+    new process.
+
+    Args:
+        connector: The redis connector of the BEC client.
+        base_gui_id(str): The gui id of the client, used as prefix for the gui id of the server.
+    """
+
+    def __init__(self, connector, base_gui_id: str):
+        self.gui_id = f"{base_gui_id}_spare_{str(uuid.uuid4())[:5]}"
+        self._connector = connector
+        self.process: subprocess.Popen | None = None
+        self.output_thread: threading.Thread | None = None
+        self.ready_event = threading.Event()
+        self.started_at: float | None = None
+        self.ready_at: float | None = None
+        self._aborted = False
+
+    def start(self, config: dict | str, process_logger=None) -> None:
+        """
+        Start the server process in the background.
+
+        Args:
+            config(dict | str): The service config passed to the server.
+            process_logger: Logger for the output of the process.
+        """
+        self._connector.register(
+            MessageEndpoints.gui_registry_state(self.gui_id),
+            cb=self._handle_registry_update,
+            parent=self,
+        )
+        self.started_at = time.time()
+        self.process, self.output_thread = _start_plot_process(
+            self.gui_id, gui_class_id="bec", config=config, gui_class=None, logger=process_logger
+        )
+
+    @staticmethod
+    def _handle_registry_update(
+        msg: dict[str, GUIRegistryStateMessage], parent: WarmSpareServer
+    ) -> None:
+        # the first registry update of the server contains the launcher, i.e. the server is up
+        if msg["data"].state and not parent.ready_event.is_set():
+            parent.ready_at = time.time()
+            parent.ready_event.set()
+
+    def is_alive(self) -> bool:
+        """Check if the server process is running."""
+        return self.process is not None and self.process.poll() is None
 
-    def run(self):
-        while not self.finished.wait(self.interval):
-            self.function(*self.args, **self.kwargs)
+    def wait_until_ready(self, timeout: float) -> bool:
+        """
+        Wait until the server is ready to receive RPC calls.
+
+        Args:
+            timeout(float): The timeout in seconds.
+
+        Returns:
+            bool: True if the server is ready, False on timeout or if the server was killed.
+        """
+        return self.ready_event.wait(timeout) and not self._aborted
+
+    def detach(self) -> None:
+        """Stop listening for the readiness of the server."""
+        self._connector.unregister(
+            MessageEndpoints.gui_registry_state(self.gui_id), cb=self._handle_registry_update
+        )
+
+    def kill(self) -> None:
+        """Stop the server process."""
+        self._aborted = True
+        self.ready_event.set()
+        self.detach()
+        if self.process is None:
+            return
+        self.process.terminate()
+        if self.output_thread:
+            self.output_thread.join()
+        self.process.wait()
+        self.process = None
 
 
 # pylint: disable=protected-access
@@ -150,10 +227,7 @@ def wait_for_server(client: BECGuiClient):
         else:
             raise RuntimeError("GUI is not alive")
     try:
-        if client._gui_started_event.wait(timeout=timeout):
-            client._gui_started_timer.cancel()
-            client._gui_started_timer.join()
-        else:
+        if not client._gui_started_event.wait(timeout=timeout):
             raise TimeoutError("Could not connect to GUI server")
     finally:
         # after initial waiting period, do not wait so much any more
@@ -202,17 +276,29 @@ class AvailableWidgetsNamespace:
 class BECGuiClient(RPCBase):
     """BEC GUI client class. Container for GUI applications within Python."""
 
-    def __init__(self, **kwargs) -> None:
+    def __init__(self, warm_spare: bool | None = None, **kwargs) -> None:
+        """
+        Args:
+            warm_spare(bool, optional): Keep a pre-started, idle GUI server that is adopted on the
+                next start or restart. Defaults to the BEC_WIDGETS_WARM_SPARE environment variable.
+        """
         super().__init__(**kwargs)
         self._lock = Lock()
         self._anchor_widget = "launcher"
         self._killed = False
         self._top_level: dict[str, RPCReference] = {}
         self._startup_timeout = 0
-        self._gui_started_timer = None
         self._gui_started_event = threading.Event()
+        self._startup_timeline: dict[str, float] = {}
         self._process = None
         self._process_output_processing_thread = None
+        if warm_spare is None:
+            warm_spare = os.environ.get(WARM_SPARE_ENV, "0") == "1"
+        self._warm_spare_enabled = warm_spare
+        self._warm_spare: WarmSpareServer | None = None
+        self._adopted_spare: WarmSpareServer | None = None
+        self._spare_launch_thread: threading.Thread | None = None
+        self._warm_spare_cleanup_registered = False
         self._server_registry: dict[str, RegistryState] = {}
         self._ipython_registry: dict[str, RPCReference] = {}
         self.available_widgets = AvailableWidgetsNamespace()
@@ -249,6 +335,57 @@ class BECGuiClient(RPCBase):
             from_start=True,
         )
 
+    @property
+    def warm_spare(self) -> bool:
+        """Whether a pre-started GUI server is kept for the next start or restart."""
+        return self._warm_spare_enabled
+
+    @warm_spare.setter
+    def warm_spare(self, enabled: bool) -> None:
+        self._warm_spare_enabled = enabled
+        if enabled:
+            self._ensure_warm_spare()
+        else:
+            self._kill_warm_spare()
+
+    @property
+    def startup_timeline(self) -> dict[str, float]:
+        """Time in seconds of the steps of the last GUI startup, relative to the start request."""
+        start = self._startup_timeline.get("requested")
+        if start is None:
+            return {}
+        return {step: t - start for step, t in self._startup_timeline.items()}
+
+    def profile_slots(self, enabled: bool = True, reset: bool = False) -> None:
+        """
+        Enable or disable the profiling of the slots of the GUI server.
+
+        Args:
+            enabled(bool): Whether to profile the slots.
+            reset(bool): If True, the statistics collected so far are removed.
+        """
+        with wait_for_server(self):
+            self.launcher._run_rpc(  # pylint: disable=protected-access
+                "set_slot_profiling", enabled=enabled, reset=reset
+            )
+
+    def slot_profile(self, count: int | None = None) -> list[dict]:
+        """
+        Get the slot statistics of the GUI server, sorted by total execution time. Profiling
+        has to be enabled first with profile_slots.
+
+        Args:
+            count(int, optional): Only return the given number of slowest slots.
+
+        Returns:
+            list[dict]: Calls, drops, errors, queue depth, queue latency and execution time
+                histograms per slot and topic.
+        """
+        with wait_for_server(self):
+            return self.launcher._run_rpc(  # pylint: disable=protected-access
+                "get_slot_profile", count=count
+            )
+
     @property
     def windows(self) -> dict:
         """Dictionary with dock areas in the GUI."""
@@ -324,9 +461,10 @@ class BECGuiClient(RPCBase):
         # Unregister the registry state
         self._killed = True
 
-        if self._gui_started_timer is not None:
-            self._gui_started_timer.cancel()
-            self._gui_started_timer.join()
+        if self._adopted_spare is not None:
+            # abort the launch of the dock area on a server that is about to be adopted
+            self._adopted_spare.kill()
+            self._adopted_spare = None
 
         if self._process is None:
             return
@@ -364,18 +502,20 @@ class BECGuiClient(RPCBase):
             return False
         return True
 
-    def _gui_post_startup(self):
-        timeout = 60
-        # Wait for 'bec' gui to be registered, this may take some time
-        # After 60s timeout. Should this raise an exception on timeout?
-        while time.time() < time.time() + timeout:
-            if len(list(self._server_registry.keys())) < 2 or not hasattr(
-                self, self._anchor_widget
-            ):
-                time.sleep(0.1)
-            else:
-                break
-
+    def _check_gui_ready(self) -> None:
+        """
+        Set the started event once the 'bec' gui is registered. Called on every registry update
+        of the server, i.e. the readiness is signalled by the server instead of being polled.
+        """
+        if self._gui_started_event.is_set():
+            return
+        if len(self._server_registry) < 2 or not hasattr(self, self._anchor_widget):
+            return
+        self._startup_timeline["ready"] = time.time()
+        logger.success(
+            "GUI ready. Startup timeline: "
+            + ", ".join(f"{step}: {t:.2f}s" for step, t in self.startup_timeline.items())
+        )
         self._gui_started_event.set()
 
     def _start_server(self, wait: bool = False) -> None:
@@ -386,35 +526,102 @@ class BECGuiClient(RPCBase):
             logger.success("GUI starting...")
             self._startup_timeout = 5
             self._gui_started_event.clear()
+            self._startup_timeline = {"requested": time.time()}
             self._process, self._process_output_processing_thread = _start_plot_process(
                 self._gui_id,
                 gui_class_id="bec",
                 config=self._client._service_config.config,  # pylint: disable=protected-access
                 logger=logger,
             )
-
-            def gui_started_callback(callback):
-                try:
-                    if callable(callback):
-                        callback()
-                finally:
-                    threading.current_thread().cancel()  # type: ignore
-
-            self._gui_started_timer = RepeatTimer(
-                0.5, lambda: self._gui_is_alive() and gui_started_callback(self._gui_post_startup)
-            )
-            self._gui_started_timer.start()
+            self._startup_timeline["process_started"] = time.time()
+            self._ensure_warm_spare()
 
         if wait:
             self._gui_started_event.wait()
 
+    def _ensure_warm_spare(self) -> None:
+        """Start a warm spare server in the background if enabled and none is running."""
+        if not self._warm_spare_enabled:
+            return
+        if self._warm_spare is not None and self._warm_spare.is_alive():
+            return
+        self._kill_warm_spare()
+        logger.info("Starting warm spare GUI server in the background")
+        self._warm_spare = WarmSpareServer(self._client.connector, self._gui_id.split("_spare_")[0])
+        self._warm_spare.start(
+            config=self._client._service_config.config,  # pylint: disable=protected-access
+            process_logger=logger,
+        )
+        if not self._warm_spare_cleanup_registered:
+            # the server runs in its own session, make sure it does not outlive the client
+            atexit.register(self._kill_warm_spare)
+            self._warm_spare_cleanup_registered = True
+
+    def _kill_warm_spare(self) -> None:
+        if self._warm_spare is None:
+            return
+        self._warm_spare.kill()
+        self._warm_spare = None
+
+    def _adopt_warm_spare(self) -> bool:
+        """
+        Adopt the warm spare server, if one is running. The dock area is launched on the server
+        once it is ready, and a new spare is started in the background.
+
+        Returns:
+            bool: True if a spare server was adopted.
+        """
+        spare = self._warm_spare
+        self._warm_spare = None
+        if spare is None:
+            return False
+        if not spare.is_alive():
+            spare.kill()
+            return False
+
+        logger.success("GUI starting from warm spare server...")
+        self._startup_timeline = {"requested": time.time(), "spare_started": spare.started_at}
+        if spare.ready_at is not None:
+            self._startup_timeline["spare_ready"] = spare.ready_at
+        self._startup_timeout = 5
+        self._gui_started_event.clear()
+        self._process = spare.process
+        self._process_output_processing_thread = spare.output_thread
+        self._adopted_spare = spare
+        self.connect_to_gui_server(spare.gui_id)
+
+        self._spare_launch_thread = threading.Thread(
+            target=self._launch_on_adopted_spare, args=(spare,), daemon=True
+        )
+        self._spare_launch_thread.start()
+        self._ensure_warm_spare()
+        return True
+
+    def _launch_on_adopted_spare(self, spare: WarmSpareServer) -> None:
+        try:
+            if not spare.wait_until_ready(timeout=60):
+                logger.error(f"Warm spare GUI server {spare.gui_id} did not become ready.")
+                return
+            spare.detach()
+            self._startup_timeline.setdefault("spare_ready", spare.ready_at or time.time())
+            self.launcher._run_rpc(  # pylint: disable=protected-access
+                "launch", launch_script="dock_area", name="bec", timeout=30
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Failed to launch the dock area on the warm spare GUI server: {exc}")
+        finally:
+            if self._adopted_spare is spare:
+                self._adopted_spare = None
+
     def _start(self, wait: bool = False) -> None:
         self._killed = False
-        self._client.connector.register(
-            MessageEndpoints.gui_registry_state(self._gui_id),
-            cb=self._handle_registry_update,
-            parent=self,
-        )
+        # adopting a spare server connects to its registry state
+        if self._check_if_server_is_alive() or not self._adopt_warm_spare():
+            self._client.connector.register(
+                MessageEndpoints.gui_registry_state(self._gui_id),
+                cb=self._handle_registry_update,
+                parent=self,
+            )
         return self._start_server(wait=wait)
 
     @staticmethod
@@ -426,6 +633,8 @@ class BECGuiClient(RPCBase):
         self = parent
         self._server_registry = cast(dict[str, RegistryState], msg["data"].state)
         self._update_dynamic_namespace(self._server_registry)
+        self._startup_timeline.setdefault("first_registry_update", time.time())
+        self._check_gui_ready()
 
     def _do_show_all(self):
         rpc_client = RPCBase(gui_id=f"{self._gui_id}:launcher", parent=self)
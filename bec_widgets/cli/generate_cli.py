@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib
+import importlib.util
 import inspect
+import json
 import os
 import sys
 from pathlib import Path
@@ -15,9 +18,14 @@ from qtpy.QtCore import Property as QtProperty
 
 from bec_widgets.utils.generate_designer_plugin import DesignerPluginGenerator, plugin_filenames
 from bec_widgets.utils.plugin_utils import BECClassContainer, get_custom_classes
+from bec_widgets.utils.widget_manifest import manifest_cache_dir
 
 logger = bec_logger.logger
 
+CLIENT_MANIFEST_SCHEMA_VERSION = 1
+# key of the header and the widget enum in the cache of formatted stubs
+PREAMBLE_KEY = "__preamble__"
+
 if sys.version_info >= (3, 11):
     from typing import get_overloads
 else:
@@ -61,6 +69,9 @@ logger = bec_logger.logger
 # pylint: skip-file"""
 
         self.content = ""
+        self._preamble = ""
+        self._stubs: dict[str, str] = {}
+        self.stub_cache: dict[str, dict] = {}
 
     def generate_client(self, class_container: BECClassContainer):
         """
@@ -82,10 +93,14 @@ logger = bec_logger.logger
         connector_classes.sort(key=lambda x: x.__name__)
 
         self.write_client_enum(rpc_top_level_classes)
+        self._preamble = self.header + "\n" + self.content
+        self._stubs = {}
         for cls in connector_classes:
             logger.debug(f"generating RPC client class for {cls.__name__}")
+            start = len(self.content)
             self.content += "\n\n"
             self.generate_content_for_class(cls)
+            self._stubs[cls.__name__] = self.content[start:]
 
     def write_client_enum(self, published_classes: list[type]):
         """
@@ -213,31 +228,274 @@ class {class_name}(RPCBase):"""
 {doc}
         \"\"\""""
 
-    def write(self, file_name: str):
+    def write(self, file_name: str, stub_cache: dict[str, dict] | None = None) -> bool:
         """
-        Write the content to a file, automatically formatted with black.
+        Write the content to a file, automatically formatted with black. If the content was
+        created by generate_client, the class stubs are formatted one by one and stubs whose
+        raw content is found in the stub cache are not formatted again. The updated cache is
+        available as stub_cache afterwards. The file is only written if its content changed.
 
         Args:
             file_name(str): The name of the file to write to.
+            stub_cache(dict[str, dict], optional): Formatted stubs of a previous run by class
+                name, as stored in the client manifest.
+
+        Returns:
+            bool: True if the file was written.
         """
-        # Combine header and content, then format with black
-        full_content = self.header + "\n" + self.content
+        if self._stubs:
+            formatted_content = self._format_stubs(stub_cache or {})
+        else:
+            formatted_content = format_client_code(self.header + "\n" + self.content)
+
         try:
-            formatted_content = black.format_str(full_content, mode=black.Mode(line_length=100))
-        except black.NothingChanged:
-            formatted_content = full_content
-
-        config = isort.Config(
-            profile="black",
-            line_length=100,
-            multi_line_output=3,
-            include_trailing_comma=False,
-            known_first_party=["bec_widgets"],
-        )
-        formatted_content = isort.code(formatted_content, config=config)
+            with open(file_name, "r", encoding="utf-8") as file:
+                unchanged = file.read() == formatted_content
+        except OSError:
+            unchanged = False
+        if unchanged:
+            logger.info(f"Client file {file_name} is unchanged")
+            return False
 
         with open(file_name, "w", encoding="utf-8") as file:
             file.write(formatted_content)
+        return True
+
+    def _format_stubs(self, stub_cache: dict[str, dict]) -> str:
+        chunks = [(PREAMBLE_KEY, self._preamble)] + list(self._stubs.items())
+        self.stub_cache = {}
+        formatted = []
+        target_versions = None
+        for name, raw in chunks:
+            raw_hash = hashlib.sha256(raw.encode()).hexdigest()
+            cached = stub_cache.get(name)
+            if isinstance(cached, dict) and cached.get("hash") == raw_hash:
+                text = cached["formatted"]
+            else:
+                logger.debug(f"Formatting client stub {name}")
+                if target_versions is None:
+                    target_versions = self._target_versions()
+                text = format_client_code(raw, target_versions=target_versions)
+            self.stub_cache[name] = {"hash": raw_hash, "formatted": text}
+            formatted.append(text)
+        # top-level definitions are separated by two blank lines, as black does for the full file
+        return "\n\n".join(formatted)
+
+    def _target_versions(self) -> set:
+        # black infers the python versions from the features used in the code, which changes
+        # e.g. trailing commas. Infer them from the full client, such that formatting a single
+        # stub gives the same result as formatting the full file.
+        node = black.lib2to3_parse(self.header + "\n" + self.content)
+        return set(
+            black.detect_target_versions(node, future_imports=black.get_future_imports(node))
+        )
+
+
+def format_client_code(code: str, target_versions: set | None = None) -> str:
+    """
+    Format generated client code with black and isort, in-process.
+
+    Args:
+        code(str): The code.
+        target_versions(set, optional): The black target versions. Defaults to None, which lets
+            black infer them from the code.
+
+    Returns:
+        str: The formatted code.
+    """
+    mode = black.Mode(line_length=100, target_versions=target_versions or set())
+    try:
+        formatted_content = black.format_str(code, mode=mode)
+    except black.NothingChanged:
+        formatted_content = code
+
+    config = isort.Config(
+        profile="black",
+        line_length=100,
+        multi_line_output=3,
+        include_trailing_comma=False,
+        known_first_party=["bec_widgets"],
+    )
+    return isort.code(formatted_content, config=config)
+
+
+def source_content_hash(directories: list[str], exclude: tuple[str, ...] = ()) -> str:
+    """
+    Compute a hash over the content of all python source files below the given directories.
+
+    Args:
+        directories(list[str]): The directories.
+        exclude(tuple[str, ...]): Files to leave out, e.g. the generated client itself.
+
+    Returns:
+        str: The hash.
+    """
+    excluded = {os.path.abspath(path) for path in exclude}
+    digest = hashlib.sha256()
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for file in sorted(files):
+                path = os.path.join(root, file)
+                if not file.endswith(".py") or os.path.abspath(path) in excluded:
+                    continue
+                try:
+                    with open(path, "rb") as source:
+                        content = source.read()
+                except OSError:
+                    continue
+                digest.update(f"{os.path.relpath(path, directory)}\0".encode())
+                digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+class ClientManifest:
+    """
+    Manifest of a generated client file, persisted as json file in the cache directory. It holds
+    the content hash of the sources the client was generated from, the hash of the written file
+    and the formatted class stubs, such that an unchanged client is not generated again and only
+    changed stubs are formatted again.
+
+    Args:
+        client_path(str): Path of the generated client file.
+        source_dirs(list[str]): Directories whose python files determine the client, i.e. the
+            widgets and the classes they inherit their USER_ACCESS methods from.
+    """
+
+    def __init__(self, client_path: str, source_dirs: list[str]):
+        self.client_path = os.path.abspath(client_path)
+        self.source_dirs = source_dirs
+        self._fingerprint: str | None = None
+        self._content: dict | None = None
+
+    @property
+    def path(self) -> str:
+        """Path of the manifest file, unique per client file."""
+        location = hashlib.sha1(self.client_path.encode()).hexdigest()[:8]
+        return os.path.join(manifest_cache_dir(), f"client_{location}_manifest.json")
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the sources and of the generator itself."""
+        if self._fingerprint is None:
+            self._fingerprint = source_content_hash(
+                self.source_dirs + [os.path.dirname(os.path.abspath(__file__))],
+                exclude=(self.client_path,),
+            )
+        return self._fingerprint
+
+    @property
+    def stubs(self) -> dict[str, dict]:
+        """The formatted stubs of the last generation by class name."""
+        stubs = self._load().get("stubs")
+        return stubs if isinstance(stubs, dict) else {}
+
+    def is_up_to_date(self) -> bool:
+        """
+        Check whether the client file was generated from the current sources and was not
+        modified since.
+
+        Returns:
+            bool: True if the client does not need to be generated again.
+        """
+        content = self._load()
+        if content.get("fingerprint") != self.fingerprint:
+            return False
+        try:
+            with open(self.client_path, "rb") as file:
+                output_hash = hashlib.sha256(file.read()).hexdigest()
+        except OSError:
+            return False
+        return content.get("output") == output_hash
+
+    def save(self, stubs: dict[str, dict]):
+        """
+        Store the manifest after the client file was generated. Failures, e.g. due to a
+        read-only file system, are logged and otherwise ignored.
+
+        Args:
+            stubs(dict[str, dict]): The formatted stubs by class name.
+        """
+        try:
+            with open(self.client_path, "rb") as file:
+                output_hash = hashlib.sha256(file.read()).hexdigest()
+        except OSError:
+            return
+        self._content = {
+            "schema": CLIENT_MANIFEST_SCHEMA_VERSION,
+            "fingerprint": self.fingerprint,
+            "output": output_hash,
+            "stubs": stubs,
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self._content, file)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.warning(f"Could not write client manifest {self.path}: {exc}")
+
+    def _load(self) -> dict:
+        if self._content is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    content = json.load(file)
+            except (OSError, ValueError):
+                content = {}
+            valid = (
+                isinstance(content, dict)
+                and content.get("schema") == CLIENT_MANIFEST_SCHEMA_VERSION
+            )
+            self._content = content if valid else {}
+        return self._content
+
+
+def _package_directory(module_name: str) -> str | None:
+    """Find the directory of a package without importing the package itself."""
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return list(spec.submodule_search_locations)[0]
+
+
+def generate_client_file(
+    module_name: str, client_path: str, force: bool = False
+) -> BECClassContainer | None:
+    """
+    Generate the client file of a package. The widgets are only imported and the client is only
+    generated if the sources changed since the last generation, see ClientManifest.
+
+    Args:
+        module_name(str): The package with the widgets, i.e. bec_widgets or
+            <plugin_repo>.bec_widgets.
+        client_path(str): Path of the client file.
+        force(bool): Generate the client even if it is up to date.
+
+    Returns:
+        BECClassContainer | None: The classes of the package, None if the client was up to date.
+    """
+    source_dirs = [_package_directory(module_name) or os.path.dirname(client_path)]
+    if module_name != "bec_widgets":
+        # plugin widgets inherit USER_ACCESS methods from bec_widgets
+        source_dirs.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    manifest = ClientManifest(client_path, source_dirs)
+    if not force and manifest.is_up_to_date():
+        logger.info(f"Client file {client_path} is up to date")
+        return None
+
+    rpc_classes = get_custom_classes(module_name)
+    logger.info(f"Obtained classes with RPC objects: {rpc_classes!r}")
+
+    generator = ClientGenerator(base=module_name == "bec_widgets")
+    logger.info(f"Generating client file at {client_path}")
+    generator.generate_client(rpc_classes)
+    generator.write(client_path, stub_cache=manifest.stubs)
+    manifest.save(generator.stub_cache)
+    return rpc_classes
 
 
 def main():
@@ -252,6 +510,11 @@ def main():
         type=str,
         help="Which package to generate plugin files for. Should be installed in the local environment (example: my_plugin_repo)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Generate the client even if the widget sources did not change since the last run",
+    )
 
     args = parser.parse_args()
     if args.target is None:
@@ -276,13 +539,10 @@ def main():
 
     client_path = module_dir / client_subdir / "client.py"
 
-    rpc_classes = get_custom_classes(module_name)
-    logger.info(f"Obtained classes with RPC objects: {rpc_classes!r}")
-
-    generator = ClientGenerator(base=module_name == "bec_widgets")
-    logger.info(f"Generating client file at {client_path}")
-    generator.generate_client(rpc_classes)
-    generator.write(str(client_path))
+    rpc_classes = generate_client_file(module_name, str(client_path), force=args.force)
+    if rpc_classes is None:
+        # nothing changed, hence there are no new plugins either
+        return
 
     if module_name != "bec_widgets":
         non_overwrite_classes = list(clsinfo.name for clsinfo in get_custom_classes("bec_widgets"))
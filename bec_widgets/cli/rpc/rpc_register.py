@@ -55,6 +55,7 @@ class RPCRegister:
         self._skip_broadcast = False
         self._initialized = True
         self.callbacks = []
+        self._registration_callbacks: dict[str, list[Callable[[BECConnector], None]]] = {}
 
     @classmethod
     def delayed_broadcast(cls):
@@ -75,6 +76,8 @@ class RPCRegister:
         if not hasattr(rpc, "gui_id"):
             raise ValueError("RPC object must have a 'gui_id' attribute.")
         self._rpc_register[rpc.gui_id] = rpc
+        for callback in self._registration_callbacks.pop(rpc.gui_id, []):
+            callback(rpc)
 
     @broadcast_update
     def remove_rpc(self, rpc: BECConnector):
@@ -148,6 +151,39 @@ class RPCRegister:
         """
         return obj.gui_id in self._rpc_register
 
+    def call_on_registration(self, obj: BECConnector, callback: Callable[[BECConnector], None]):
+        """
+        Call the callback once the object is registered in the RPC register. If the object is
+        already registered, the callback is called immediately.
+
+        Args:
+            obj(BECConnector): The object to wait for.
+            callback(Callable[[BECConnector], None]): The callback, called with the object.
+        """
+        if self.object_is_registered(obj):
+            callback(obj)
+            return
+        self._registration_callbacks.setdefault(obj.gui_id, []).append(callback)
+
+    def cancel_registration_callbacks(
+        self, obj: BECConnector, callback: Callable[[BECConnector], None] | None = None
+    ):
+        """
+        Remove pending registration callbacks of the object.
+
+        Args:
+            obj(BECConnector): The object whose callbacks should be removed.
+            callback(Callable[[BECConnector], None], optional): Only remove this callback.
+                Defaults to None, which removes all callbacks of the object.
+        """
+        if callback is None:
+            self._registration_callbacks.pop(obj.gui_id, None)
+            return
+        callbacks = self._registration_callbacks.get(obj.gui_id, [])
+        callbacks[:] = [cb for cb in callbacks if cb != callback]
+        if not callbacks:
+            self._registration_callbacks.pop(obj.gui_id, None)
+
     def add_callback(self, callback: Callable[[dict], None]):
         """
         Add a callback that will be called whenever the registry is updated.
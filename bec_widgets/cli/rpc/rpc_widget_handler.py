@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from bec_widgets.cli.client_utils import IGNORE_WIDGETS
-from bec_widgets.utils.bec_plugin_helper import get_all_plugin_widgets
 from bec_widgets.utils.bec_widget import BECWidget
-from bec_widgets.utils.plugin_utils import get_custom_classes
+from bec_widgets.utils.widget_manifest import (
+    LazyWidgetClasses,
+    get_plugin_widget_manifest,
+    get_widget_manifest,
+)
 
 
 class RPCWidgetHandler:
@@ -13,28 +16,37 @@ class RPCWidgetHandler:
         self._widget_classes = None
 
     @property
-    def widget_classes(self) -> dict[str, type[BECWidget]]:
+    def widget_classes(self) -> LazyWidgetClasses:
         """
-        Get the available widget classes.
+        Get the available widget classes. The widget classes are resolved from the persisted
+        widget manifest and only imported when accessed.
 
         Returns:
-            dict: The available widget classes.
+            LazyWidgetClasses: The available widget classes.
         """
         if self._widget_classes is None:
             self.update_available_widgets()
         return self._widget_classes  # type: ignore
 
-    def update_available_widgets(self):
+    def update_available_widgets(self, force_update: bool = False):
         """
         Update the available widgets.
 
+        Args:
+            force_update(bool): If True, the widget manifests are regenerated.
+
         Returns:
             None
         """
-        clss = get_custom_classes("bec_widgets")
-        self._widget_classes = get_all_plugin_widgets() | {
-            cls.__name__: cls for cls in clss.widgets if cls.__name__ not in IGNORE_WIDGETS
-        }
+        manifest = get_widget_manifest("bec_widgets", force_update=force_update)
+        self._widget_classes = LazyWidgetClasses(
+            get_plugin_widget_manifest(force_update=force_update)
+            | {
+                name: entry
+                for name, entry in manifest.items()
+                if entry.is_widget and name not in IGNORE_WIDGETS
+            }
+        )
 
     def create_widget(self, widget_type, **kwargs) -> BECWidget:
         """
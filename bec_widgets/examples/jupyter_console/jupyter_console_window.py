@@ -2,7 +2,6 @@ import os
 
 import numpy as np
 import pyqtgraph as pg
-from bec_qthemes import material_icon
 from qtpy.QtWidgets import (
     QApplication,
     QGroupBox,
@@ -15,6 +14,7 @@ from qtpy.QtWidgets import (
 )
 
 from bec_widgets.utils import BECDispatcher
+from bec_widgets.utils.icon_cache import material_icon
 from bec_widgets.utils.widget_io import WidgetHierarchy as wh
 from bec_widgets.widgets.containers.dock import BECDockArea
 from bec_widgets.widgets.containers.layout_manager.layout_manager import LayoutManagerWidget
@@ -6,11 +6,11 @@ import sys
 import sysconfig
 from pathlib import Path
 
-from bec_qthemes import material_icon
 from qtpy import PYSIDE6
 from qtpy.QtGui import QIcon
 
 from bec_widgets.utils.bec_plugin_helper import user_widget_plugin
+from bec_widgets.utils.icon_cache import material_icon
 
 if PYSIDE6:
     from PySide6.scripts.pyside_tool import (
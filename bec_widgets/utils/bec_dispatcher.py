@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import collections
+import inspect
 import random
 import string
+import threading
+import time
+import weakref
 from collections.abc import Callable
 from typing import TYPE_CHECKING, DefaultDict, Hashable, Union
 
@@ -15,7 +19,9 @@ from bec_lib.service_config import ServiceConfig
 from qtpy.QtCore import QObject
 from qtpy.QtCore import Signal as pyqtSignal
 
+from bec_widgets.utils.performance_metrics import get_message_rate_meter
 from bec_widgets.utils.serialization import register_serializer_extension
+from bec_widgets.utils.slot_profiler import get_slot_profiler, slot_name
 
 logger = bec_logger.logger
 
@@ -41,10 +47,39 @@ class QtThreadSafeCallback(QObject):
         super().__init__()
         self.cb_info = cb_info
 
-        self.cb = cb
+        # bound methods are only referenced weakly, such that the wrapper does not keep the
+        # widget alive; plain functions (e.g. lambdas) are kept alive by the wrapper
+        self._cb = None if inspect.ismethod(cb) else cb
         self.cb_ref = louie.saferef.safe_ref(cb)
-        self.cb_signal.connect(self.cb)
+        self.cb_signal.connect(cb)
         self.topics = set()
+        self.registry_key: tuple[Hashable, str] | None = None
+        self._finalizer: weakref.finalize | None = None
+
+        # profiling: receipt times of the messages waiting for the GUI thread, and the topic and
+        # start time of the delivery in progress
+        self.slot_name = slot_name(cb)
+        self._profiling = False
+        self._pending: collections.deque[tuple[str | None, float]] = collections.deque()
+        self._delivery: tuple[str | None, float] | None = None
+
+        # while suspended, only the latest message per topic is kept instead of calling the slot;
+        # the lock serialises the listener thread storing messages with suspending and resuming
+        # in the GUI thread
+        self._suspend_lock = threading.Lock()
+        self._suspended = False
+        self._latest: dict[str | None, tuple[dict, dict]] = {}
+        profiler = get_slot_profiler()
+        profiler.track(self)
+        if profiler.enabled:
+            self.set_profiling(True)
+
+    @property
+    def cb(self) -> Callable | None:
+        """The wrapped callback, or None if it has been deleted."""
+        if self._cb is not None:
+            return self._cb
+        return self.cb_ref()
 
     def __hash__(self):
         # make 2 differents QtThreadSafeCallback to look
@@ -57,12 +92,136 @@ class QtThreadSafeCallback(QObject):
             return False
         return self.cb_ref == other.cb_ref and self.cb_info == other.cb_info
 
-    def __call__(self, msg_content, metadata):
+    def __call__(self, msg_content, metadata, topic: str | None = None):
         if self.cb_ref() is None:
             # callback has been deleted
+            if self._profiling:
+                get_slot_profiler().record_drop(self.slot_name, topic)
             return
+        rate_meter = get_message_rate_meter()
+        if self._profiling or rate_meter.enabled:
+            if topic is None and len(self.topics) == 1:
+                topic = next(iter(self.topics))
+            if rate_meter.enabled:
+                rate_meter.count(topic)
+        with self._suspend_lock:
+            if self._suspended:
+                if topic is None and len(self.topics) == 1:
+                    topic = next(iter(self.topics))
+                self._latest[topic] = (msg_content, metadata)
+                return
+        self._emit(msg_content, metadata, topic)
+
+    def _emit(self, msg_content: dict, metadata: dict, topic: str | None):
+        if self._profiling:
+            self._pending.append((topic, time.perf_counter()))
+            get_slot_profiler().record_receipt(self.slot_name, topic, len(self._pending))
         self.cb_signal.emit(msg_content, metadata)
 
+    @property
+    def suspended(self) -> bool:
+        """Whether the slot only keeps the latest message instead of being called."""
+        return self._suspended
+
+    def set_suspended(self, suspended: bool, catch_up: bool = True):
+        """
+        Suspend or resume the delivery of messages to the slot. While suspended, only the latest
+        message per topic is kept. Must be called from the GUI thread.
+
+        Args:
+            suspended(bool): Whether to suspend the slot.
+            catch_up(bool): On resume, deliver the latest message per topic received while the
+                slot was suspended. Messages arriving from now on are queued behind them.
+        """
+        with self._suspend_lock:
+            if suspended == self._suspended:
+                return
+            self._suspended = suspended
+            latest, self._latest = self._latest, {}
+        if suspended or not catch_up or self.cb_ref() is None:
+            return
+        for topic, (msg_content, metadata) in latest.items():
+            self._emit(msg_content, metadata, topic)
+
+    @property
+    def in_delivery(self) -> bool:
+        """Whether a profiled delivery to the slot is in progress."""
+        return self._delivery is not None
+
+    @property
+    def delivery_topic(self) -> str | None:
+        """Topic of the profiled delivery in progress."""
+        return self._delivery[0] if self._delivery is not None else None
+
+    def set_profiling(self, enabled: bool):
+        """
+        Install or remove the profiling hooks. The hooks are connected to cb_signal right before
+        and right after the slot, such that they run immediately before and after the slot for
+        every message.
+
+        Args:
+            enabled(bool): Whether to profile the deliveries to the slot.
+        """
+        cb = self.cb
+        if enabled == self._profiling or cb is None:
+            return
+        self.cb_signal.disconnect()
+        self._pending.clear()
+        self._delivery = None
+        self._profiling = enabled
+        if enabled:
+            self.cb_signal.connect(self._start_delivery)
+        self.cb_signal.connect(cb)
+        if enabled:
+            self.cb_signal.connect(self._finish_delivery)
+
+    def _start_delivery(self, *_):
+        if not self._pending:
+            return
+        topic, received = self._pending.popleft()
+        start = time.perf_counter()
+        self._delivery = (topic, start)
+        get_slot_profiler().record_start(
+            self.slot_name, topic, start - received, len(self._pending)
+        )
+
+    def _finish_delivery(self, *_):
+        if self._delivery is None:
+            return
+        topic, start = self._delivery
+        self._delivery = None
+        get_slot_profiler().record_call(self.slot_name, topic, time.perf_counter() - start)
+
+
+def _split_patterns(topics) -> tuple[list, list]:
+    """
+    Split topics into plain topics and patterns, i.e. topics containing "*" wildcards, which
+    have to be subscribed to with a pattern subscription.
+
+    Args:
+        topics (EndpointInfo | str | list): The topics.
+
+    Returns:
+        tuple[list, list]: The plain topics and the patterns.
+    """
+    if not isinstance(topics, (list, tuple, set, dict)):
+        topics = [topics]
+    plain, patterns = [], []
+    for topic in topics:
+        endpoint = getattr(topic, "endpoint", topic)
+        (patterns if "*" in endpoint else plain).append(topic)
+    return plain, patterns
+
+
+def _slot_identity(slot: Callable) -> Hashable:
+    """
+    Key identifying a slot without creating a reference to it. Bound methods are recreated on
+    every attribute access, hence they are identified by their instance and function.
+    """
+    if inspect.ismethod(slot):
+        return (id(slot.__self__), id(slot.__func__))
+    return id(slot)
+
 
 class QtRedisConnector(RedisConnector):
     def __init__(self, *args, **kwargs):
@@ -81,6 +240,7 @@ class QtRedisConnector(RedisConnector):
         #    msg = msg[0]
         #    raise RuntimeError(f"
         if isinstance(msg, MessageObject):
+            topic = msg.topic
             if isinstance(msg.value, list):
                 msg = msg.value[0]
             else:
@@ -88,7 +248,7 @@ class QtRedisConnector(RedisConnector):
 
             # we can notice kwargs are lost when passed to Qt slot
             metadata = msg.metadata
-            cb(msg.content, metadata)
+            cb(msg.content, metadata, topic=topic)
         else:
             # from stream
             msg = msg["data"]
@@ -120,9 +280,18 @@ class BECDispatcher:
         if self._initialized:
             return
 
-        self._registered_slots: DefaultDict[Hashable, QtThreadSafeCallback] = (
-            collections.defaultdict()
+        # registered wrappers by (slot identity, cb_info), and the same wrappers indexed by
+        # slot identity and by topic, such that connecting and disconnecting does not have to
+        # scan all registered slots
+        self._registered_slots: dict[tuple[Hashable, str], QtThreadSafeCallback] = {}
+        self._slots_by_callable: DefaultDict[Hashable, set[QtThreadSafeCallback]] = (
+            collections.defaultdict(set)
         )
+        self._slots_by_topic: DefaultDict[str, set[QtThreadSafeCallback]] = collections.defaultdict(
+            set
+        )
+        # identities of the slots that only receive the latest message, see suspend_slot
+        self._suspended_slots: set[Hashable] = set()
         self.client = client
 
         if self.client is None:
@@ -172,16 +341,30 @@ class BECDispatcher:
         Args:
             slot (Callable): A slot method/function that accepts two inputs: content and metadata of
                 the corresponding pub/sub message
-            topics (EndpointInfo | str | list): A topic or list of topics that can typically be acquired via bec_lib.MessageEndpoints
+            topics (EndpointInfo | str | list): A topic or list of topics that can typically be acquired via bec_lib.MessageEndpoints.
+                Topics containing "*" wildcards, e.g. MessageEndpoints.service_status("*"), are subscribed to as patterns.
             cb_info (dict | None): A dictionary containing information about the callback. Defaults to None.
         """
-        qt_slot = QtThreadSafeCallback(cb=slot, cb_info=cb_info)
-        if qt_slot not in self._registered_slots:
-            self._registered_slots[qt_slot] = qt_slot
-        qt_slot = self._registered_slots[qt_slot]
-        self.client.connector.register(topics, cb=qt_slot, **kwargs)
+        key = (_slot_identity(slot), repr(cb_info))
+        qt_slot = self._registered_slots.get(key)
+        if qt_slot is not None and qt_slot.cb != slot:
+            # the id of a deleted object has been reused
+            self._remove_slot(qt_slot)
+            qt_slot = None
+        if qt_slot is None:
+            qt_slot = QtThreadSafeCallback(cb=slot, cb_info=cb_info)
+            self._add_slot(key, qt_slot, slot)
+            if key[0] in self._suspended_slots:
+                qt_slot.set_suspended(True)
+        plain, patterns = _split_patterns(topics)
+        if plain:
+            self.client.connector.register(plain, cb=qt_slot, **kwargs)
+        if patterns:
+            self.client.connector.register(patterns=patterns, cb=qt_slot, **kwargs)
         topics_str, _ = self.client.connector._convert_endpointinfo(topics)
-        qt_slot.topics.update(set(topics_str))
+        qt_slot.topics.update(topics_str)
+        for topic in topics_str:
+            self._slots_by_topic[topic].add(qt_slot)
 
     def disconnect_slot(self, slot: Callable, topics: Union[str, list]):
         """
@@ -191,19 +374,17 @@ class BECDispatcher:
             slot(Callable): The slot to disconnect
             topics(Union[str, list]): The topic(s) to disconnect from
         """
-        # find the right slot to disconnect from ;
-        # slot callbacks are wrapped in QtThreadSafeCallback objects,
+        # slot callbacks are wrapped in QtThreadSafeCallback objects, one per cb_info,
         # but the slot we receive here is the original callable
-        for connected_slot in self._registered_slots.values():
-            if connected_slot.cb == slot:
-                break
-        else:
+        connected_slots = self._slots_by_callable.get(_slot_identity(slot))
+        if not connected_slots:
             return
-        self.client.connector.unregister(topics, cb=connected_slot)
         topics_str, _ = self.client.connector._convert_endpointinfo(topics)
-        self._registered_slots[connected_slot].topics.difference_update(set(topics_str))
-        if not self._registered_slots[connected_slot].topics:
-            del self._registered_slots[connected_slot]
+        for connected_slot in list(connected_slots):
+            if connected_slot.cb != slot or connected_slot.topics.isdisjoint(topics_str):
+                continue
+            self._unregister(topics, cb=connected_slot)
+            self._remove_topics(connected_slot, topics_str)
 
     def disconnect_topics(self, topics: Union[str, list]):
         """
@@ -212,18 +393,14 @@ class BECDispatcher:
         Args:
             topics(Union[str, list]): The topic(s) to disconnect from
         """
-        self.client.connector.unregister(topics)
+        self._unregister(topics)
         topics_str, _ = self.client.connector._convert_endpointinfo(topics)
 
-        remove_slots = []
-        for connected_slot in self._registered_slots.values():
-            connected_slot.topics.difference_update(set(topics_str))
-
-            if not connected_slot.topics:
-                remove_slots.append(connected_slot)
-
-        for connected_slot in remove_slots:
-            self._registered_slots.pop(connected_slot, None)
+        connected_slots = set()
+        for topic in topics_str:
+            connected_slots.update(self._slots_by_topic.get(topic, ()))
+        for connected_slot in connected_slots:
+            self._remove_topics(connected_slot, topics_str)
 
     def disconnect_all(self, *args, **kwargs):
         """
@@ -236,6 +413,112 @@ class BECDispatcher:
         # pylint: disable=protected-access
         self.disconnect_topics(self.client.connector._topics_cb)
 
+    def suspend_slot(self, slot: Callable):
+        """
+        Suspend the delivery of messages to a slot, e.g. while its widget is hidden. The
+        subscriptions are kept, but only the latest message per topic is stored instead of
+        calling the slot. The suspension also applies to topics connected later on.
+
+        Args:
+            slot(Callable): The slot to suspend.
+        """
+        identity = _slot_identity(slot)
+        self._suspended_slots.add(identity)
+        for qt_slot in self._slots_by_callable.get(identity, ()):
+            qt_slot.set_suspended(True)
+
+    def resume_slot(self, slot: Callable, catch_up: bool = True):
+        """
+        Resume the delivery of messages to a suspended slot.
+
+        Args:
+            slot(Callable): The slot to resume.
+            catch_up(bool): Call the slot with the latest message per topic received while it
+                was suspended, instead of replaying all of them.
+        """
+        identity = _slot_identity(slot)
+        self._suspended_slots.discard(identity)
+        for qt_slot in list(self._slots_by_callable.get(identity, ())):
+            qt_slot.set_suspended(False, catch_up=catch_up)
+
+    def slot_count(self, topic: str) -> int:
+        """
+        Get the number of slots connected to a topic.
+
+        Args:
+            topic(str): The topic.
+
+        Returns:
+            int: The number of connected slots.
+        """
+        return len(self._slots_by_topic.get(topic, ()))
+
+    def _unregister(self, topics, cb: Callable | None = None):
+        plain, patterns = _split_patterns(topics)
+        if plain:
+            self.client.connector.unregister(plain, cb=cb)
+        if patterns:
+            self.client.connector.unregister(patterns=patterns, cb=cb)
+
+    def _add_slot(self, key: tuple[Hashable, str], qt_slot: QtThreadSafeCallback, slot: Callable):
+        self._registered_slots[key] = qt_slot
+        self._slots_by_callable[key[0]].add(qt_slot)
+        qt_slot.registry_key = key
+        if inspect.ismethod(slot):
+            try:
+                qt_slot._finalizer = weakref.finalize(slot.__self__, self._release_slot, key)
+            except TypeError:
+                # the instance does not support weak references
+                return
+            qt_slot._finalizer.atexit = False
+
+    def _remove_topics(self, qt_slot: QtThreadSafeCallback, topics: list[str]):
+        qt_slot.topics.difference_update(topics)
+        for topic in topics:
+            slots = self._slots_by_topic.get(topic)
+            if slots is None:
+                continue
+            slots.discard(qt_slot)
+            if not slots:
+                del self._slots_by_topic[topic]
+        if not qt_slot.topics:
+            self._remove_slot(qt_slot)
+
+    def _remove_slot(self, qt_slot: QtThreadSafeCallback):
+        key = qt_slot.registry_key
+        if self._registered_slots.get(key) is qt_slot:
+            del self._registered_slots[key]
+        slots = self._slots_by_callable.get(key[0])
+        if slots is not None:
+            slots.discard(qt_slot)
+            if not slots:
+                del self._slots_by_callable[key[0]]
+        for topic in qt_slot.topics:
+            slots = self._slots_by_topic.get(topic)
+            if slots is not None:
+                slots.discard(qt_slot)
+                if not slots:
+                    del self._slots_by_topic[topic]
+        if qt_slot._finalizer is not None:
+            qt_slot._finalizer.detach()
+            qt_slot._finalizer = None
+
+    def _release_slot(self, key: tuple[Hashable, str]):
+        """Unregister the wrapper of a slot whose object has been deleted."""
+        self._suspended_slots.discard(key[0])
+        qt_slot = self._registered_slots.get(key)
+        if qt_slot is None:
+            return
+        topics = list(qt_slot.topics)
+        qt_slot._finalizer = None
+        self._remove_slot(qt_slot)
+        if not topics:
+            return
+        try:
+            self._unregister(topics, cb=qt_slot)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"Failed to unregister the slot of a deleted object: {exc}")
+
     def start_cli_server(self, gui_id: str | None = None):
         """
         Start the CLI server.
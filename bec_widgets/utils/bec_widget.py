@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import darkdetect
 from bec_lib.logger import bec_logger
@@ -10,6 +10,7 @@ from qtpy.QtWidgets import QApplication
 from bec_widgets.cli.rpc.rpc_register import RPCRegister
 from bec_widgets.utils.bec_connector import BECConnector, ConnectionConfig
 from bec_widgets.utils.colors import set_theme
+from bec_widgets.utils.theme_registry import get_theme_registry
 
 if TYPE_CHECKING:  # pragma: no cover
     from bec_widgets.widgets.containers.dock import BECDock
@@ -50,7 +51,8 @@ class BECWidget(BECConnector):
             config(ConnectionConfig, optional): The connection configuration.
             gui_id(str, optional): The GUI ID.
             theme_update(bool, optional): Whether to subscribe to theme updates. Defaults to False. When set to True, the
-                widget's apply_theme method will be called when the theme changes.
+                widget's apply_theme method will be called when the theme changes. The widgets are registered in the
+                theme registry, which spreads the theme change of many widgets over several event-loop iterations.
         """
 
         super().__init__(
@@ -71,11 +73,17 @@ class BECWidget(BECConnector):
             logger.debug(f"Subscribing to theme updates for {self.__class__.__name__}")
             self._connect_to_theme_change()
 
+        # slots that only receive the latest message while the widget is hidden
+        self._suspendable_slots: list[Callable] = []
+        self._suspended = False
+
     def _connect_to_theme_change(self):
-        """Connect to the theme change signal."""
-        qapp = QApplication.instance()
-        if hasattr(qapp, "theme_signal"):
-            qapp.theme_signal.theme_updated.connect(self._update_theme)
+        """Register the widget for theme changes."""
+        get_theme_registry().register(self, BECWidget._apply_registered_theme)
+
+    @staticmethod
+    def _apply_registered_theme(widget: BECWidget, theme: str):
+        widget._update_theme(theme)  # pylint: disable=protected-access
 
     def _update_theme(self, theme: str | None = None):
         """Update the theme."""
@@ -96,8 +104,74 @@ class BECWidget(BECConnector):
             theme(str, optional): The theme to be applied.
         """
 
+    def suspend_when_hidden(self, *slots: Callable):
+        """
+        Register dispatcher slots of high-bandwidth data, e.g. 2D monitors, which are suspended
+        while the widget is hidden. While suspended, the slots are not called; only the latest
+        message per topic is kept and delivered once the widget is shown again.
+
+        Args:
+            *slots(Callable): The slots connected through the BECDispatcher.
+        """
+        self._suspendable_slots.extend(slots)
+        if self._suspended:
+            for slot in slots:
+                self.bec_dispatcher.suspend_slot(slot)
+
+    @property
+    def suspended(self) -> bool:
+        """Whether the widget is suspended because it is hidden."""
+        return self._suspended
+
+    def set_suspended(self, suspended: bool):
+        """
+        Suspend or resume the widget. This is done automatically on hide and show events, e.g.
+        when the widget is in a background tab, a hidden dock or a minimized window.
+
+        Args:
+            suspended(bool): Whether to suspend the widget.
+        """
+        if suspended == self._suspended or self._destroyed:
+            return
+        self._suspended = suspended
+        for slot in self._suspendable_slots:
+            if suspended:
+                self.bec_dispatcher.suspend_slot(slot)
+            else:
+                self.bec_dispatcher.resume_slot(slot)
+        if suspended:
+            self.on_suspend()
+        else:
+            self.on_resume()
+
+    def on_suspend(self):
+        """
+        Called when the widget is hidden. Widgets receiving data outside of the BECDispatcher can
+        override this method to reduce their processing while hidden.
+        """
+
+    def on_resume(self):
+        """
+        Called when the widget is shown again after being hidden. Widgets overriding on_suspend
+        should catch up from their latest data here.
+        """
+
+    def showEvent(self, event):
+        """Resume the widget when it is shown."""
+        super().showEvent(event)  # pylint: disable=no-member
+        self.set_suspended(False)
+
+    def hideEvent(self, event):
+        """Suspend the widget when it is hidden."""
+        super().hideEvent(event)  # pylint: disable=no-member
+        self.set_suspended(True)
+
     def cleanup(self):
         """Cleanup the widget."""
+        for slot in self._suspendable_slots:
+            self.bec_dispatcher.resume_slot(slot, catch_up=False)
+        self._suspendable_slots.clear()
+        get_theme_registry().unregister(self)
         with RPCRegister.delayed_broadcast():
             # All widgets need to call super().cleanup() in their cleanup method
             logger.info(f"Registry cleanup for widget {self.__class__.__name__}")
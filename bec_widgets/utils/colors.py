@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal, NamedTuple
 
 import bec_qthemes
 import numpy as np
 import pyqtgraph as pg
 from bec_qthemes._os_appearance.listener import OSThemeSwitchListener
 from pydantic_core import PydanticCustomError
-from qtpy.QtGui import QColor
+from qtpy.QtGui import QColor, QImage, QPen, QPixmap
 from qtpy.QtWidgets import QApplication
 
+from bec_widgets.utils.theme_registry import get_theme_registry
+
 if TYPE_CHECKING:  # pragma: no cover
     from bec_qthemes._main import AccentColors
 
@@ -40,8 +43,9 @@ def _theme_update_callback():
     app = QApplication.instance()
     # pylint: disable=protected-access
     app.theme.theme = app.os_listener._theme.lower()
+    # the registered widgets are themed through the theme signal
     app.theme_signal.theme_updated.emit(app.theme.theme)
-    apply_theme(app.os_listener._theme.lower())
+    _apply_app_theme(app.os_listener._theme.lower())
 
 
 def set_theme(theme: Literal["dark", "light", "auto"]):
@@ -54,8 +58,9 @@ def set_theme(theme: Literal["dark", "light", "auto"]):
     app = QApplication.instance()
     bec_qthemes.setup_theme(theme, install_event_filter=False)
 
+    # the registered widgets are themed through the theme signal
     app.theme_signal.theme_updated.emit(theme)
-    apply_theme(theme)
+    _apply_app_theme(theme)
 
     if theme != "auto":
         return
@@ -65,73 +70,195 @@ def set_theme(theme: Literal["dark", "light", "auto"]):
         app.installEventFilter(app.os_listener)
 
 
-def apply_theme(theme: Literal["dark", "light"]):
+class ThemeColors(NamedTuple):
+    """Colors and pens of the pyqtgraph widgets for a theme."""
+
+    background: str
+    foreground: str
+    label: str
+    axis: str
+    axis_pen: QPen
+    text_pen: QPen
+
+
+@lru_cache(maxsize=None)
+def get_theme_colors(theme: str) -> ThemeColors:
     """
-    Apply the theme to all pyqtgraph widgets. Do not use this function directly. Use set_theme instead.
+    Get the colors and pens of the pyqtgraph widgets for a theme. The returned pens are shared
+    and must not be modified; pyqtgraph copies pens when they are set.
+
+    Args:
+        theme(str): The name of the theme.
+
+    Returns:
+        ThemeColors: The colors and pens.
     """
-    app = QApplication.instance()
-    graphic_layouts = [
-        child
-        for top in app.topLevelWidgets()
-        for child in top.findChildren(pg.GraphicsLayoutWidget)
-    ]
-
-    plot_items = [
-        item
-        for gl in graphic_layouts
-        for item in gl.ci.items.keys()  # ci is internal pg.GraphicsLayout that hosts all items
-        if isinstance(item, pg.PlotItem)
-    ]
-
-    histograms = [
-        item
-        for gl in graphic_layouts
-        for item in gl.ci.items.keys()  # ci is internal pg.GraphicsLayout that hosts all items
-        if isinstance(item, pg.HistogramLUTItem)
-    ]
-
-    # Update background color based on the theme
     if theme == "light":
-        background_color = "#e9ecef"  # Subtle contrast for light mode
-        foreground_color = "#141414"
-        label_color = "#000000"
-        axis_color = "#666666"
+        background, foreground, label, axis = "#e9ecef", "#141414", "#000000", "#666666"
     else:
-        background_color = "#141414"  # Dark mode
-        foreground_color = "#e9ecef"
-        label_color = "#FFFFFF"
-        axis_color = "#CCCCCC"
-
-    # update GraphicsLayoutWidget
-    pg.setConfigOptions(foreground=foreground_color, background=background_color)
-    for pg_widget in graphic_layouts:
-        pg_widget.setBackground(background_color)
-
-    # update PlotItems
-    for plot_item in plot_items:
-        for axis in ["left", "right", "top", "bottom"]:
-            plot_item.getAxis(axis).setPen(pg.mkPen(color=axis_color))
-            plot_item.getAxis(axis).setTextPen(pg.mkPen(color=label_color))
-
-        # Change title color
-        plot_item.titleLabel.setText(plot_item.titleLabel.text, color=label_color)
-
-        # Change legend color
-        if hasattr(plot_item, "legend") and plot_item.legend is not None:
-            plot_item.legend.setLabelTextColor(label_color)
-            # if legend is in plot item and theme is changed, has to be like that because of pg opt logic
-            for sample, label in plot_item.legend.items:
-                label_text = label.text
-                label.setText(label_text, color=label_color)
-
-    # update HistogramLUTItem
-    for histogram in histograms:
-        histogram.axis.setPen(pg.mkPen(color=axis_color))
-        histogram.axis.setTextPen(pg.mkPen(color=label_color))
-
-    # now define stylesheet according to theme and apply it
-    style = bec_qthemes.load_stylesheet(theme)
-    app.setStyleSheet(style)
+        background, foreground, label, axis = "#141414", "#e9ecef", "#FFFFFF", "#CCCCCC"
+    return ThemeColors(
+        background=background,
+        foreground=foreground,
+        label=label,
+        axis=axis,
+        axis_pen=pg.mkPen(color=axis),
+        text_pen=pg.mkPen(color=label),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet(theme: str) -> str:
+    """
+    Get the stylesheet of a theme. The stylesheet is generated only once per theme.
+
+    Args:
+        theme(str): The name of the theme.
+
+    Returns:
+        str: The stylesheet.
+    """
+    return bec_qthemes.load_stylesheet(theme)
+
+
+def apply_graphics_theme(widget: pg.GraphicsLayoutWidget, theme: str):
+    """
+    Apply the theme colors to a pyqtgraph layout widget and its plot and histogram items.
+
+    Args:
+        widget(pg.GraphicsLayoutWidget): The widget.
+        theme(str): The name of the theme.
+    """
+    colors = get_theme_colors(theme)
+    widget.setBackground(colors.background)
+    # ci is internal pg.GraphicsLayout that hosts all items
+    for item in widget.ci.items.keys():
+        if isinstance(item, pg.PlotItem):
+            for axis in ["left", "right", "top", "bottom"]:
+                item.getAxis(axis).setPen(colors.axis_pen)
+                item.getAxis(axis).setTextPen(colors.text_pen)
+
+            # Change title color
+            item.titleLabel.setText(item.titleLabel.text, color=colors.label)
+
+            # Change legend color
+            if hasattr(item, "legend") and item.legend is not None:
+                item.legend.setLabelTextColor(colors.label)
+                # if legend is in plot item and theme is changed, has to be like that because of pg opt logic
+                for sample, label in item.legend.items:
+                    label.setText(label.text, color=colors.label)
+        elif isinstance(item, pg.HistogramLUTItem):
+            item.axis.setPen(colors.axis_pen)
+            item.axis.setTextPen(colors.text_pen)
+
+
+def _apply_app_theme(theme: str):
+    """
+    Apply the theme to the application: the pyqtgraph defaults, top-level pyqtgraph widgets and
+    the stylesheet. Registered widgets are not themed.
+    """
+    app = QApplication.instance()
+    colors = get_theme_colors(theme)
+    pg.setConfigOptions(foreground=colors.foreground, background=colors.background)
+    for top in app.topLevelWidgets():
+        if isinstance(top, pg.GraphicsLayoutWidget):
+            apply_graphics_theme(top, theme)
+
+    # setting the stylesheet repolishes all widgets, hence skip it if it did not change
+    style = get_stylesheet(theme)
+    if app.styleSheet() != style:
+        app.setStyleSheet(style)
+
+
+def apply_theme(theme: Literal["dark", "light"]):
+    """
+    Apply the theme to the application and to all widgets registered in the theme registry. The
+    registered widgets are themed in chunks on the following event-loop iterations. Do not use
+    this function directly. Use set_theme instead.
+    """
+    _apply_app_theme(theme)
+    get_theme_registry().apply(theme)
+
+
+@lru_cache(maxsize=None)
+def get_colormap(name: str) -> pg.ColorMap:
+    """
+    Get a colormap by name. Colormaps are loaded only once per process, as pg.colormap.get may
+    read them from disk. The returned object is shared and must not be modified.
+
+    Args:
+        name(str): The name of the colormap.
+
+    Returns:
+        pg.ColorMap: The colormap.
+    """
+    return pg.colormap.get(name)
+
+
+@lru_cache(maxsize=256)
+def get_colormap_lut(name: str, start: float = 0.0, stop: float = 1.0) -> np.ndarray:
+    """
+    Get the 256-entry RGB lookup table of a colormap. The returned array is read-only.
+
+    Args:
+        name(str): The name of the colormap.
+        start(float): Position of the colormap at which the table starts, e.g. the minimum
+            position returned by Colors.set_theme_offset.
+        stop(float): Position of the colormap at which the table ends.
+
+    Returns:
+        np.ndarray: Array of shape (256, 3) and dtype uint8.
+    """
+    lut = get_colormap(name).getLookupTable(start=start, stop=stop, nPts=256, alpha=False)
+    lut = np.ascontiguousarray(lut, dtype=np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+@lru_cache(maxsize=256)
+def get_colormap_qcolors(name: str, start: float = 0.0, stop: float = 1.0) -> tuple[QColor, ...]:
+    """
+    Get the lookup table of a colormap as QColors, e.g. to map normalized values to colors
+    with a simple index operation. The returned colors are shared and must not be modified.
+
+    Args:
+        name(str): The name of the colormap.
+        start(float): Position of the colormap at which the table starts.
+        stop(float): Position of the colormap at which the table ends.
+
+    Returns:
+        tuple[QColor, ...]: The 256 colors of the lookup table.
+    """
+    return tuple(QColor(*rgb) for rgb in get_colormap_lut(name, start, stop).tolist())
+
+
+@lru_cache(maxsize=512)
+def get_colormap_preview(name: str, width: int, height: int) -> QPixmap:
+    """
+    Get a horizontal preview of a colormap, e.g. for combobox entries. The returned pixmap is
+    shared and must not be modified.
+
+    Args:
+        name(str): The name of the colormap.
+        width(int): The width of the preview in pixels.
+        height(int): The height of the preview in pixels.
+
+    Returns:
+        QPixmap: The preview.
+    """
+    lut = get_colormap_lut(name)
+    columns = lut[np.linspace(0, len(lut) - 1, width).astype(int)]
+    pixels = np.ascontiguousarray(np.broadcast_to(columns, (height, width, 3)))
+    image = QImage(pixels.data, width, height, 3 * width, QImage.Format_RGB888)
+    # copy the image, as the QImage does not own the numpy buffer
+    return QPixmap.fromImage(image.copy())
+
+
+@lru_cache(maxsize=256)
+def _sample_colormap(name: str, positions: tuple[float, ...]) -> np.ndarray:
+    colors = get_colormap(name).map(np.array(positions), mode="float")
+    colors.flags.writeable = False
+    return colors
 
 
 class Colors:
@@ -216,7 +343,6 @@ class Colors:
         if theme_offset < 0 or theme_offset > 1:
             raise ValueError("theme_offset must be between 0 and 1")
 
-        cmap = pg.colormap.get(colormap)
         min_pos, max_pos = Colors.set_theme_offset(theme, theme_offset)
 
         # Generate positions that are evenly spaced within the acceptable range
@@ -226,7 +352,7 @@ class Colors:
             positions = np.linspace(min_pos, max_pos, num)
 
         # Sample colors from the colormap at the calculated positions
-        colors = cmap.map(positions, mode="float")
+        colors = _sample_colormap(colormap, tuple(positions.tolist()))
         color_list = []
 
         for color in colors:
@@ -264,7 +390,6 @@ class Colors:
             ValueError: If theme_offset is not between 0 and 1.
         """
 
-        cmap = pg.colormap.get(colormap)
         phi = (1 + np.sqrt(5)) / 2  # Golden ratio
         golden_angle_conjugate = 1 - (1 / phi)  # Approximately 0.38196601125
 
@@ -275,7 +400,7 @@ class Colors:
         positions = min_pos + positions * (max_pos - min_pos)
 
         # Sample colors from the colormap at the calculated positions
-        colors = cmap.map(positions, mode="float")
+        colors = _sample_colormap(colormap, tuple(positions.tolist()))
         color_list = []
 
         for color in colors:
@@ -1,7 +1,6 @@
 import time
 from types import SimpleNamespace
 
-from bec_qthemes import material_icon
 from qtpy.QtCore import Property, Qt, Signal
 from qtpy.QtGui import QColor
 from qtpy.QtWidgets import (
@@ -16,6 +15,7 @@ from qtpy.QtWidgets import (
 )
 
 from bec_widgets.utils.colors import get_accent_colors
+from bec_widgets.utils.icon_cache import material_icon
 
 
 class LedLabel(QLabel):
@@ -1,6 +1,30 @@
+from __future__ import annotations
+
+from bec_lib.endpoints import MessageEndpoints
+
+
 class EntryValidator:
-    def __init__(self, devices):
+    """
+    Validate device signal entries against the devices of the BEC session.
+
+    The signal descriptions of the devices and the validated entries are cached by device name
+    and entry. If a dispatcher is given, the cache is invalidated by the device config update
+    messages, otherwise call `invalidate` if the devices change.
+
+    Args:
+        devices: The devices of the device manager.
+        dispatcher(BECDispatcher, optional): The dispatcher to receive device config updates.
+    """
+
+    def __init__(self, devices, dispatcher=None):
         self.devices = devices
+        self._descriptions: dict[str, dict] = {}
+        self._entries: dict[tuple[str, str | None], str] = {}
+        self._dispatcher = dispatcher
+        if dispatcher is not None:
+            dispatcher.connect_slot(
+                self.on_device_config_update, MessageEndpoints.device_config_update()
+            )
 
     def validate_signal(self, name: str, entry: str = None) -> str:
         """
@@ -16,16 +40,27 @@ class EntryValidator:
         if name not in self.devices:
             raise ValueError(f"Device '{name}' not found in current BEC session")
 
+        if entry == "":
+            entry = None
+        key = (name, entry)
+        validated = self._entries.get(key)
+        if validated is not None:
+            return validated
+
         device = self.devices[name]
-        description = device.describe()
+        description = self._descriptions.get(name)
+        if description is None:
+            description = device.describe()
+            self._descriptions[name] = description
 
-        if entry is None or entry == "":
+        if entry is None:
             entry = next(iter(device._hints), name) if hasattr(device, "_hints") else name
         if entry not in description:
             raise ValueError(
                 f"Entry '{entry}' not found in device '{name}' signals. Available signals: {description.keys()}"
             )
 
+        self._entries[key] = entry
         return entry
 
     def validate_monitor(self, monitor: str) -> str:
@@ -42,3 +77,43 @@ class EntryValidator:
             raise ValueError(f"Device '{monitor}' not found in current BEC session")
 
         return monitor
+
+    def invalidate(self, names: list[str] | None = None):
+        """
+        Drop cached signal descriptions and entries.
+
+        Args:
+            names(list[str], optional): Only drop the cache of these devices. Defaults to None,
+                which drops the cache of all devices.
+        """
+        if names is None:
+            self._descriptions.clear()
+            self._entries.clear()
+            return
+        names = set(names)
+        for name in names:
+            self._descriptions.pop(name, None)
+        self._entries = {key: value for key, value in self._entries.items() if key[0] not in names}
+
+    def on_device_config_update(self, msg: dict, metadata: dict):
+        """
+        Invalidate the cache on device config updates. Updates of single devices only drop the
+        cache of these devices, all other actions, e.g. reloading the config, drop the full cache.
+
+        Args:
+            msg(dict): The content of the device config message.
+            metadata(dict): The metadata of the message.
+        """
+        config = msg.get("config")
+        if msg.get("action") == "update" and isinstance(config, dict):
+            self.invalidate(list(config))
+        else:
+            self.invalidate()
+
+    def cleanup(self):
+        """Disconnect from the device config updates."""
+        if self._dispatcher is not None:
+            self._dispatcher.disconnect_slot(
+                self.on_device_config_update, MessageEndpoints.device_config_update()
+            )
+            self._dispatcher = None
@@ -1,11 +1,14 @@
 import functools
 import sys
+import time
 import traceback
 
 from bec_lib.logger import bec_logger
 from qtpy.QtCore import Property, QObject, Qt, Signal, Slot
 from qtpy.QtWidgets import QApplication, QMessageBox, QPushButton, QVBoxLayout, QWidget
 
+from bec_widgets.utils.slot_profiler import get_slot_profiler, slot_name
+
 logger = bec_logger.logger
 
 
@@ -121,6 +124,9 @@ def SafeSlot(*slot_args, **slot_kwargs):  # pylint: disable=invalid-name
 
             _override_slot_params = kwargs.pop("_override_slot_params", {})
             _slot_params.update(_override_slot_params)
+            profiled = get_slot_profiler().enabled
+            outcome = "call"
+            start = time.perf_counter() if profiled else 0.0
             try:
                 if not _slot_params["verify_sender"] or len(args) == 0:
                     return method(*args, **kwargs)
@@ -134,23 +140,54 @@ def SafeSlot(*slot_args, **slot_kwargs):  # pylint: disable=invalid-name
                         f"Sender is None for {method.__module__}.{method.__qualname__}, "
                         "skipping method call."
                     )
+                    outcome = "drop"
                     return
                 return method(*args, **kwargs)
 
             except Exception:
-                slot_name = f"{method.__module__}.{method.__qualname__}"
+                outcome = "error"
+                full_slot_name = f"{method.__module__}.{method.__qualname__}"
                 error_msg = traceback.format_exc()
                 if _slot_params["popup_error"]:
                     ErrorPopupUtility().custom_exception_hook(*sys.exc_info(), popup_error=True)
-                logger.error(f"SafeSlot error in slot '{slot_name}':\n{error_msg}")
+                logger.error(f"SafeSlot error in slot '{full_slot_name}':\n{error_msg}")
                 if _slot_params["raise_error"]:
                     raise
+            finally:
+                if profiled:
+                    _record_slot_call(method, args, time.perf_counter() - start, outcome)
 
         return wrapper
 
     return error_managed
 
 
+def _record_slot_call(method, args: tuple, duration: float, outcome: str):
+    """
+    Record a SafeSlot call in the slot profiler. Deliveries of the BECDispatcher are timed by the
+    dispatcher callback itself, only their errors and drops are recorded here.
+    """
+    profiler = get_slot_profiler()
+    instance = args[0] if args else None
+    if isinstance(instance, QObject):
+        name = slot_name(method.__get__(instance))
+        sender = instance.sender()
+    else:
+        name = slot_name(method)
+        sender = None
+    if getattr(sender, "in_delivery", False):
+        topic = sender.delivery_topic
+        if outcome == "error":
+            profiler.record_error(name, topic)
+        elif outcome == "drop":
+            profiler.record_drop(name, topic)
+        return
+    if outcome == "drop":
+        profiler.record_drop(name, None)
+        return
+    profiler.record_call(name, None, duration, error=outcome == "error")
+
+
 class WarningPopupUtility(QObject):
     """
     Utility class to show warning popups in the application.
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from bec_qthemes import material_icon
 from qtpy.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -13,6 +12,7 @@ from qtpy.QtWidgets import (
 )
 
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.icon_cache import material_icon
 
 
 class ExpandableGroupFrame(QFrame):
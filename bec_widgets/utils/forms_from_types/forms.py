@@ -4,7 +4,6 @@ from decimal import Decimal
 from types import NoneType
 
 from bec_lib.logger import bec_logger
-from bec_qthemes import material_icon
 from pydantic import BaseModel, ValidationError
 from qtpy.QtCore import Signal  # type: ignore
 from qtpy.QtWidgets import QGridLayout, QLabel, QLayout, QVBoxLayout, QWidget
@@ -12,6 +11,7 @@ from qtpy.QtWidgets import QGridLayout, QLabel, QLayout, QVBoxLayout, QWidget
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.compact_popup import CompactPopupWidget
 from bec_widgets.utils.forms_from_types.items import FormItemSpec, widget_from_type
+from bec_widgets.utils.icon_cache import material_icon
 
 logger = bec_logger.logger
 
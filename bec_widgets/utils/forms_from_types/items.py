@@ -6,7 +6,6 @@ from types import UnionType
 from typing import Callable, Protocol
 
 from bec_lib.logger import bec_logger
-from bec_qthemes import material_icon
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.fields import FieldInfo
 from qtpy.QtCore import Signal  # type: ignore
@@ -26,6 +25,7 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 
+from bec_widgets.utils.icon_cache import material_icon
 from bec_widgets.widgets.editors.scan_metadata._util import (
     clearable_required,
     field_default,
@@ -0,0 +1,197 @@
+"""
+Process-wide cache of rendered Material icons.
+
+:func:`material_icon` is a drop-in replacement of ``bec_qthemes.material_icon``. Rendering an
+icon parses its SVG, substitutes the colour and paints it into a pixmap, which adds up for
+widgets that create the same icons over and over again, e.g. the rows of the queue or the
+toolbar actions of every plot. The rendered icons are therefore kept in an LRU cache, keyed by
+all arguments together with the device pixel ratio and the theme, as icons without an explicit
+colour are painted with the text colour of the theme. The cache is cleared when the theme
+changes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Literal
+
+from bec_qthemes import material_icon as _render_material_icon
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QColor, QGuiApplication, QIcon, QPixmap
+
+# maximum number of rendered icons kept in the cache
+MAX_CACHED_ICONS = 1024
+
+
+class IconCache:
+    """
+    LRU cache of rendered icons, counting hits and misses.
+
+    Args:
+        max_size(int): Maximum number of cached icons.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_ICONS):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._icons: OrderedDict[Hashable, QPixmap | QIcon] = OrderedDict()
+        self._theme_signal_connected = False
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    def get(self, key: Hashable) -> QPixmap | QIcon | None:
+        """
+        Get a cached icon and mark it as recently used.
+
+        Args:
+            key(Hashable): The key of the icon.
+
+        Returns:
+            QPixmap | QIcon | None: The icon, None if it is not cached.
+        """
+        icon = self._icons.get(key)
+        if icon is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._icons.move_to_end(key)
+        return icon
+
+    def put(self, key: Hashable, icon: QPixmap | QIcon):
+        """
+        Add an icon to the cache, dropping the least recently used icon if the cache is full.
+
+        Args:
+            key(Hashable): The key of the icon.
+            icon(QPixmap | QIcon): The icon.
+        """
+        self._connect_to_theme_change()
+        self._icons[key] = icon
+        self._icons.move_to_end(key)
+        while len(self._icons) > self.max_size:
+            self._icons.popitem(last=False)
+
+    def clear(self, *_args):
+        """Drop all cached icons. The counters are kept."""
+        self._icons.clear()
+
+    def stats(self) -> dict:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            dict: The number of hits and misses, the number of cached icons and the maximum size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._icons),
+            "max_size": self.max_size,
+        }
+
+    def _connect_to_theme_change(self):
+        if self._theme_signal_connected:
+            return
+        app = QGuiApplication.instance()
+        if not hasattr(app, "theme_signal"):
+            return
+        app.theme_signal.theme_updated.connect(self.clear)
+        self._theme_signal_connected = True
+
+
+_icon_cache = IconCache()
+
+
+def get_icon_cache() -> IconCache:
+    """
+    Get the icon cache of the process.
+
+    Returns:
+        IconCache: The cache.
+    """
+    return _icon_cache
+
+
+def _color_key(color) -> Hashable:
+    if isinstance(color, QColor):
+        return ("rgba", color.rgba())
+    if isinstance(color, dict):
+        return tuple(sorted(color.items()))
+    return color
+
+
+def _icon_key(
+    icon_name: str, size, color, rotate, mode, filled: bool, convert_to_pixmap: bool
+) -> Hashable:
+    if isinstance(size, QSize):
+        size = (size.width(), size.height())
+    elif size is not None:
+        size = tuple(size)
+    app = QGuiApplication.instance()
+    device_pixel_ratio = app.devicePixelRatio() if app is not None else 1.0
+    theme = app.theme.theme if hasattr(app, "theme") else None
+    return (
+        icon_name,
+        size,
+        _color_key(color),
+        filled,
+        device_pixel_ratio,
+        rotate,
+        mode,
+        convert_to_pixmap,
+        theme,
+    )
+
+
+def material_icon(
+    icon_name: str,
+    size: tuple | QSize | None = None,
+    color: str | tuple | QColor | dict[Literal["dark", "light"], str] | None = None,
+    rotate=0,
+    mode=None,
+    filled=False,
+    convert_to_pixmap=True,
+) -> QPixmap | QIcon:
+    """
+    Return a Material icon. Same as ``bec_qthemes.material_icon``, but the icons are rendered
+    only once and then served from the icon cache of the process.
+
+    Args:
+        icon_name(str): The name of the Material icon, see https://fonts.google.com/icons.
+        size(tuple | QSize | None, optional): The size of the icon. Defaults to None.
+        color(str | tuple | QColor | dict | None, optional): The color of the icon. Either a hex
+            string, a tuple of RGB values, a QColor or a dict with a color per theme. Defaults to
+            None, which uses the text color of the theme.
+        rotate(int, optional): The rotation of the icon in degrees. Defaults to 0.
+        mode(QIcon.Mode, optional): The mode of the icon. Defaults to None.
+        filled(bool, optional): Whether to use the filled version of the icon. Defaults to False.
+        convert_to_pixmap(bool, optional): Whether to convert the icon to a QPixmap. Defaults to
+            True.
+
+    Returns:
+        QPixmap | QIcon: The icon. Copies of cached icons share their data, hence they are
+            cheap to create.
+    """
+    try:
+        key = _icon_key(icon_name, size, color, rotate, mode, filled, convert_to_pixmap)
+        hash(key)
+    except TypeError:
+        key = None
+    cached = _icon_cache.get(key) if key is not None else None
+    if cached is None:
+        cached = _render_material_icon(
+            icon_name,
+            size=size,
+            color=color,
+            rotate=rotate,
+            mode=mode,
+            filled=filled,
+            convert_to_pixmap=convert_to_pixmap,
+        )
+        if key is None:
+            return cached
+        _icon_cache.put(key, cached)
+    return QPixmap(cached) if isinstance(cached, QPixmap) else QIcon(cached)
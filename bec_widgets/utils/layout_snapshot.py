@@ -0,0 +1,103 @@
+"""
+Binary snapshots of widget configurations, e.g. the layout of a dock area together with the
+configs of all docks and widgets in it.
+
+A snapshot is a single msgpack blob holding the dumped config and a schema version. Snapshots
+written by the application itself can be restored as trusted, which builds the config models
+with ``model_construct`` instead of validating every field again.
+"""
+
+from __future__ import annotations
+
+import types
+from typing import Any, Union, get_args, get_origin
+
+from bec_lib.serialization import msgpack
+from pydantic import BaseModel
+
+SNAPSHOT_SCHEMA = "bec_widgets.snapshot"
+SNAPSHOT_VERSION = 1
+
+
+def dump_snapshot(config: BaseModel) -> bytes:
+    """
+    Serialize a config into a snapshot.
+
+    Args:
+        config(BaseModel): The config, e.g. the config of a dock area.
+
+    Returns:
+        bytes: The snapshot.
+    """
+    return msgpack.dumps(
+        {"schema": SNAPSHOT_SCHEMA, "version": SNAPSHOT_VERSION, "config": config.model_dump()}
+    )
+
+
+def load_snapshot(data: bytes, model: type[BaseModel], trusted: bool = False) -> BaseModel:
+    """
+    Restore a config from a snapshot.
+
+    Args:
+        data(bytes): The snapshot.
+        model(type[BaseModel]): The model of the config.
+        trusted(bool): Skip the validation of the config, for snapshots written by the
+            application itself.
+
+    Returns:
+        BaseModel: The config.
+    """
+    try:
+        snapshot = msgpack.loads(data)
+    except Exception as exc:  # pylint: disable=broad-except
+        raise ValueError(f"Invalid snapshot: {exc}") from exc
+    if not isinstance(snapshot, dict) or snapshot.get("schema") != SNAPSHOT_SCHEMA:
+        raise ValueError("The data is not a BEC Widgets snapshot.")
+    version = snapshot.get("version")
+    if not isinstance(version, int) or version > SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {version}, the latest supported version is "
+            f"{SNAPSHOT_VERSION}."
+        )
+    config = snapshot.get("config") or {}
+    if trusted:
+        return construct_model(model, config)
+    return model.model_validate(config)
+
+
+def construct_model(model: type[BaseModel], data: dict) -> BaseModel:
+    """
+    Build a model and its nested models from a dumped config without validating it.
+
+    Args:
+        model(type[BaseModel]): The model.
+        data(dict): The dumped config.
+
+    Returns:
+        BaseModel: The model instance.
+    """
+    values = {}
+    for name, value in data.items():
+        field = model.model_fields.get(name)
+        values[name] = value if field is None else _construct_value(field.annotation, value)
+    return model.model_construct(**values)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return construct_model(annotation, value) if isinstance(value, dict) else value
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is dict and len(args) == 2 and isinstance(value, dict):
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+    if origin is list and args and isinstance(value, list):
+        return [_construct_value(args[0], item) for item in value]
+    if origin in (Union, types.UnionType):
+        # optional fields: use the first model of the union that fits the dumped value
+        for arg in args:
+            if arg is type(None):
+                continue
+            constructed = _construct_value(arg, value)
+            if constructed is not value:
+                return constructed
+    return value
@@ -0,0 +1,519 @@
+"""
+Synthetic BEC message load generator and Redis stream recorder/replayer.
+
+The load generator emits realistic scan, device and log messages into Redis at configurable rates
+and payload sizes, such that GUI layouts can be load-tested without a beamline. Any connector can
+be used, e.g. a RedisConnector to a local Redis server or one backed by fakeredis for in-process
+tests. Messages are published on the same endpoints as by the BEC server, hence widgets receive
+them through their regular connect_slot subscriptions.
+
+Real sessions can be recorded to a file and replayed later with the original timing, sped up or
+as fast as possible.
+
+Examples:
+    Emit scan data with 10 points per second, 512x512 detector frames at 5 Hz and log messages::
+
+        bw-load-generator generate --stream scan:10 --stream device_monitor_2d:5:512 \\
+            --stream log:2 --duration 60
+
+    Record the scan segments and the readback of samx and replay them twice as fast::
+
+        bw-load-generator record --endpoint scan_segment --endpoint device_readback:samx \\
+            --output session.jsonl --duration 60
+        bw-load-generator replay session.jsonl --speed 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import heapq
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+from bec_lib import messages
+from bec_lib.endpoints import EndpointInfo, MessageEndpoints, MessageOp
+from bec_lib.logger import bec_logger
+from bec_lib.redis_connector import MessageObject, RedisConnector
+from bec_lib.serialization import MsgpackSerialization
+
+logger = bec_logger.logger
+
+MESSAGE_KINDS = (
+    "scan",
+    "device_readback",
+    "device_async_readback",
+    "device_monitor_1d",
+    "device_monitor_2d",
+    "log",
+)
+DEFAULT_DEVICES = {
+    "scan": "samx",
+    "device_readback": "samx",
+    "device_async_readback": "async_device",
+    "device_monitor_1d": "waveform1d",
+    "device_monitor_2d": "eiger",
+    "log": "load_generator",
+}
+SCAN_MONITORS = ("bpm4i", "bpm3a", "bpm3i", "gauss_bpm", "gauss_adc1", "gauss_adc2", "gauss_adc3")
+STREAM_MAX_SIZE = 100
+RECORDING_FORMAT = "bec_widgets_recording"
+RECORDING_VERSION = 1
+
+
+@dataclass
+class StreamConfig:
+    """
+    Configuration of one synthetic message stream.
+
+    Args:
+        kind(str): The kind of messages, one of MESSAGE_KINDS. 'scan' emits the scan status at
+            the start and the end of every scan and one scan segment per point.
+        rate(float): Messages per second.
+        size(int): Payload size: number of monitored devices for 'scan', number of points for
+            'device_async_readback' and 'device_monitor_1d', side length of the frame for
+            'device_monitor_2d'. Ignored for 'device_readback' and 'log'.
+        device(str, optional): The device publishing the messages. For 'scan', the scan motor.
+    """
+
+    kind: str
+    rate: float
+    size: int = 1
+    device: str | None = None
+
+    def __post_init__(self):
+        if self.kind not in MESSAGE_KINDS:
+            raise ValueError(f"Unknown message kind {self.kind}, use one of {MESSAGE_KINDS}.")
+        if self.rate <= 0:
+            raise ValueError(f"The rate of a stream must be positive, got {self.rate}.")
+        if self.device is None:
+            self.device = DEFAULT_DEVICES[self.kind]
+
+    @classmethod
+    def from_string(cls, spec: str) -> StreamConfig:
+        """
+        Create a stream config from a string of the form 'kind:rate[:size[:device]]'.
+
+        Args:
+            spec(str): The stream specification, e.g. 'device_monitor_2d:5:512:eiger'.
+
+        Returns:
+            StreamConfig: The stream config.
+        """
+        parts = spec.split(":")
+        if not 2 <= len(parts) <= 4:
+            raise ValueError(f"Invalid stream specification {spec}, use kind:rate[:size[:device]].")
+        size = int(parts[2]) if len(parts) > 2 else 1
+        device = parts[3] if len(parts) > 3 else None
+        return cls(kind=parts[0], rate=float(parts[1]), size=size, device=device)
+
+
+def message_op(endpoint: EndpointInfo) -> str:
+    """
+    Get the name of the connector method used to publish on an endpoint.
+
+    Args:
+        endpoint(EndpointInfo): The endpoint.
+
+    Returns:
+        str: 'xadd', 'set_and_publish' or 'send'.
+    """
+    if endpoint.message_op == MessageOp.STREAM:
+        return "xadd"
+    if endpoint.message_op == MessageOp.SET_PUBLISH:
+        return "set_and_publish"
+    return "send"
+
+
+def publish(connector: RedisConnector, topic: EndpointInfo | str, msg, op: str):
+    """
+    Publish a message the way BEC services publish on the endpoint.
+
+    Args:
+        connector(RedisConnector): The connector to publish with.
+        topic(EndpointInfo|str): The endpoint or its name.
+        msg(BECMessage): The message.
+        op(str): The connector method, see message_op.
+    """
+    if op == "xadd":
+        connector.xadd(topic, {"data": msg}, max_size=STREAM_MAX_SIZE)
+    elif op == "set_and_publish":
+        connector.set_and_publish(topic, msg)
+    else:
+        connector.send(topic, msg)
+
+
+class _ScanState:
+    """Scan shared by all streams of a load generator."""
+
+    def __init__(self, points: int):
+        self.points = points
+        self.scan_number = 0
+        self.scan_id = str(uuid.uuid4())
+        self.point_id = 0
+
+
+class LoadGenerator:
+    """
+    Generator of synthetic BEC messages.
+
+    Args:
+        connector(RedisConnector): The connector to publish with.
+        streams(list[StreamConfig]): The message streams to emit.
+        scan_points(int): Number of points per scan of 'scan' streams.
+        seed(int, optional): Seed of the random payloads.
+    """
+
+    def __init__(
+        self,
+        connector: RedisConnector,
+        streams: list[StreamConfig],
+        scan_points: int = 100,
+        seed: int | None = None,
+    ):
+        self.connector = connector
+        self.streams = streams
+        self.scan = _ScanState(scan_points)
+        self._rng = np.random.default_rng(seed)
+
+    def schedule(self, duration: float) -> Iterator[tuple[float, EndpointInfo, object]]:
+        """
+        Iterate over the messages of all streams in the order in which they are due.
+
+        Args:
+            duration(float): Length of the schedule in seconds.
+
+        Yields:
+            tuple[float, EndpointInfo, BECMessage]: Due time relative to the start, endpoint
+                and message.
+        """
+        queue = [(0.0, index, 0) for index in range(len(self.streams))]
+        heapq.heapify(queue)
+        while queue:
+            due, index, count = heapq.heappop(queue)
+            if due >= duration:
+                continue
+            stream = self.streams[index]
+            for endpoint, msg in self._make_messages(stream, count):
+                yield due, endpoint, msg
+            heapq.heappush(queue, ((count + 1) / stream.rate, index, count + 1))
+
+    def run(self, duration: float, speed: float = 1.0, stop_event: threading.Event | None = None):
+        """
+        Publish the messages of all streams.
+
+        Args:
+            duration(float): Length of the schedule in seconds.
+            speed(float): Speed-up of the schedule. 0 publishes as fast as possible.
+            stop_event(threading.Event, optional): Event to stop the generator early.
+
+        Returns:
+            int: The number of messages published.
+        """
+        start = time.perf_counter()
+        sent = 0
+        for due, endpoint, msg in self.schedule(duration):
+            if stop_event is not None and stop_event.is_set():
+                break
+            _wait_until(start, due, speed)
+            publish(self.connector, endpoint, msg, message_op(endpoint))
+            sent += 1
+        return sent
+
+    def _make_messages(self, stream: StreamConfig, count: int) -> list[tuple[EndpointInfo, object]]:
+        now = time.time()
+        if stream.kind == "scan":
+            return self._scan_messages(stream, now)
+        if stream.kind == "device_readback":
+            msg = messages.DeviceMessage(
+                signals={stream.device: {"value": float(self._rng.normal()), "timestamp": now}},
+                metadata={"stream": "primary"},
+            )
+            return [(MessageEndpoints.device_readback(stream.device), msg)]
+        if stream.kind == "device_async_readback":
+            msg = messages.DeviceMessage(
+                signals={stream.device: {"value": self._rng.random(stream.size), "timestamp": now}},
+                metadata={"async_update": {"type": "add", "max_shape": [None]}},
+            )
+            endpoint = MessageEndpoints.device_async_readback(self.scan.scan_id, stream.device)
+            return [(endpoint, msg)]
+        if stream.kind == "device_monitor_1d":
+            msg = messages.DeviceMonitor1DMessage(
+                device=stream.device,
+                data=self._rng.random(stream.size),
+                metadata={"scan_id": self.scan.scan_id},
+            )
+            return [(MessageEndpoints.device_monitor_1d(stream.device), msg)]
+        if stream.kind == "device_monitor_2d":
+            msg = messages.DeviceMonitor2DMessage(
+                device=stream.device,
+                data=self._rng.random((stream.size, stream.size)),
+                metadata={"scan_id": self.scan.scan_id},
+            )
+            return [(MessageEndpoints.device_monitor_2d(stream.device), msg)]
+        msg = messages.LogMessage(
+            log_type="info",
+            log_msg={
+                "text": f"synthetic log message {count}",
+                "record": {"time": {"timestamp": now}},
+                "service_name": stream.device,
+            },
+        )
+        return [(MessageEndpoints.log(), msg)]
+
+    def _scan_messages(self, stream: StreamConfig, now: float) -> list[tuple[EndpointInfo, object]]:
+        scan = self.scan
+        out = []
+        if scan.point_id == 0:
+            out.append((MessageEndpoints.scan_status(), self._scan_status(stream, "open")))
+        data = {stream.device: {stream.device: {"value": float(scan.point_id), "timestamp": now}}}
+        for name in SCAN_MONITORS[: max(stream.size, 1)]:
+            data[name] = {name: {"value": float(self._rng.normal()), "timestamp": now}}
+        msg = messages.ScanMessage(
+            point_id=scan.point_id,
+            scan_id=scan.scan_id,
+            data=data,
+            metadata={"scan_id": scan.scan_id, "scan_number": scan.scan_number},
+        )
+        out.append((MessageEndpoints.scan_segment(), msg))
+        scan.point_id += 1
+        if scan.point_id >= scan.points:
+            out.append((MessageEndpoints.scan_status(), self._scan_status(stream, "closed")))
+            scan.scan_number += 1
+            scan.scan_id = str(uuid.uuid4())
+            scan.point_id = 0
+        return out
+
+    def _scan_status(self, stream: StreamConfig, status: str):
+        scan = self.scan
+        monitors = list(SCAN_MONITORS[: max(stream.size, 1)])
+        return messages.ScanStatusMessage(
+            scan_id=scan.scan_id,
+            status=status,
+            scan_number=scan.scan_number,
+            num_points=scan.points,
+            scan_name="line_scan",
+            scan_type="step",
+            scan_report_devices=[stream.device],
+            readout_priority={"monitored": [stream.device, *monitors], "async": []},
+            info={
+                "scan_number": scan.scan_number,
+                "num_points": scan.points,
+                "scan_report_devices": [stream.device],
+                "readout_priority": {"monitored": [stream.device, *monitors], "async": []},
+            },
+        )
+
+
+def _wait_until(start: float, due: float, speed: float):
+    if speed <= 0:
+        return
+    delay = start + due / speed - time.perf_counter()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def endpoint_from_string(spec: str) -> EndpointInfo:
+    """
+    Get an endpoint from a string of the form 'name[:arg[:arg...]]', where name is the name of
+    a MessageEndpoints method, e.g. 'device_readback:samx'.
+
+    Args:
+        spec(str): The endpoint specification.
+
+    Returns:
+        EndpointInfo: The endpoint.
+    """
+    name, *args = spec.split(":")
+    method = getattr(MessageEndpoints, name, None)
+    if method is None or name.startswith("_"):
+        raise ValueError(f"Unknown endpoint {name}.")
+    return method(*args)
+
+
+class StreamRecorder:
+    """
+    Recorder of the messages published on a set of endpoints. Every message is stored as one
+    json line with its arrival time, topic, publishing method and msgpack payload.
+
+    Args:
+        connector(RedisConnector): The connector to subscribe with.
+        endpoints(list[EndpointInfo]): The endpoints to record.
+    """
+
+    def __init__(self, connector: RedisConnector, endpoints: list[EndpointInfo]):
+        self.connector = connector
+        self.endpoints = endpoints
+        self.records: list[dict] = []
+        self._lock = threading.Lock()
+        self._start: float | None = None
+
+    def start(self):
+        """Subscribe to the endpoints and start recording."""
+        self._start = time.time()
+        for endpoint in self.endpoints:
+            self.connector.register(
+                endpoint, cb=self._on_message, topic=endpoint.endpoint, op=message_op(endpoint)
+            )
+
+    def stop(self):
+        """Unsubscribe from the endpoints."""
+        for endpoint in self.endpoints:
+            self.connector.unregister(endpoint, cb=self._on_message)
+
+    def _on_message(self, msg, topic: str, op: str):
+        if isinstance(msg, MessageObject):
+            msg = msg.value
+        elif isinstance(msg, dict):
+            msg = msg["data"]
+        record = {
+            "t": time.time() - self._start,
+            "topic": topic,
+            "op": op,
+            "msg": base64.b64encode(MsgpackSerialization.dumps(msg)).decode(),
+        }
+        with self._lock:
+            self.records.append(record)
+
+    def save(self, path: str):
+        """
+        Write the recorded messages to a file.
+
+        Args:
+            path(str): The file to write.
+        """
+        with self._lock:
+            records = sorted(self.records, key=lambda record: record["t"])
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(json.dumps({"format": RECORDING_FORMAT, "version": RECORDING_VERSION}))
+            file.write("\n")
+            for record in records:
+                file.write(json.dumps(record))
+                file.write("\n")
+
+
+def load_recording(path: str) -> list[tuple[float, str, str, object]]:
+    """
+    Load a recording written by StreamRecorder.
+
+    Args:
+        path(str): The recording.
+
+    Returns:
+        list[tuple[float, str, str, BECMessage]]: Time, topic, publishing method and message
+            of every recorded message.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        header = json.loads(file.readline() or "{}")
+        if header.get("format") != RECORDING_FORMAT:
+            raise ValueError(f"{path} is not a BEC widgets recording.")
+        records = []
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            msg = MsgpackSerialization.loads(base64.b64decode(record["msg"]))
+            records.append((record["t"], record["topic"], record["op"], msg))
+    return records
+
+
+def replay(
+    connector: RedisConnector,
+    records: list[tuple[float, str, str, object]],
+    speed: float = 1.0,
+    stop_event: threading.Event | None = None,
+) -> int:
+    """
+    Publish recorded messages again.
+
+    Args:
+        connector(RedisConnector): The connector to publish with.
+        records(list): The records, see load_recording.
+        speed(float): Speed-up of the original timing. 0 publishes as fast as possible.
+        stop_event(threading.Event, optional): Event to stop the replay early.
+
+    Returns:
+        int: The number of messages published.
+    """
+    start = time.perf_counter()
+    sent = 0
+    for due, topic, op, msg in records:
+        if stop_event is not None and stop_event.is_set():
+            break
+        _wait_until(start, due, speed)
+        publish(connector, topic, msg, op)
+        sent += 1
+    return sent
+
+
+def main(argv: list[str] | None = None):
+    """Command line interface of the load generator."""
+    parser = argparse.ArgumentParser(
+        description="Emit synthetic BEC messages or record and replay Redis streams."
+    )
+    parser.add_argument("--redis", default="localhost:6379", help="Redis server, host:port")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="Emit synthetic messages")
+    generate_parser.add_argument(
+        "--stream",
+        action="append",
+        required=True,
+        help=f"kind:rate[:size[:device]], kind is one of {', '.join(MESSAGE_KINDS)}",
+    )
+    generate_parser.add_argument("--duration", type=float, default=60, help="Duration in s")
+    generate_parser.add_argument("--scan-points", type=int, default=100, help="Points per scan")
+    generate_parser.add_argument("--seed", type=int, default=None, help="Random seed")
+
+    record_parser = commands.add_parser("record", help="Record messages to a file")
+    record_parser.add_argument(
+        "--endpoint",
+        action="append",
+        required=True,
+        help="MessageEndpoints method and arguments, e.g. device_readback:samx",
+    )
+    record_parser.add_argument("--output", required=True, help="Recording file")
+    record_parser.add_argument("--duration", type=float, default=60, help="Duration in s")
+
+    replay_parser = commands.add_parser("replay", help="Replay a recording")
+    replay_parser.add_argument("recording", help="Recording file")
+    replay_parser.add_argument(
+        "--speed", type=float, default=1.0, help="Speed-up, 0 for as fast as possible"
+    )
+
+    args = parser.parse_args(argv)
+    connector = RedisConnector(args.redis)
+    try:
+        if args.command == "generate":
+            streams = [StreamConfig.from_string(spec) for spec in args.stream]
+            generator = LoadGenerator(
+                connector, streams, scan_points=args.scan_points, seed=args.seed
+            )
+            sent = generator.run(args.duration)
+            logger.info(f"Published {sent} synthetic messages")
+        elif args.command == "record":
+            recorder = StreamRecorder(
+                connector, [endpoint_from_string(spec) for spec in args.endpoint]
+            )
+            recorder.start()
+            try:
+                time.sleep(args.duration)
+            except KeyboardInterrupt:
+                pass
+            recorder.stop()
+            recorder.save(args.output)
+            logger.info(f"Recorded {len(recorder.records)} messages to {args.output}")
+        else:
+            sent = replay(connector, load_recording(args.recording), speed=args.speed)
+            logger.info(f"Replayed {sent} messages")
+    finally:
+        connector.shutdown()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
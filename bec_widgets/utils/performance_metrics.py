@@ -0,0 +1,278 @@
+"""
+Cheap runtime metrics of the GUI process, as shown by the PerformanceDashboard.
+
+The metrics are meant to be collected continuously, e.g. during a whole beamtime, hence all of
+them are either counters that are read out periodically or values that can be read at almost
+no cost:
+
+- MessageRateMeter counts the messages delivered by the BECDispatcher per topic. Counting is
+  only active while somebody is interested in the rates, otherwise it costs a single attribute
+  check per delivery.
+- EventLoopLagMonitor measures how late a heartbeat timer fires, i.e. for how long the event
+  loop of the GUI thread was blocked.
+- process_memory and plot_buffers report the memory of the process and of the plotted data.
+- RollingSeries is a fixed-size ring buffer for the history of a metric.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+import pyqtgraph as pg
+from qtpy.QtCore import QObject, Qt, QTimer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # not available on Windows
+    resource = None
+
+
+class RollingSeries:
+    """
+    Fixed-size history of a metric. Appending overwrites the oldest value and never allocates.
+
+    Args:
+        size(int): Number of values to keep.
+    """
+
+    def __init__(self, size: int):
+        self._data = np.full(size, np.nan)
+        self._index = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """Maximum number of values kept."""
+        return len(self._data)
+
+    def append(self, value: float | None):
+        """
+        Append a value, replacing the oldest one if the series is full.
+
+        Args:
+            value(float | None): The value. None is stored as NaN, i.e. as a gap in the plot.
+        """
+        self._data[self._index] = np.nan if value is None else value
+        self._index = (self._index + 1) % len(self._data)
+        self._count = min(self._count + 1, len(self._data))
+
+    def values(self) -> np.ndarray:
+        """
+        Get the stored values, oldest first.
+
+        Returns:
+            np.ndarray: A copy of the values.
+        """
+        if self._count < len(self._data):
+            return self._data[: self._count].copy()
+        return np.concatenate((self._data[self._index :], self._data[: self._index]))
+
+    def last(self) -> float | None:
+        """
+        Get the most recent value.
+
+        Returns:
+            float | None: The value, None if the series is empty.
+        """
+        if not self._count:
+            return None
+        value = self._data[self._index - 1]
+        return None if np.isnan(value) else float(value)
+
+
+class MessageRateMeter:
+    """
+    Counter of the messages delivered by the BECDispatcher per topic. Deliveries happen on the
+    Redis listener threads, hence the counter is guarded by a lock.
+
+    Counting is reference counted through :meth:`acquire` and :meth:`release`, such that several
+    dashboards can use the meter at the same time.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._users = 0
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._last_read = time.perf_counter()
+
+    def acquire(self):
+        """Start counting, if not already done for another user."""
+        with self._lock:
+            self._users += 1
+            if not self.enabled:
+                self._counts.clear()
+                self._last_read = time.perf_counter()
+            self.enabled = True
+
+    def release(self):
+        """Stop counting once the last user released the meter."""
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            self.enabled = self._users > 0
+
+    def count(self, topic: str | None):
+        """
+        Count a delivery.
+
+        Args:
+            topic(str | None): The topic of the message.
+        """
+        with self._lock:
+            self._counts[topic or "<unknown>"] += 1
+
+    def rates(self) -> dict[str, float]:
+        """
+        Get the delivery rates since the last call and reset the counters.
+
+        Returns:
+            dict[str, float]: Deliveries per second per topic.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            counts = self._counts
+            self._counts = Counter()
+            elapsed = now - self._last_read
+            self._last_read = now
+        if elapsed <= 0:
+            return {}
+        return {topic: count / elapsed for topic, count in counts.items()}
+
+
+_message_rate_meter = MessageRateMeter()
+
+
+def get_message_rate_meter() -> MessageRateMeter:
+    """
+    Get the message rate meter of the process.
+
+    Returns:
+        MessageRateMeter: The meter.
+    """
+    return _message_rate_meter
+
+
+class EventLoopLagMonitor(QObject):
+    """
+    Measure the responsiveness of the GUI thread with a heartbeat timer. Every time the timer
+    fires, the delay with respect to the expected time is recorded; a blocked event loop shows
+    up as a large delay.
+
+    Args:
+        interval(int): Interval of the heartbeat in milliseconds.
+        parent(QObject, optional): The parent object.
+    """
+
+    def __init__(self, interval: int = 50, parent: QObject | None = None):
+        super().__init__(parent)
+        self.interval = interval
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+        self._beats = 0
+        self._last_beat = time.perf_counter()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_heartbeat)
+
+    def start(self):
+        """Start the heartbeat."""
+        self._last_beat = time.perf_counter()
+        self._timer.start(self.interval)
+
+    def stop(self):
+        """Stop the heartbeat."""
+        self._timer.stop()
+
+    def _on_heartbeat(self):
+        now = time.perf_counter()
+        lag = max(now - self._last_beat - self.interval / 1e3, 0.0)
+        self._last_beat = now
+        self._max_lag = max(self._max_lag, lag)
+        self._total_lag += lag
+        self._beats += 1
+
+    def take(self) -> tuple[float, float]:
+        """
+        Get the lag of the event loop since the last call and reset the statistics. A heartbeat
+        that is still pending counts as well, such that a loop that is blocked right now is
+        reported even though the timer could not fire yet.
+
+        Returns:
+            tuple[float, float]: The maximum and the mean lag in milliseconds.
+        """
+        pending = max(time.perf_counter() - self._last_beat - self.interval / 1e3, 0.0)
+        max_lag = max(self._max_lag, pending)
+        mean_lag = self._total_lag / self._beats if self._beats else pending
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+        self._beats = 0
+        return max_lag * 1e3, mean_lag * 1e3
+
+
+def process_memory() -> dict[str, int | None]:
+    """
+    Get the memory used by the process.
+
+    Returns:
+        dict[str, int | None]: 'rss' is the resident set size in bytes. 'heap' is the memory
+            allocated by Python in bytes, only available while tracemalloc is tracing.
+            'allocated_blocks' is the number of memory blocks allocated by Python.
+    """
+    return {
+        "rss": _resident_set_size(),
+        "heap": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+        "allocated_blocks": sys.getallocatedblocks(),
+    }
+
+
+def _resident_set_size() -> int | None:
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:  # pragma: no cover
+        return None
+    # fall back to the peak usage, which is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def plot_buffers(plot_items: Iterable[pg.PlotItem]) -> dict[str, int]:
+    """
+    Count the curves and images of the given plot items and the memory of their data.
+
+    Args:
+        plot_items(Iterable[pg.PlotItem]): The plot items.
+
+    Returns:
+        dict[str, int]: The number of 'curves' and 'images', and their data size in 'bytes'.
+    """
+    curves = images = size = 0
+    for plot_item in plot_items:
+        for item in plot_item.items:
+            if isinstance(item, pg.PlotDataItem):
+                curves += 1
+                size += _nbytes(item.xData) + _nbytes(item.yData)
+            elif isinstance(item, pg.ImageItem):
+                images += 1
+                size += _nbytes(item.image)
+                raw_data = getattr(item, "raw_data", None)
+                if raw_data is not item.image:
+                    size += _nbytes(raw_data)
+    return {"curves": curves, "images": images, "bytes": size}
+
+
+def _nbytes(data) -> int:
+    return getattr(data, "nbytes", 0) if data is not None else 0
@@ -0,0 +1,290 @@
+"""
+Central scheduler for data-driven repaints.
+
+Widgets receiving data from the BECDispatcher should not repaint inside the slot, as a burst of
+messages would then cause several paints of the same widget per frame. Instead, a widget stores
+the latest data and marks itself dirty with :meth:`RenderScheduler.schedule`; the scheduler
+calls the update callback once per frame with whatever data is the latest at that point.
+
+The frame rate is capped by the refresh rate of the screen and by a configurable maximum (the
+BEC_WIDGETS_MAX_FPS environment variable or :attr:`RenderScheduler.max_fps`). Updates of widgets
+that are currently not visible, e.g. in a hidden tab, a collapsed dock area or a minimized
+window, are kept pending without being applied until the widget becomes visible again. Visible
+widgets of the active window are updated first, and the updates of a frame are spread over the
+following frames if they exceed the frame budget.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+import time
+import weakref
+from collections.abc import Callable, Hashable
+
+from bec_lib.logger import bec_logger
+from qtpy.QtCore import QObject, Qt, QTimer
+from qtpy.QtGui import QGuiApplication
+from qtpy.QtWidgets import QApplication, QWidget
+
+logger = bec_logger.logger
+
+MAX_FPS_ENV = "BEC_WIDGETS_MAX_FPS"
+DEFAULT_MAX_FPS = 30
+# interval in which widgets with pending updates are checked for becoming visible again
+HIDDEN_POLL_INTERVAL = 250
+# fraction of the frame interval which may be spent on applying updates
+FRAME_BUDGET = 0.75
+
+
+class _PendingUpdate:
+    """
+    Latest update callback of one widget and key. Bound methods are only referenced weakly,
+    such that pending updates do not keep hidden widgets alive.
+    """
+
+    __slots__ = ("owner", "_callback")
+
+    def __init__(self, owner: weakref.ref, callback: Callable[[], None]):
+        self.owner = owner
+        self.callback = callback
+
+    @property
+    def callback(self) -> Callable[[], None] | None:
+        """The update callback, None if its object has been deleted."""
+        if isinstance(self._callback, weakref.WeakMethod):
+            return self._callback()
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback: Callable[[], None]):
+        self._callback = weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback
+
+
+def is_rendered(widget: QWidget) -> bool:
+    """
+    Check whether a widget is currently shown on screen, i.e. it is visible, not collapsed to
+    zero size and its window is not minimized.
+
+    Args:
+        widget(QWidget): The widget.
+
+    Returns:
+        bool: True if the widget is shown.
+    """
+    if not widget.isVisible() or widget.width() <= 0 or widget.height() <= 0:
+        return False
+    return not widget.window().windowState() & Qt.WindowState.WindowMinimized
+
+
+class RenderScheduler(QObject):
+    """
+    Coalesce the repaints of data-driven widgets into one update per widget and frame.
+
+    Args:
+        max_fps(float): Maximum number of frames per second. Values <= 0 disable the scheduler,
+            i.e. updates are applied immediately.
+        parent(QObject, optional): The parent object.
+    """
+
+    def __init__(self, max_fps: float = DEFAULT_MAX_FPS, parent: QObject | None = None):
+        super().__init__(parent)
+        self._pending: dict[tuple[int, Hashable], _PendingUpdate] = {}
+        self._max_fps = max_fps
+        self._paused = False
+        self._polling_hidden = False
+        self.immediate = False
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def max_fps(self) -> float:
+        """Maximum number of frames per second."""
+        return self._max_fps
+
+    @max_fps.setter
+    def max_fps(self, value: float):
+        self._max_fps = value
+        if value <= 0:
+            self.flush()
+        elif self._timer.isActive() and not self._polling_hidden:
+            self._timer.setInterval(self.frame_interval)
+
+    @property
+    def frame_interval(self) -> int:
+        """Interval between two frames in milliseconds, limited by the screen refresh rate."""
+        fps = self._max_fps
+        screen = QGuiApplication.primaryScreen() if QApplication.instance() else None
+        if screen is not None and screen.refreshRate() > 0:
+            fps = min(fps, screen.refreshRate())
+        return max(int(1000 / fps), 1)
+
+    @property
+    def paused(self) -> bool:
+        """Whether applying updates is paused."""
+        return self._paused
+
+    def pause(self):
+        """Stop applying updates. Scheduled updates are kept until resume is called."""
+        self._paused = True
+        self._timer.stop()
+
+    def resume(self):
+        """Resume applying updates."""
+        self._paused = False
+        if self._pending:
+            self._start_frames()
+
+    def schedule(self, owner: QWidget, key: Hashable, callback: Callable[[], None]):
+        """
+        Mark a widget as dirty. The callback is called once on the next frame in which the widget
+        is visible; if the same key is scheduled again before that, only the latest callback is
+        called.
+
+        Args:
+            owner(QWidget): The widget whose visibility decides when to apply the update.
+            key(Hashable): Identifies the update within the widget, e.g. the name of a curve.
+            callback(Callable[[], None]): Applies the latest state of the widget.
+        """
+        if self.immediate or self._max_fps <= 0:
+            callback()
+            return
+        entry_key = (id(owner), key)
+        entry = self._pending.get(entry_key)
+        if entry is not None and entry.owner() is owner:
+            # keep the position in the queue, such that starved updates stay in front
+            entry.callback = callback
+        else:
+            self._pending[entry_key] = _PendingUpdate(weakref.ref(owner), callback)
+        if self._paused:
+            return
+        if not self._timer.isActive() or (self._polling_hidden and is_rendered(owner)):
+            self._start_frames()
+
+    def is_pending(self, owner: QWidget, key: Hashable | None = None) -> bool:
+        """
+        Check whether updates of a widget are pending.
+
+        Args:
+            owner(QWidget): The widget.
+            key(Hashable, optional): Only check the update with this key.
+
+        Returns:
+            bool: True if an update is pending.
+        """
+        if key is not None:
+            return (id(owner), key) in self._pending
+        return any(entry_key[0] == id(owner) for entry_key in self._pending)
+
+    def cancel(self, owner: QWidget, key: Hashable | None = None):
+        """
+        Drop pending updates of a widget, e.g. when it is deleted.
+
+        Args:
+            owner(QWidget): The widget.
+            key(Hashable, optional): Only drop the update with this key. Defaults to None, which
+                drops all updates of the widget.
+        """
+        if key is not None:
+            self._pending.pop((id(owner), key), None)
+            return
+        for entry_key in [entry_key for entry_key in self._pending if entry_key[0] == id(owner)]:
+            del self._pending[entry_key]
+
+    def clear(self):
+        """Drop all pending updates."""
+        self._pending.clear()
+        self._timer.stop()
+
+    def flush(self, owner: QWidget | None = None):
+        """
+        Apply pending updates right away, regardless of the visibility of the widgets.
+
+        Args:
+            owner(QWidget, optional): Only apply the updates of this widget. Defaults to None,
+                which applies all pending updates.
+        """
+        for entry_key in list(self._pending):
+            if owner is not None and entry_key[0] != id(owner):
+                continue
+            entry = self._pending.pop(entry_key, None)
+            if entry is not None and entry.owner() is not None:
+                self._apply(entry)
+
+    def _start_frames(self):
+        self._polling_hidden = False
+        self._timer.start(self.frame_interval)
+
+    def _tick(self):
+        if self._paused:
+            self._timer.stop()
+            return
+        active_window = QApplication.activeWindow()
+        visible, active = [], []
+        for entry_key, entry in list(self._pending.items()):
+            owner = entry.owner()
+            try:
+                if owner is None or entry.callback is None or not self._is_alive(owner):
+                    del self._pending[entry_key]
+                    continue
+                if not is_rendered(owner):
+                    continue
+                in_active_window = owner.window() is active_window
+            except RuntimeError:
+                # the widget has been deleted
+                del self._pending[entry_key]
+                continue
+            (active if in_active_window else visible).append(entry_key)
+
+        deadline = time.perf_counter() + self.frame_interval / 1e3 * FRAME_BUDGET
+        for entry_key in active + visible:
+            entry = self._pending.pop(entry_key)
+            self._apply(entry)
+            if time.perf_counter() > deadline:
+                break
+
+        if not self._pending:
+            self._timer.stop()
+        elif not any(entry_key in self._pending for entry_key in active + visible):
+            # only hidden widgets are left, check them occasionally
+            self._polling_hidden = True
+            self._timer.setInterval(max(HIDDEN_POLL_INTERVAL, self.frame_interval))
+        elif self._polling_hidden:
+            self._start_frames()
+
+    @staticmethod
+    def _is_alive(owner: QWidget) -> bool:
+        return not getattr(owner, "_destroyed", False)
+
+    @staticmethod
+    def _apply(entry: _PendingUpdate):
+        callback = entry.callback
+        if callback is None:
+            return
+        try:
+            callback()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Error while applying a scheduled update of {entry.owner()}: {exc}")
+
+
+_render_scheduler: RenderScheduler | None = None
+
+
+def get_render_scheduler() -> RenderScheduler:
+    """
+    Get the render scheduler of the process. The maximum frame rate can be set through the
+    BEC_WIDGETS_MAX_FPS environment variable.
+
+    Returns:
+        RenderScheduler: The scheduler.
+    """
+    global _render_scheduler  # pylint: disable=global-statement
+    if _render_scheduler is None:
+        try:
+            max_fps = float(os.environ.get(MAX_FPS_ENV, DEFAULT_MAX_FPS))
+        except ValueError:
+            logger.warning(f"Invalid value for {MAX_FPS_ENV}, using {DEFAULT_MAX_FPS} FPS")
+            max_fps = DEFAULT_MAX_FPS
+        _render_scheduler = RenderScheduler(max_fps=max_fps)
+    return _render_scheduler
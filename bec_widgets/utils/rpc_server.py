@@ -11,7 +11,6 @@ from bec_lib.endpoints import MessageEndpoints
 from bec_lib.logger import bec_logger
 from bec_lib.utils.import_utils import lazy_import
 from qtpy.QtCore import QTimer
-from qtpy.QtWidgets import QApplication
 from redis.exceptions import RedisError
 
 from bec_widgets.cli.rpc.rpc_register import RPCRegister
@@ -85,8 +84,12 @@ class RPCServer:
         self._heartbeat_timer.start(200)
         self._registry_update_callbacks = []
         self._broadcasted_data = {}
+        # responses waiting for newly created objects to be registered, by request id
+        self._deferred_responses: dict[str, set[str]] = {}
 
         self.status = messages.BECStatus.RUNNING
+        # announce the server right away; clients consider it ready once the registry arrives
+        self.emit_heartbeat()
         logger.success(f"Server started with gui_id: {self.gui_id}")
 
     def on_rpc_update(self, msg: dict, metadata: dict):
@@ -108,7 +111,7 @@ class RPCServer:
                 self.send_response(request_id, False, {"error": content})
             else:
                 logger.debug(f"RPC instruction executed successfully: {res}")
-                self.send_response(request_id, True, {"result": res})
+                self.send_result_when_registered(request_id, res)
 
     def send_response(self, request_id: str, accepted: bool, msg: dict):
         self.client.connector.set_and_publish(
@@ -125,6 +128,10 @@ class RPCServer:
         return obj
 
     def run_rpc(self, obj, method, args, kwargs):
+        """
+        Run the RPC instruction. The result is returned as is, use serialize_result to
+        serialize it.
+        """
         # Run with rpc registry broadcast, but only once
         with RPCRegister.delayed_broadcast():
             logger.debug(f"Running RPC instruction: {method} with args: {args}, kwargs: {kwargs}")
@@ -138,15 +145,109 @@ class RPCServer:
                     res = None
             else:
                 res = method_obj(*args, **kwargs)
-
-            if isinstance(res, list):
-                res = [self.serialize_object(obj) for obj in res]
-            elif isinstance(res, dict):
-                res = {key: self.serialize_object(val) for key, val in res.items()}
-            else:
-                res = self.serialize_object(res)
             return res
 
+    def send_result_when_registered(self, request_id: str, res) -> None:
+        """
+        Send the result of an RPC instruction. Newly created objects are only registered in
+        the RPC register once the event loop has run, so the response is parked until all
+        BECConnector objects of the result are registered and completed from the registration
+        callback. The event loop is never blocked while waiting.
+
+        Args:
+            request_id(str): The request id of the RPC instruction.
+            res: The (unserialized) result of the RPC instruction.
+        """
+        pending = {
+            connector.gui_id: connector
+            for connector in self._result_connectors(res)
+            if not self.rpc_register.object_is_registered(connector)
+        }
+        if not pending:
+            self._send_result(request_id, res)
+            return
+
+        self._deferred_responses[request_id] = set(pending)
+        destroyed_slots: dict[str, functools.partial] = {}
+
+        def release():
+            # drop the callbacks which keep the result alive once the response is sent
+            for gui_id, slot in destroyed_slots.items():
+                connector = pending[gui_id]
+                self.rpc_register.cancel_registration_callbacks(connector, on_registered)
+                try:
+                    connector.destroyed.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    # the connector is already deleted
+                    pass
+            destroyed_slots.clear()
+
+        def on_registered(connector: BECConnector):
+            waiting = self._deferred_responses.get(request_id)
+            if waiting is None:
+                return
+            waiting.discard(connector.gui_id)
+            if not waiting:
+                del self._deferred_responses[request_id]
+                release()
+                self._send_result(request_id, res)
+
+        def on_destroyed(*_, gui_id: str):
+            if self._deferred_responses.pop(request_id, None) is None:
+                return
+            release()
+            self.send_response(
+                request_id,
+                False,
+                {"error": f"Object with gui_id {gui_id} was deleted before it was registered."},
+            )
+
+        for gui_id, connector in pending.items():
+            destroyed_slots[gui_id] = functools.partial(on_destroyed, gui_id=gui_id)
+            connector.destroyed.connect(destroyed_slots[gui_id])
+            self.rpc_register.call_on_registration(connector, on_registered)
+
+    def _send_result(self, request_id: str, res) -> None:
+        try:
+            result = self.serialize_result(res)
+        except Exception:
+            content = traceback.format_exc()
+            logger.error(f"Error while serializing RPC result: {content}")
+            self.send_response(request_id, False, {"error": content})
+            return
+        self.send_response(request_id, True, {"result": result})
+
+    @staticmethod
+    def _result_connectors(res) -> list[BECConnector]:
+        """Get all BECConnector objects of an RPC result that are sent to the client."""
+        if isinstance(res, list):
+            values = res
+        elif isinstance(res, dict):
+            values = list(res.values())
+        else:
+            values = [res]
+        return [
+            val
+            for val in values
+            if isinstance(val, BECConnector) and getattr(val, "RPC", True) is not False
+        ]
+
+    def serialize_result(self, res):
+        """
+        Serialize the result of an RPC instruction.
+
+        Args:
+            res: The result of the RPC instruction.
+
+        Returns:
+            The serialized result.
+        """
+        if isinstance(res, list):
+            return [self.serialize_object(obj) for obj in res]
+        if isinstance(res, dict):
+            return {key: self.serialize_object(val) for key, val in res.items()}
+        return self.serialize_object(res)
+
     def serialize_object(self, obj: T) -> None | dict | T:
         """
         Serialize all BECConnector objects.
@@ -162,7 +263,7 @@ class RPCServer:
         # Respect RPC = False
         if getattr(obj, "RPC", True) is False:
             return None
-        return self._serialize_bec_connector(obj, wait=True)
+        return self._serialize_bec_connector(obj)
 
     def emit_heartbeat(self) -> None:
         """
@@ -202,13 +303,12 @@ class RPCServer:
             max_size=1,
         )
 
-    def _serialize_bec_connector(self, connector: BECConnector, wait=False) -> dict:
+    def _serialize_bec_connector(self, connector: BECConnector) -> dict:
         """
         Create the serialization dict for a single BECConnector.
 
         Args:
             connector (BECConnector): The BECConnector to serialize.
-            wait (bool): If True, wait until the object is registered in the RPC register.
 
         Returns:
             dict: The serialized BECConnector object.
@@ -226,10 +326,6 @@ class RPCServer:
         except Exception:
             container_proxy = None
 
-        if wait:
-            while not self.rpc_register.object_is_registered(connector):
-                QApplication.processEvents()
-
         widget_class = getattr(connector, "rpc_widget_class", None)
         if not widget_class:
             widget_class = connector.__class__.__name__
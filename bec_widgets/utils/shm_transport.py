@@ -0,0 +1,278 @@
+"""
+Shared-memory transport for large 2D monitor frames of producers on the same host as the GUI.
+
+Instead of sending the full frame through Redis, the producer writes it into a ring of slots in
+a :class:`multiprocessing.shared_memory.SharedMemory` segment and sends a
+DeviceMonitor2DMessage whose metadata only carries a small descriptor of the frame, see
+:class:`SharedMemoryFrame`. The data of the message is an empty array, or the full frame if the
+producer also wants to serve consumers on other hosts.
+
+Every slot starts with a header holding the sequence number of the frame in the slot, which is
+set to -1 while the producer writes the slot. The consumer checks the sequence number before
+and after copying the frame, such that frames that were overwritten in the meantime are dropped
+instead of being shown torn.
+
+Producer::
+
+    ring = SharedMemoryFrameRing(frame_shape=(2048, 2048), dtype="uint16")
+    msg = ring.message("eiger", frame)
+    connector.xadd(MessageEndpoints.device_monitor_2d("eiger"), {"data": msg})
+"""
+
+from __future__ import annotations
+
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+from bec_lib import messages
+from bec_lib.logger import bec_logger
+from pydantic import BaseModel, Field, ValidationError
+
+logger = bec_logger.logger
+
+SHM_METADATA_KEY = "shm"
+# size of the slot header; keeps the frame data aligned to cache lines
+HEADER_SIZE = 64
+_WRITING = -1
+# segments created by rings of this process, which are tracked by the rings themselves
+_owned_segments: set[str] = set()
+
+
+class SharedMemoryFrame(BaseModel):
+    """Descriptor of a frame in a shared-memory ring, as sent in the metadata of a message."""
+
+    name: str = Field(..., description="Name of the shared-memory segment.")
+    offset: int = Field(..., description="Offset of the slot header in the segment.")
+    shape: tuple[int, ...] = Field(..., description="Shape of the frame.")
+    dtype: str = Field(..., description="Numpy dtype string of the frame, e.g. '<u2'.")
+    seq: int = Field(..., description="Sequence number of the frame.")
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the frame data in bytes."""
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+    @classmethod
+    def from_metadata(cls, metadata: dict | None) -> SharedMemoryFrame | None:
+        """
+        Get the descriptor from the metadata of a message.
+
+        Args:
+            metadata(dict | None): The metadata.
+
+        Returns:
+            SharedMemoryFrame | None: The descriptor, None if the metadata does not contain a
+                valid one.
+        """
+        descriptor = (metadata or {}).get(SHM_METADATA_KEY)
+        if descriptor is None:
+            return None
+        try:
+            return cls.model_validate(descriptor)
+        except ValidationError as exc:
+            logger.warning(f"Invalid shared-memory frame descriptor {descriptor}: {exc}")
+            return None
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment without handing it to the resource tracker, which would
+    otherwise unlink the segment of the producer when the GUI exits.
+    """
+    if sys.version_info >= (3, 13):  # pragma: no cover
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if shm.name in _owned_segments:
+        return shm
+    try:
+        # pylint: disable=import-outside-toplevel,protected-access
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:  # pylint: disable=broad-except
+        pass
+    return shm
+
+
+class SharedMemoryFrameRing:
+    """
+    Producer side of the transport: a ring of frame slots in a shared-memory segment.
+
+    Args:
+        frame_shape(tuple[int, ...]): Shape of the largest frame.
+        dtype(str | np.dtype): Data type of the largest frame.
+        slots(int): Number of slots. A consumer can lag behind the producer by slots - 1 frames
+            before frames are dropped.
+        name(str, optional): Name of the segment. Defaults to None, which picks a unique name.
+    """
+
+    def __init__(
+        self,
+        frame_shape: tuple[int, ...],
+        dtype: str | np.dtype = "float64",
+        slots: int = 4,
+        name: str | None = None,
+    ):
+        if slots < 1:
+            raise ValueError("The ring needs at least one slot.")
+        frame_bytes = int(np.prod(frame_shape)) * np.dtype(dtype).itemsize
+        self.slots = slots
+        self.slot_size = HEADER_SIZE + -(-frame_bytes // HEADER_SIZE) * HEADER_SIZE
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=self.slot_size * slots)
+        _owned_segments.add(self._shm.name)
+        self._headers = [
+            np.ndarray((1,), dtype=np.int64, buffer=self._shm.buf, offset=slot * self.slot_size)
+            for slot in range(slots)
+        ]
+        for header in self._headers:
+            header[0] = _WRITING
+        self._seq = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the shared-memory segment."""
+        return self._shm.name
+
+    def write(self, frame: np.ndarray) -> SharedMemoryFrame:
+        """
+        Copy a frame into the next slot of the ring.
+
+        Args:
+            frame(np.ndarray): The frame.
+
+        Returns:
+            SharedMemoryFrame: The descriptor of the frame.
+        """
+        frame = np.asarray(frame)
+        if frame.nbytes > self.slot_size - HEADER_SIZE:
+            raise ValueError(
+                f"Frame of {frame.nbytes} bytes exceeds the slot size of "
+                f"{self.slot_size - HEADER_SIZE} bytes."
+            )
+        slot = self._seq % self.slots
+        offset = slot * self.slot_size
+        header = self._headers[slot]
+        header[0] = _WRITING
+        target = np.ndarray(
+            frame.shape, dtype=frame.dtype, buffer=self._shm.buf, offset=offset + HEADER_SIZE
+        )
+        np.copyto(target, frame)
+        del target
+        header[0] = self._seq
+        descriptor = SharedMemoryFrame(
+            name=self.name, offset=offset, shape=frame.shape, dtype=frame.dtype.str, seq=self._seq
+        )
+        self._seq += 1
+        return descriptor
+
+    def message(
+        self, device: str, frame: np.ndarray, inline: bool = False
+    ) -> messages.DeviceMonitor2DMessage:
+        """
+        Write a frame into the ring and create the message announcing it.
+
+        Args:
+            device(str): Name of the device.
+            frame(np.ndarray): The frame.
+            inline(bool): Also send the full frame in the message, for consumers which cannot
+                access the shared memory.
+
+        Returns:
+            messages.DeviceMonitor2DMessage: The message.
+        """
+        descriptor = self.write(frame)
+        data = frame if inline else np.empty((0, 0), dtype=frame.dtype)
+        return messages.DeviceMonitor2DMessage(
+            device=device, data=data, metadata={SHM_METADATA_KEY: descriptor.model_dump()}
+        )
+
+    def close(self, unlink: bool = True):
+        """
+        Close the segment.
+
+        Args:
+            unlink(bool): Also remove the segment from the system.
+        """
+        self._headers = []
+        _owned_segments.discard(self._shm.name)
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+    def __enter__(self) -> SharedMemoryFrameRing:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SharedMemoryFrameReader:
+    """
+    Consumer side of the transport. Segments are attached on first use and kept attached until
+    :meth:`close` is called.
+    """
+
+    def __init__(self):
+        self._segments: dict[str, shared_memory.SharedMemory] = {}
+        self._unavailable: set[str] = set()
+
+    def read(self, frame: SharedMemoryFrame, out: np.ndarray | None = None) -> np.ndarray | None:
+        """
+        Read a frame from shared memory. The frame is mapped without copying and copied once
+        into the output array, which can be reused for the next frames. If the producer
+        overwrites the frame during the copy, None is returned and the output array holds torn
+        data, hence it must not be an array which is in use, e.g. the displayed frame.
+
+        Args:
+            frame(SharedMemoryFrame): The descriptor of the frame.
+            out(np.ndarray, optional): Scratch array to copy the frame into. Used if its shape
+                and dtype match the frame, otherwise a new array is allocated.
+
+        Returns:
+            np.ndarray | None: The frame, None if the segment is not accessible or the frame was
+                already overwritten by the producer.
+        """
+        shm = self._segment(frame.name)
+        if shm is None:
+            return None
+        if frame.offset < 0 or frame.offset + HEADER_SIZE + frame.nbytes > shm.size:
+            logger.warning(f"Shared-memory frame {frame} exceeds the segment {frame.name}.")
+            return None
+        header = np.ndarray((1,), dtype=np.int64, buffer=shm.buf, offset=frame.offset)
+        if header[0] != frame.seq:
+            return None
+        view = np.ndarray(
+            frame.shape, dtype=frame.dtype, buffer=shm.buf, offset=frame.offset + HEADER_SIZE
+        )
+        if out is None or out.shape != view.shape or out.dtype != view.dtype:
+            out = np.empty_like(view)
+        np.copyto(out, view)
+        valid = header[0] == frame.seq
+        del view, header
+        return out if valid else None
+
+    def _segment(self, name: str) -> shared_memory.SharedMemory | None:
+        shm = self._segments.get(name)
+        if shm is not None:
+            return shm
+        try:
+            shm = _attach(name)
+        except (OSError, ValueError) as exc:
+            if name not in self._unavailable:
+                logger.warning(f"Shared-memory segment {name} is not accessible: {exc}")
+                self._unavailable.add(name)
+            return None
+        self._unavailable.discard(name)
+        self._segments[name] = shm
+        return shm
+
+    def close(self):
+        """Detach from all segments."""
+        for shm in self._segments.values():
+            try:
+                shm.close()
+            except BufferError:  # pragma: no cover
+                logger.warning(f"Shared-memory segment {shm.name} is still in use.")
+        self._segments.clear()
+        self._unavailable.clear()
@@ -0,0 +1,294 @@
+"""
+Opt-in profiling of the slots called by the BECDispatcher and of SafeSlot calls.
+
+When enabled, every QtThreadSafeCallback records the time a message was received from Redis, the
+number of messages waiting for the GUI thread and the time until the slot starts, and the time
+spent in the slot. SafeSlot calls that are not deliveries of the dispatcher are timed as well,
+such that slots triggered by timers or user interaction show up too. The statistics are kept per
+slot and topic.
+
+Profiling is enabled with :meth:`SlotProfiler.enable`, over RPC through the launcher or at
+startup with the BEC_WIDGETS_PROFILE_SLOTS=1 environment variable. When disabled, the overhead
+is a single attribute check per call.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING, Callable
+
+from bec_lib.logger import bec_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from bec_widgets.utils.bec_dispatcher import QtThreadSafeCallback
+
+logger = bec_logger.logger
+
+PROFILE_ENV = "BEC_WIDGETS_PROFILE_SLOTS"
+# upper bounds of the histogram buckets in milliseconds, the last bucket is unbounded
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+
+class DurationHistogram:
+    """Histogram of durations with fixed, logarithmically spaced buckets."""
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, seconds: float):
+        """
+        Add a duration.
+
+        Args:
+            seconds(float): The duration in seconds.
+        """
+        ms = seconds * 1e3
+        self.counts[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the histogram to a serializable dictionary.
+
+        Returns:
+            dict: Count, mean, max and total in milliseconds, and the bucket counts together
+                with the upper bounds of the buckets.
+        """
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "total_ms": self.total_ms,
+            "bounds_ms": list(HISTOGRAM_BOUNDS_MS),
+            "counts": list(self.counts),
+        }
+
+
+class SlotStats:
+    """Statistics of one slot for one topic."""
+
+    def __init__(self, slot: str, topic: str | None):
+        self.slot = slot
+        self.topic = topic
+        self.calls = 0
+        self.drops = 0
+        self.errors = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.queue_latency = DurationHistogram()
+        self.execution = DurationHistogram()
+
+    def to_dict(self) -> dict:
+        """
+        Convert the statistics to a serializable dictionary.
+
+        Returns:
+            dict: The statistics.
+        """
+        return {
+            "slot": self.slot,
+            "topic": self.topic,
+            "calls": self.calls,
+            "drops": self.drops,
+            "errors": self.errors,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "queue_latency": self.queue_latency.to_dict(),
+            "execution": self.execution.to_dict(),
+        }
+
+
+def slot_name(slot: Callable) -> str:
+    """
+    Get a readable name of a slot, including the gui_id or object name of its instance.
+
+    Args:
+        slot(Callable): The slot.
+
+    Returns:
+        str: The name of the slot.
+    """
+    func = getattr(slot, "__func__", slot)
+    name = getattr(func, "__qualname__", None) or repr(func)
+    instance = getattr(slot, "__self__", None)
+    if instance is None:
+        return name
+    owner = getattr(instance, "gui_id", None)
+    if owner is None and hasattr(instance, "objectName"):
+        try:
+            owner = instance.objectName()
+        except RuntimeError:
+            owner = None
+    return f"{name} [{owner}]" if owner else name
+
+
+class SlotProfiler:
+    """
+    Collector of slot statistics. Records may come from the Redis listener threads and from the
+    GUI thread, hence all access is guarded by a lock.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats: dict[tuple[str, str | None], SlotStats] = {}
+        self._lock = threading.Lock()
+        self._callbacks: weakref.WeakSet[QtThreadSafeCallback] = weakref.WeakSet()
+
+    def enable(self, reset: bool = False):
+        """
+        Start profiling.
+
+        Args:
+            reset(bool): If True, previously collected statistics are removed.
+        """
+        if reset:
+            self.reset()
+        self.enabled = True
+        self._update_callbacks()
+        logger.info("Slot profiling enabled")
+
+    def disable(self):
+        """Stop profiling. Collected statistics are kept until reset."""
+        self.enabled = False
+        self._update_callbacks()
+
+    def reset(self):
+        """Remove all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def track(self, callback: QtThreadSafeCallback):
+        """
+        Keep track of a dispatcher callback, such that its profiling hooks are installed or
+        removed whenever profiling is switched on or off.
+
+        Args:
+            callback(QtThreadSafeCallback): The callback.
+        """
+        self._callbacks.add(callback)
+
+    def _update_callbacks(self):
+        for callback in list(self._callbacks):
+            callback.set_profiling(self.enabled)
+
+    def _get(self, slot: str, topic: str | None) -> SlotStats:
+        stats = self._stats.get((slot, topic))
+        if stats is None:
+            stats = self._stats[(slot, topic)] = SlotStats(slot, topic)
+        return stats
+
+    def record_receipt(self, slot: str, topic: str | None, queue_depth: int):
+        """
+        Record a message received from Redis and waiting for the GUI thread.
+
+        Args:
+            slot(str): The name of the slot.
+            topic(str): The topic of the message.
+            queue_depth(int): Number of messages for the slot waiting for the GUI thread.
+        """
+        with self._lock:
+            stats = self._get(slot, topic)
+            stats.queue_depth = queue_depth
+            stats.max_queue_depth = max(stats.max_queue_depth, queue_depth)
+
+    def record_start(self, slot: str, topic: str | None, latency: float, queue_depth: int):
+        """
+        Record the start of a slot call for a message received from Redis.
+
+        Args:
+            slot(str): The name of the slot.
+            topic(str): The topic of the message.
+            latency(float): Time in seconds from the receipt of the message to the slot call.
+            queue_depth(int): Number of messages for the slot still waiting.
+        """
+        with self._lock:
+            stats = self._get(slot, topic)
+            stats.queue_depth = queue_depth
+            stats.queue_latency.add(latency)
+
+    def record_call(self, slot: str, topic: str | None, duration: float, error: bool = False):
+        """
+        Record a finished slot call.
+
+        Args:
+            slot(str): The name of the slot.
+            topic(str): The topic of the message, None for calls not made by the dispatcher.
+            duration(float): Execution time of the slot in seconds.
+            error(bool): Whether the slot raised an exception.
+        """
+        with self._lock:
+            stats = self._get(slot, topic)
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.execution.add(duration)
+
+    def record_error(self, slot: str, topic: str | None):
+        """
+        Record a slot call that raised an exception. The execution time is recorded separately.
+
+        Args:
+            slot(str): The name of the slot.
+            topic(str): The topic of the message.
+        """
+        with self._lock:
+            self._get(slot, topic).errors += 1
+
+    def record_drop(self, slot: str, topic: str | None):
+        """
+        Record a message that was not delivered, e.g. because the slot was deleted.
+
+        Args:
+            slot(str): The name of the slot.
+            topic(str): The topic of the message.
+        """
+        with self._lock:
+            self._get(slot, topic).drops += 1
+
+    def snapshot(self) -> list[dict]:
+        """
+        Get the collected statistics.
+
+        Returns:
+            list[dict]: The statistics per slot and topic, sorted by the total execution time.
+        """
+        with self._lock:
+            stats = [entry.to_dict() for entry in self._stats.values()]
+        return sorted(stats, key=lambda entry: entry["execution"]["total_ms"], reverse=True)
+
+    def slowest(self, count: int = 10) -> list[dict]:
+        """
+        Get the slots with the highest total execution time.
+
+        Args:
+            count(int): Number of slots to return.
+
+        Returns:
+            list[dict]: The statistics of the slowest slots.
+        """
+        return self.snapshot()[:count]
+
+
+_slot_profiler: SlotProfiler | None = None
+
+
+def get_slot_profiler() -> SlotProfiler:
+    """
+    Get the slot profiler of the process. It is enabled on creation if the
+    BEC_WIDGETS_PROFILE_SLOTS environment variable is set to 1.
+
+    Returns:
+        SlotProfiler: The profiler.
+    """
+    global _slot_profiler  # pylint: disable=global-statement
+    if _slot_profiler is None:
+        _slot_profiler = SlotProfiler()
+        _slot_profiler.enabled = os.environ.get(PROFILE_ENV, "0") == "1"
+    return _slot_profiler
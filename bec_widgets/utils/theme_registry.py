@@ -0,0 +1,195 @@
+"""
+Registry of theme-aware widgets.
+
+Instead of connecting every widget to the theme signal of the application, which applies the
+theme to all widgets within one event-loop iteration, widgets register themselves with
+:meth:`ThemeRegistry.register`. When the theme changes, the registry applies it to the registered
+widgets in chunks of limited duration on the following event-loop iterations, such that the GUI
+stays responsive while switching the theme of a session with many widgets. Visible widgets are
+updated first.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
+
+from bec_lib.logger import bec_logger
+from qtpy.QtCore import QObject, QTimer
+from qtpy.QtWidgets import QApplication, QWidget
+
+from bec_widgets.utils.render_scheduler import is_rendered
+
+logger = bec_logger.logger
+
+# time in seconds which may be spent on applying the theme within one event-loop iteration
+CHUNK_BUDGET = 0.01
+
+ThemeCallback = Callable[[QWidget, str], None]
+
+
+def _call_apply_theme(widget: QWidget, theme: str):
+    widget.apply_theme(theme)
+
+
+class ThemeRegistry(QObject):
+    """
+    Apply theme changes to registered widgets, spread over several event-loop iterations.
+
+    Args:
+        parent(QObject, optional): The parent object.
+    """
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._callbacks: weakref.WeakKeyDictionary[QWidget, ThemeCallback] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pending: deque[weakref.ref] = deque()
+        self._theme: str | None = None
+        self._signal_connected = False
+        self.immediate = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def theme(self) -> str | None:
+        """The theme which is currently applied, None if no theme was applied yet."""
+        return self._theme
+
+    def register(self, widget: QWidget, callback: ThemeCallback | None = None):
+        """
+        Register a widget for theme updates. Registering a widget again replaces its callback.
+
+        Args:
+            widget(QWidget): The widget. It is only referenced weakly.
+            callback(Callable[[QWidget, str], None], optional): Called with the widget and the
+                name of the theme. Defaults to None, which calls the apply_theme method of the
+                widget.
+        """
+        self._connect_to_theme_signal()
+        self._callbacks[widget] = callback or _call_apply_theme
+
+    def unregister(self, widget: QWidget):
+        """
+        Stop the theme updates of a widget.
+
+        Args:
+            widget(QWidget): The widget.
+        """
+        self._callbacks.pop(widget, None)
+
+    def is_registered(self, widget: QWidget) -> bool:
+        """
+        Check whether a widget is registered for theme updates.
+
+        Args:
+            widget(QWidget): The widget.
+
+        Returns:
+            bool: True if the widget is registered.
+        """
+        return widget in self._callbacks
+
+    def is_pending(self, widget: QWidget | None = None) -> bool:
+        """
+        Check whether a theme change still has to be applied.
+
+        Args:
+            widget(QWidget, optional): Only check this widget.
+
+        Returns:
+            bool: True if the theme change is pending.
+        """
+        if widget is None:
+            return bool(self._pending)
+        return any(ref() is widget for ref in self._pending)
+
+    def apply(self, theme: str):
+        """
+        Apply a theme to all registered widgets. If a theme change is still pending, it is
+        replaced by the new one.
+
+        Args:
+            theme(str): The name of the theme.
+        """
+        self._theme = theme
+        widgets = list(self._callbacks.keys())
+        # widgets on screen first, the others are themed in the background
+        widgets.sort(key=lambda widget: not self._is_rendered(widget))
+        self._pending = deque(weakref.ref(widget) for widget in widgets)
+        if self.immediate:
+            self.flush()
+        elif self._pending:
+            self._timer.start()
+
+    def flush(self):
+        """Apply the pending theme change to all remaining widgets right away."""
+        self._timer.stop()
+        pending, self._pending = self._pending, deque()
+        for ref in pending:
+            self._apply(ref)
+
+    def clear(self):
+        """Drop the pending theme change."""
+        self._timer.stop()
+        self._pending.clear()
+
+    def _tick(self):
+        deadline = time.perf_counter() + CHUNK_BUDGET
+        while self._pending:
+            self._apply(self._pending.popleft())
+            if time.perf_counter() > deadline:
+                break
+        if not self._pending:
+            self._timer.stop()
+
+    def _apply(self, ref: weakref.ref):
+        widget = ref()
+        if widget is None or getattr(widget, "_destroyed", False):
+            return
+        callback = self._callbacks.get(widget)
+        if callback is None:
+            return
+        try:
+            callback(widget, self._theme)
+        except RuntimeError:
+            # the widget has been deleted
+            self._callbacks.pop(widget, None)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error(f"Error while applying the theme {self._theme} to {widget}: {exc}")
+
+    @staticmethod
+    def _is_rendered(widget: QWidget) -> bool:
+        try:
+            return is_rendered(widget)
+        except RuntimeError:
+            return False
+
+    def _connect_to_theme_signal(self):
+        if self._signal_connected:
+            return
+        app = QApplication.instance()
+        if not hasattr(app, "theme_signal"):
+            return
+        app.theme_signal.theme_updated.connect(self.apply)
+        self._signal_connected = True
+
+
+_theme_registry: ThemeRegistry | None = None
+
+
+def get_theme_registry() -> ThemeRegistry:
+    """
+    Get the theme registry of the process.
+
+    Returns:
+        ThemeRegistry: The registry.
+    """
+    global _theme_registry  # pylint: disable=global-statement
+    if _theme_registry is None:
+        _theme_registry = ThemeRegistry()
+    return _theme_registry
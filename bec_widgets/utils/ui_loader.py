@@ -2,11 +2,35 @@ from bec_lib.logger import bec_logger
 from qtpy import PYQT6, PYSIDE6
 from qtpy.QtCore import QFile, QIODevice
 
-from bec_widgets.utils.generate_designer_plugin import DesignerPluginInfo
-from bec_widgets.utils.plugin_utils import get_custom_classes
+from bec_widgets.utils.name_utils import pascal_to_snake
+from bec_widgets.utils.widget_manifest import LazyWidgetClasses, get_widget_manifest
 
 logger = bec_logger.logger
 
+
+def translate_bec_widgets_header(header: str, custom_widgets) -> str:
+    """
+    Translate the header of a custom widget in a .ui file, i.e. the snake case name of a BEC
+    widget, to the module of the widget. For lazily loaded widget classes, the module is taken
+    from the manifest without importing the class.
+
+    Args:
+        header(str): The header of the custom widget.
+        custom_widgets(LazyWidgetClasses | dict): The available widget classes by name.
+
+    Returns:
+        str: The module of the widget, or the header if it is not a BEC widget.
+    """
+    if isinstance(custom_widgets, LazyWidgetClasses):
+        modules = {name: entry.module for name, entry in custom_widgets.entries.items()}
+    else:
+        modules = {name: cls.__module__ for name, cls in custom_widgets.items()}
+    for name, module in modules.items():
+        if header == pascal_to_snake(name):
+            return module
+    return header
+
+
 if PYSIDE6:
     from PySide6.QtUiTools import QUiLoader
 
@@ -30,9 +54,8 @@ class UILoader:
     def __init__(self, parent=None):
         self.parent = parent
 
-        widgets = get_custom_classes("bec_widgets").classes
-
-        self.custom_widgets = {widget.__name__: widget for widget in widgets}
+        # classes are only imported once a ui file actually uses them
+        self.custom_widgets = LazyWidgetClasses(get_widget_manifest("bec_widgets"))
 
         if PYSIDE6:
             self.loader = self.load_ui_pyside6
@@ -118,10 +141,7 @@ class UILoader:
                     )
 
             def _translate_bec_widgets_header(self, header):
-                for name, value in self.custom_widgets.items():
-                    if header == DesignerPluginInfo.pascal_to_snake(name):
-                        return value.__module__
-                return header
+                return translate_bec_widgets_header(header, self.custom_widgets)
 
         return CustomDynamicUILoader("", self.custom_widgets).loadUi(ui_file, parent)
 
@@ -0,0 +1,328 @@
+"""
+Persisted manifest of the widget classes provided by bec_widgets and by plugin repositories.
+
+Discovering widgets requires importing every module of a package, which is slow. The manifest
+stores the result of the discovery (widget name, module, RPC flags, icon) on disk, keyed by the
+package version and the modification times of its source files, so that the widget list can be
+obtained without importing anything as long as the sources did not change. Classes are only
+imported when they are actually needed, e.g. through :meth:`WidgetManifestEntry.load`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import os
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict, dataclass
+
+from bec_lib.logger import bec_logger
+
+logger = bec_logger.logger
+
+MANIFEST_SCHEMA_VERSION = 1
+CACHE_DIR_ENV = "BEC_WIDGETS_CACHE_DIR"
+PLUGIN_ENTRY_POINT_GROUP = "bec.widgets.user_widgets"
+
+
+@dataclass
+class WidgetManifestEntry:
+    """Description of a single class found during widget discovery."""
+
+    name: str
+    module: str
+    file: str
+    is_connector: bool = False
+    is_widget: bool = False
+    is_plugin: bool = False
+    rpc: bool = True
+    icon_name: str | None = None
+
+    def load(self) -> type:
+        """
+        Import the module of the entry and return the class.
+
+        Returns:
+            type: The class described by the entry.
+        """
+        module = importlib.import_module(self.module)
+        return getattr(module, self.name)
+
+    @classmethod
+    def from_class(cls, obj: type, name: str | None = None, **kwargs) -> WidgetManifestEntry:
+        """
+        Create a manifest entry from a class object.
+
+        Args:
+            obj(type): The class.
+            name(str, optional): The name under which the class is found in its module. Defaults
+                to the class name.
+            **kwargs: Additional fields of the entry, e.g. is_widget.
+
+        Returns:
+            WidgetManifestEntry: The manifest entry.
+        """
+        icon_name = getattr(obj, "ICON_NAME", None)
+        return cls(
+            name=name or obj.__name__,
+            module=obj.__module__,
+            file=inspect.getfile(obj),
+            rpc=bool(getattr(obj, "RPC", True)),
+            icon_name=icon_name if isinstance(icon_name, str) else None,
+            **kwargs,
+        )
+
+
+class LazyWidgetClasses(Mapping):
+    """
+    Read-only mapping of widget names to widget classes, backed by manifest entries.
+    Names can be listed and looked up without importing anything; a class is only imported
+    the first time it is accessed.
+    """
+
+    def __init__(self, entries: dict[str, WidgetManifestEntry]):
+        self._entries = entries
+        self._loaded: dict[str, type] = {}
+
+    @property
+    def entries(self) -> dict[str, WidgetManifestEntry]:
+        """The manifest entries backing the mapping."""
+        return self._entries
+
+    def __getitem__(self, name: str) -> type:
+        if name not in self._loaded:
+            self._loaded[name] = self._entries[name].load()
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+
+def manifest_cache_dir() -> str:
+    """
+    Get the directory in which manifests are stored. It can be changed through the
+    BEC_WIDGETS_CACHE_DIR environment variable.
+
+    Returns:
+        str: The cache directory.
+    """
+    return os.environ.get(CACHE_DIR_ENV) or os.path.join(
+        os.path.expanduser("~"), ".cache", "bec_widgets"
+    )
+
+
+def source_fingerprint(directory: str) -> str:
+    """
+    Compute a fingerprint of all python source files below the given directory. The fingerprint
+    changes whenever a file is added, removed or modified.
+
+    Args:
+        directory(str): The directory to fingerprint.
+
+    Returns:
+        str: The fingerprint.
+    """
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if not file.endswith(".py"):
+                continue
+            path = os.path.join(root, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            digest.update(
+                f"{os.path.relpath(path, directory)}:{stat.st_mtime_ns}:{stat.st_size};".encode()
+            )
+    return digest.hexdigest()
+
+
+def _package_version(package_name: str) -> str:
+    try:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _module_directory(module_name: str) -> str | None:
+    """Find the directory of a package without importing the package itself."""
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return list(spec.submodule_search_locations)[0]
+
+
+class WidgetManifest:
+    """
+    Manifest of the classes of one package, persisted as json file in the cache directory.
+
+    Args:
+        name(str): Name of the manifest, used for the file name.
+        directory(str): Source directory whose files determine the staleness of the manifest.
+        version(str): Version of the package providing the classes.
+    """
+
+    def __init__(self, name: str, directory: str, version: str):
+        self.name = name
+        self.directory = directory
+        self.version = version
+        self._key: dict | None = None
+
+    @property
+    def path(self) -> str:
+        """Path of the manifest file, unique per installation location of the package."""
+        location = hashlib.sha1(os.path.abspath(self.directory).encode()).hexdigest()[:8]
+        return os.path.join(manifest_cache_dir(), f"{self.name}_{location}_widget_manifest.json")
+
+    @property
+    def key(self) -> dict:
+        """The key which must match the stored manifest for it to be considered up to date."""
+        if self._key is None:
+            self._key = {
+                "schema": MANIFEST_SCHEMA_VERSION,
+                "version": self.version,
+                "directory": os.path.abspath(self.directory),
+                "fingerprint": source_fingerprint(self.directory),
+            }
+        return self._key
+
+    def load(self) -> dict[str, WidgetManifestEntry] | None:
+        """
+        Load the manifest from disk.
+
+        Returns:
+            dict[str, WidgetManifestEntry] | None: The entries, or None if the manifest does not
+                exist, cannot be read or is stale.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                content = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(content, dict) or content.get("key") != self.key:
+            return None
+        try:
+            return {
+                entry["name"]: WidgetManifestEntry(**entry) for entry in content.get("entries", [])
+            }
+        except (TypeError, KeyError):
+            return None
+
+    def save(self, entries: dict[str, WidgetManifestEntry]):
+        """
+        Store the manifest on disk. Failures, e.g. due to a read-only file system, are logged
+        and otherwise ignored.
+
+        Args:
+            entries(dict[str, WidgetManifestEntry]): The entries to store.
+        """
+        content = {"key": self.key, "entries": [asdict(entry) for entry in entries.values()]}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(content, file)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.warning(f"Could not write widget manifest {self.path}: {exc}")
+
+    def invalidate(self):
+        """Remove the manifest from disk."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _discover_custom_classes(repo_name: str) -> dict[str, WidgetManifestEntry]:
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.utils.plugin_utils import get_custom_classes
+
+    return {
+        info.name: WidgetManifestEntry.from_class(
+            info.obj,
+            name=info.name,
+            is_connector=info.is_connector,
+            is_widget=info.is_widget,
+            is_plugin=info.is_plugin,
+        )
+        for info in get_custom_classes(repo_name)
+    }
+
+
+def get_widget_manifest(
+    repo_name: str = "bec_widgets", force_update: bool = False
+) -> dict[str, WidgetManifestEntry]:
+    """
+    Get the manifest of all classes found by get_custom_classes in the given repository. The
+    manifest is only regenerated if the package version or any of its widget source files changed.
+
+    Args:
+        repo_name(str): The name of the repository.
+        force_update(bool): If True, the manifest is regenerated regardless of its state.
+
+    Returns:
+        dict[str, WidgetManifestEntry]: The manifest entries by class name.
+    """
+    directory = _module_directory(f"{repo_name}.widgets")
+    if directory is None:
+        return _discover_custom_classes(repo_name)
+    manifest = WidgetManifest(repo_name, directory, _package_version(repo_name))
+    entries = None if force_update else manifest.load()
+    if entries is None:
+        logger.info(f"Regenerating widget manifest for {repo_name}")
+        entries = _discover_custom_classes(repo_name)
+        manifest.save(entries)
+    return entries
+
+
+def get_plugin_widget_manifest(force_update: bool = False) -> dict[str, WidgetManifestEntry]:
+    """
+    Get the manifest of all widgets of the installed plugin repository, i.e. the widgets returned
+    by get_all_plugin_widgets. The manifest is only regenerated if the plugin version or any of its
+    source files changed.
+
+    Args:
+        force_update(bool): If True, the manifest is regenerated regardless of its state.
+
+    Returns:
+        dict[str, WidgetManifestEntry]: The manifest entries by widget name. Empty if no plugin
+            repository is installed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.utils.bec_plugin_helper import get_all_plugin_widgets
+
+    plugins = tuple(importlib.metadata.entry_points(group=PLUGIN_ENTRY_POINT_GROUP))
+    if not plugins:
+        return {}
+    plugin = plugins[0]
+    directory = _module_directory(plugin.value)
+    version = plugin.dist.version if plugin.dist is not None else "unknown"
+    manifest = WidgetManifest(f"plugin_{plugin.value}", directory, version) if directory else None
+    entries = None if force_update or manifest is None else manifest.load()
+    if entries is None:
+        logger.info(f"Regenerating widget manifest for plugin {plugin.value}")
+        entries = {
+            name: WidgetManifestEntry.from_class(
+                widget, name=name, is_connector=True, is_widget=True
+            )
+            for name, widget in get_all_plugin_widgets().items()
+        }
+        if manifest is not None:
+            manifest.save(entries)
+    return entries
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, Optional, cast
+import inspect
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast, get_args
 
 from bec_lib.logger import bec_logger
-from pydantic import Field
+from pydantic import BaseModel, Field, ValidationError
 from pyqtgraph.dockarea import Dock, DockLabel
 from qtpy import QtCore, QtGui
 
@@ -13,6 +16,7 @@ from bec_widgets.utils import ConnectionConfig, GridLayoutManager
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.container_utils import WidgetContainerUtils
 from bec_widgets.utils.error_popups import SafeSlot
+from bec_widgets.utils.layout_snapshot import construct_model
 
 logger = bec_logger.logger
 
@@ -32,6 +36,77 @@ class DockConfig(ConnectionConfig):
     )
 
 
+def _config_model(widget_class: type) -> tuple[bool, type[BaseModel] | None]:
+    """
+    Find the config model a widget class accepts as config argument.
+
+    Args:
+        widget_class(type): The widget class.
+
+    Returns:
+        tuple[bool, type[BaseModel] | None]: Whether the widget accepts a config, and the config
+            model, None if the config argument is not annotated with a model.
+    """
+    for cls in widget_class.__mro__:
+        init = cls.__dict__.get("__init__")
+        if init is None:
+            continue
+        parameters = inspect.signature(init).parameters
+        parameter = parameters.get("config")
+        if parameter is None:
+            if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+                # the config is passed on to a base class
+                continue
+            return False, None
+        annotation = parameter.annotation
+        if isinstance(annotation, str):
+            # postponed annotations, e.g. "WaveformConfig | None"
+            namespace = vars(sys.modules[cls.__module__])
+            candidates = [namespace.get(name.strip()) for name in annotation.split("|")]
+        else:
+            candidates = [annotation, *get_args(annotation)]
+        for candidate in candidates:
+            if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                return True, candidate
+        return True, None
+    return False, None
+
+
+def _widget_config(
+    widget_class: type, saved: Any, trusted: bool = False
+) -> BaseModel | dict | None:
+    """
+    Build the config of a widget from its saved config. The widget gets a new gui_id. Widgets
+    with an unannotated config argument get the saved config as dict, which they convert
+    themselves.
+
+    Args:
+        widget_class(type): The widget class.
+        saved(Any): The saved config, either a config model or its dumped dict.
+        trusted(bool): Skip the validation of the saved config, for configs written by the
+            application itself.
+
+    Returns:
+        BaseModel | dict | None: The config, None if the widget does not accept a config or the
+            saved config is invalid.
+    """
+    accepts_config, model = _config_model(widget_class)
+    if not accepts_config:
+        return None
+    data = saved.model_dump() if isinstance(saved, BaseModel) else dict(saved)
+    data["widget_class"] = widget_class.__name__
+    data["gui_id"] = ConnectionConfig(widget_class=widget_class.__name__).gui_id
+    if model is None:
+        return data
+    if trusted:
+        return construct_model(model, data)
+    try:
+        return model.model_validate(data)
+    except ValidationError as exc:
+        logger.warning(f"Invalid saved config of {widget_class.__name__}, using defaults: {exc}")
+        return None
+
+
 class CustomDockLabel(DockLabel):
     def __init__(self, text: str, closable: bool = True):
         super().__init__(text, closable)
@@ -164,6 +239,9 @@ class BECDock(BECWidget, Dock):
         self.parent_dock_area = parent_dock_area
         # Layout Manager
         self.layout_manager = GridLayoutManager(self.layout)
+        # saved configs of widgets which are built when the dock is needed, see materialize
+        self._pending_widgets: dict[str, Any] = {}
+        self._pending_trusted = False
 
     def dropEvent(self, event):
         source = event.source()
@@ -190,6 +268,58 @@ class BECDock(BECWidget, Dock):
         else:
             super().float()
 
+    def showEvent(self, event):  # pylint: disable=invalid-name
+        super().showEvent(event)
+        self.materialize()
+
+    def set_pending_widgets(self, widgets: dict[str, Any], trusted: bool = False) -> None:
+        """
+        Set the saved configs of widgets which are only built once the dock is shown for the
+        first time or its elements are accessed.
+
+        Args:
+            widgets(dict): The widget configs by object name, as stored in config.widgets.
+            trusted(bool): Skip the validation of the configs, for configs written by the
+                application itself.
+        """
+        self._pending_widgets = dict(widgets)
+        self._pending_trusted = trusted
+        self.config.widgets.update(widgets)
+        if self.isVisible():
+            self.materialize()
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether all widgets of the dock are built."""
+        return not self._pending_widgets
+
+    def materialize(self) -> None:
+        """
+        Build the pending widgets of the dock from their saved configs.
+        """
+        if not self._pending_widgets:
+            return
+        pending, self._pending_widgets = self._pending_widgets, {}
+        start = time.perf_counter()
+        for name, saved in pending.items():
+            if isinstance(saved, dict):
+                widget_type = saved.get("widget_class")
+            else:
+                widget_type = getattr(saved, "widget_class", None)
+            # the saved config is replaced by the one of the widget
+            self.config.widgets.pop(name, None)
+            widget_class = widget_handler.widget_classes.get(widget_type)
+            if widget_class is None:
+                raise ValueError(f"Unknown widget type: {widget_type}")
+            config = _widget_config(widget_class, saved, trusted=self._pending_trusted)
+            kwargs = {} if config is None else {"config": config}
+            widget = widget_class(object_name=name, parent_dock=self, parent=self, **kwargs)
+            self.new(widget=widget, name=name)
+        logger.info(
+            f"Built {len(pending)} widgets of dock {self.name()} in "
+            f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+        )
+
     @property
     def elements(self) -> dict[str, BECWidget]:
         """
@@ -209,6 +339,7 @@ class BECDock(BECWidget, Dock):
         Returns:
             widgets(list): The widgets in the dock.
         """
+        self.materialize()
         return self.widgets
 
     def hide_title_bar(self):
@@ -413,6 +544,7 @@ class BECDock(BECWidget, Dock):
         if self.parent_dock_area:
             self.parent_dock_area.dock_area.docks.pop(self.name(), None)
             self.parent_dock_area.config.docks.pop(self.name(), None)
+        self._pending_widgets.clear()
         self.delete_all()
         self.widgets.clear()
         super().cleanup()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import Literal, Optional
 from weakref import WeakValueDictionary
 
@@ -14,6 +15,7 @@ from bec_widgets.cli.rpc.rpc_register import RPCRegister
 from bec_widgets.utils import ConnectionConfig, WidgetContainerUtils
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.error_popups import SafeSlot
+from bec_widgets.utils.layout_snapshot import dump_snapshot, load_snapshot
 from bec_widgets.utils.name_utils import pascal_to_snake
 from bec_widgets.utils.toolbar import (
     ExpandableMenuAction,
@@ -48,6 +50,31 @@ class DockAreaConfig(ConnectionConfig):
     )
 
 
+def _state_dock_names(state: dict) -> list[str]:
+    """
+    Get the names of all docks in a state of the dock area.
+
+    Args:
+        state(dict): The state, as returned by save_state.
+
+    Returns:
+        list[str]: The names of the docks.
+    """
+    names = []
+
+    def _walk(node):
+        if not isinstance(node, (list, tuple)):
+            return
+        if len(node) == 3 and node[0] == "dock" and isinstance(node[1], str):
+            names.append(node[1])
+            return
+        for child in node:
+            _walk(child)
+
+    _walk([state.get("main"), state.get("float", [])])
+    return names
+
+
 class BECDockArea(BECWidget, QWidget):
     """
     Container for other widgets. Widgets can be added to the dock area and arranged in a grid layout.
@@ -70,6 +97,8 @@ class BECDockArea(BECWidget, QWidget):
         "attach_all",
         "save_state",
         "restore_state",
+        "save_snapshot",
+        "load_snapshot",
     ]
 
     def __init__(
@@ -296,21 +325,109 @@ class BECDockArea(BECWidget, QWidget):
 
     @SafeSlot()
     def restore_state(
-        self, state: dict = None, missing: Literal["ignore", "error"] = "ignore", extra="bottom"
+        self,
+        state: dict = None,
+        missing: Literal["ignore", "error"] = "ignore",
+        extra="bottom",
+        lazy: bool = True,
     ):
         """
         Restore the state of the dock area. If no state is provided, the last state is restored.
+        Docks of the state which do not exist in the dock area are created from their config in
+        config.docks, e.g. when the dock area was created from a saved config.
 
         Args:
             state(dict): The state to restore.
             missing(Literal['ignore','error']): What to do if a dock is missing.
             extra(str): Extra docks that are in the dockarea but that are not mentioned in state will be added to the bottom of the dockarea, unless otherwise specified by the extra argument.
+            lazy(bool): Only build the widgets of created docks once the dock is shown for the first time or its elements are accessed.
         """
         if state is None:
             state = self.config.docks_state
         if state is None:
             return
+        start = time.perf_counter()
+        created = self._create_saved_docks(state, lazy=lazy)
         self.dock_area.restoreState(state, missing=missing, extra=extra)
+        logger.info(
+            f"Restored the state of {self.object_name} with {len(created)} new docks in "
+            f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+        )
+
+    @SafeSlot()
+    def save_snapshot(self, path: str) -> None:
+        """
+        Save the layout of the dock area together with the configs of all docks and widgets
+        to a binary snapshot file.
+
+        Args:
+            path(str): The path of the snapshot file.
+        """
+        start = time.perf_counter()
+        self.save_state()
+        data = dump_snapshot(self.config)
+        with open(path, "wb") as file:
+            file.write(data)
+        logger.info(
+            f"Saved a snapshot of {self.object_name} with {len(self.config.docks)} docks in "
+            f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+        )
+
+    @SafeSlot(popup_error=True)
+    def load_snapshot(self, path: str, trusted: bool = False, lazy: bool = True) -> None:
+        """
+        Replace all docks of the dock area by the layout and docks of a snapshot file.
+
+        Args:
+            path(str): The path of the snapshot file, as written by save_snapshot.
+            trusted(bool): Skip the validation of the configs in the snapshot, for snapshots
+                written by this application.
+            lazy(bool): Only build the widgets of a dock once the dock is shown for the first
+                time or its elements are accessed.
+        """
+        start = time.perf_counter()
+        with open(path, "rb") as file:
+            config = load_snapshot(file.read(), DockAreaConfig, trusted=trusted)
+        self.delete_all()
+        # the dock area keeps its identity
+        self.config = config.model_copy(
+            update={"widget_class": self.__class__.__name__, "gui_id": self.gui_id}
+        )
+        state = self.config.docks_state
+        if state is not None:
+            self._create_saved_docks(state, lazy=lazy, trusted=trusted)
+            self.dock_area.restoreState(state, missing="ignore", extra="bottom")
+        logger.info(
+            f"Loaded the snapshot {path} into {self.object_name} in "
+            f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+        )
+
+    def _create_saved_docks(
+        self, state: dict, lazy: bool = True, trusted: bool = False
+    ) -> list[BECDock]:
+        """
+        Create the docks of a state which do not exist yet from their saved config.
+
+        Args:
+            state(dict): The state to restore.
+            lazy(bool): Defer building the widgets of the docks until they are needed.
+            trusted(bool): Build the widget configs without validating them.
+
+        Returns:
+            list[BECDock]: The created docks.
+        """
+        created = []
+        for name in _state_dock_names(state):
+            dock_config = self.config.docks.get(name)
+            if dock_config is None or name in self.dock_area.docks:
+                continue
+            widgets = dict(dock_config.widgets)
+            dock = self.new(name=name, position=dock_config.position)
+            dock.set_pending_widgets(widgets, trusted=trusted)
+            if not lazy:
+                dock.materialize()
+            created.append(dock)
+        return created
 
     @SafeSlot()
     def save_state(self) -> dict:
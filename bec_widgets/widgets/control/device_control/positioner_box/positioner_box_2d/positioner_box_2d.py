@@ -7,7 +7,6 @@ from typing import Literal
 
 from bec_lib.device import Positioner
 from bec_lib.logger import bec_logger
-from bec_qthemes import material_icon
 from qtpy.QtCore import Signal
 from qtpy.QtGui import QDoubleValidator
 from qtpy.QtWidgets import QDoubleSpinBox
@@ -15,6 +14,7 @@ from qtpy.QtWidgets import QDoubleSpinBox
 from bec_widgets.utils import UILoader
 from bec_widgets.utils.colors import set_theme
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.icon_cache import material_icon
 from bec_widgets.widgets.control.device_control.positioner_box._base import PositionerBoxBase
 from bec_widgets.widgets.control.device_control.positioner_box._base.positioner_box_base import (
     DeviceUpdateUIComponents,
@@ -1,7 +1,6 @@
 from typing import Literal
 
 from bec_lib.logger import bec_logger
-from bec_qthemes import material_icon
 from qtpy.QtCore import Property, Qt, Signal, Slot
 from qtpy.QtWidgets import (
     QCheckBox,
@@ -20,6 +19,7 @@ from qtpy.QtWidgets import (
     QVBoxLayout,
 )
 
+from bec_widgets.utils.icon_cache import material_icon
 from bec_widgets.utils.widget_io import WidgetIO
 from bec_widgets.widgets.control.device_input.base_classes.device_input_base import BECDeviceFilter
 from bec_widgets.widgets.control.device_input.device_line_edit.device_line_edit import (
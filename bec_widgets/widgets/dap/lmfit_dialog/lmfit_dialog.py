@@ -2,12 +2,13 @@ import os
 
 from bec_lib.logger import bec_logger
 from qtpy.QtCore import Signal
-from qtpy.QtWidgets import QPushButton, QTreeWidgetItem, QVBoxLayout, QWidget
+from qtpy.QtWidgets import QPushButton, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
 
 from bec_widgets.utils import UILoader
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.colors import get_accent_colors
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.render_scheduler import get_render_scheduler
 
 logger = bec_logger.logger
 
@@ -65,6 +66,8 @@ class LMFitDialog(BECWidget, QWidget):
         self._move_buttons = []
         self._accent_colors = get_accent_colors()
         self.action_buttons = {}
+        self._summary_items: dict[str, QTreeWidgetItem] = {}
+        self._param_items: dict[str, QTreeWidgetItem] = {}
 
     @property
     def enable_actions(self) -> bool:
@@ -183,7 +186,8 @@ class LMFitDialog(BECWidget, QWidget):
 
     @SafeSlot(dict, dict)
     def update_summary_tree(self, data: dict, metadata: dict):
-        """Update the summary tree with the given data.
+        """Update the summary tree with the given data. The trees are refreshed at most once
+        per frame, with the latest data of the displayed fit curve.
 
         Args:
             data (dict): Data for the DAP Summary.
@@ -198,34 +202,66 @@ class LMFitDialog(BECWidget, QWidget):
             return
         if data is None:
             return
-        self.ui.summary_tree.clear()
-        chi_squared = data.get("chisqr", 0.0)
-        if isinstance(chi_squared, float) or isinstance(chi_squared, int):
-            chi_squared = f"{chi_squared:.{self._deci_precision}f}"
-        else:
-            chi_squared = "None"
-        reduced_chi_squared = data.get("redchi", 0.0)
-        if isinstance(reduced_chi_squared, float) or isinstance(reduced_chi_squared, int):
-            reduced_chi_squared = f"{reduced_chi_squared:.{self._deci_precision}f}"
-        else:
-            reduced_chi_squared = "None"
-        r_squared = data.get("rsquared", 0.0)
-        if isinstance(r_squared, float) or isinstance(r_squared, int):
-            r_squared = f"{r_squared:.{self._deci_precision}f}"
-        else:
-            r_squared = "None"
+        get_render_scheduler().schedule(self, "summary", self._apply_summary)
+
+    def _apply_summary(self):
+        """Show the latest summary and parameters of the displayed fit curve."""
+        data = self.summary_data.get(self.fit_curve_id)
+        if data is None:
+            return
         properties = [
             ("Model", data.get("model", "")),
             ("Method", data.get("method", "")),
-            ("Chi-Squared", chi_squared),
-            ("Reduced Chi-Squared", reduced_chi_squared),
-            ("R-Squared", r_squared),
+            ("Chi-Squared", self._format_value(data.get("chisqr", 0.0))),
+            ("Reduced Chi-Squared", self._format_value(data.get("redchi", 0.0))),
+            ("R-Squared", self._format_value(data.get("rsquared", 0.0))),
             ("Message", data.get("message", "")),
         ]
-        for prop, val in properties:
-            QTreeWidgetItem(self.ui.summary_tree, [prop, val])
+        rows = {prop: [prop, val] for prop, val in properties}
+        self._sync_tree(self.ui.summary_tree, self._summary_items, rows)
         self.update_param_tree(data.get("params", []))
 
+    def _format_value(self, value) -> str:
+        """Format a numeric fit result with the decimal precision of the dialog.
+
+        Args:
+            value: The value.
+
+        Returns:
+            str: The formatted value, "None" for non-numeric values.
+        """
+        if isinstance(value, (float, int)):
+            return f"{value:.{self._deci_precision}f}"
+        return "None"
+
+    @staticmethod
+    def _sync_tree(
+        tree: QTreeWidget, items: dict[str, QTreeWidgetItem], rows: dict[str, list[str]]
+    ):
+        """Update the rows of a tree in place. Rows are identified by their key, existing items
+        are reused and only cells whose text changed are set, such that the selection and scroll
+        position of the tree are kept. New rows are inserted at their position in rows, existing
+        rows keep their position.
+
+        Args:
+            tree (QTreeWidget): The tree.
+            items (dict[str, QTreeWidgetItem]): The items of the tree by key, updated in place.
+            rows (dict[str, list[str]]): The texts of the columns by key, in display order.
+        """
+        for key in [key for key in items if key not in rows]:
+            item = items.pop(key)
+            tree.takeTopLevelItem(tree.indexOfTopLevelItem(item))
+        for index, (key, texts) in enumerate(rows.items()):
+            item = items.get(key)
+            if item is None:
+                item = QTreeWidgetItem(texts)
+                items[key] = item
+                tree.insertTopLevelItem(min(index, tree.topLevelItemCount()), item)
+                continue
+            for column, text in enumerate(texts):
+                if item.text(column) != text:
+                    item.setText(column, text)
+
     def _update_summary_data(self, curve_id: str, data: dict):
         """Update the summary data with the given data.
 
@@ -239,48 +275,60 @@ class LMFitDialog(BECWidget, QWidget):
         self.fit_curve_id = curve_id
 
     def update_param_tree(self, params):
-        """Update the parameter tree with the given parameters.
+        """Update the parameter tree with the given parameters. Rows are identified by the name
+        of the parameter and reused.
 
         Args:
             params (list): List of LMFit parameters for the fit curve.
         """
-        self._move_buttons = []
-        self.ui.param_tree.clear()
+        rows = {
+            param[0]: [param[0], self._format_value(param[1]), self._format_value(param[7])]
+            for param in params
+        }
+        for param_name in [name for name in self.action_buttons if name not in rows]:
+            self.action_buttons.pop(param_name)
+        self._sync_tree(self.ui.param_tree, self._param_items, rows)
         for param in params:
             param_name = param[0]
-            param_value = param[1]
-            if isinstance(param_value, float) or isinstance(param_value, int):
-                param_value = f"{param_value:.{self._deci_precision}f}"
-            else:
-                param_value = "None"
-            param_std = param[7]
-            if isinstance(param_std, float) or isinstance(param_std, int):
-                param_std = f"{param_std:.{self._deci_precision}f}"
-            else:
-                param_std = "None"
-
-            tree_item = QTreeWidgetItem(self.ui.param_tree, [param_name, param_value, param_std])
-            if param_name in self.active_action_list:  # pylint: disable=unsupported-membership-test
-                # Create a push button to move the motor to a specific position
-                widget = QWidget()
-                button = QPushButton(f"Move to {param_name}")
-                button.clicked.connect(self._create_move_action(param_name, param[1]))
-                if self.enable_actions is True:
-                    button.setEnabled(True)
-                else:
-                    button.setEnabled(False)
-                button.setStyleSheet(
-                    f"""
-                    QPushButton:enabled {{ background-color: {self._accent_colors.success.name()};color: white; }} 
-                    QPushButton:disabled {{ background-color: grey;color: white; }}
-                    """
-                )
+            tree_item = self._param_items[param_name]
+            # pylint: disable=unsupported-membership-test
+            if param_name not in self.active_action_list:
+                if self.action_buttons.pop(param_name, None) is not None:
+                    self.ui.param_tree.removeItemWidget(tree_item, 3)
+                continue
+            button = self.action_buttons.get(param_name)
+            if button is None:
+                button = self._create_move_button(param_name)
                 self.action_buttons[param_name] = button
+                widget = QWidget()
                 layout = QVBoxLayout()
-                layout.addWidget(self.action_buttons[param_name])
+                layout.addWidget(button)
                 layout.setContentsMargins(0, 0, 0, 0)
                 widget.setLayout(layout)
                 self.ui.param_tree.setItemWidget(tree_item, 3, widget)
+            else:
+                button.clicked.disconnect()
+            button.clicked.connect(self._create_move_action(param_name, param[1]))
+        self._move_buttons = list(self.action_buttons.values())
+
+    def _create_move_button(self, param_name: str) -> QPushButton:
+        """Create a push button to move the motor to the fitted value of a parameter.
+
+        Args:
+            param_name (str): The name of the parameter.
+
+        Returns:
+            QPushButton: The button.
+        """
+        button = QPushButton(f"Move to {param_name}")
+        button.setEnabled(self.enable_actions is True)
+        button.setStyleSheet(
+            f"""
+            QPushButton:enabled {{ background-color: {self._accent_colors.success.name()};color: white; }} 
+            QPushButton:disabled {{ background-color: grey;color: white; }}
+            """
+        )
+        return button
 
     def _create_move_action(self, param_name: str, param_value: float) -> callable:
         """Create a move action for the given parameter name and value.
@@ -299,12 +347,23 @@ class LMFitDialog(BECWidget, QWidget):
 
     def populate_curve_list(self):
         """Populate the curve list with the available fit curves."""
+        listed = {self.ui.curve_list.item(row).text() for row in range(self.ui.curve_list.count())}
         for curve_name in self.summary_data:
-            self.ui.curve_list.addItem(curve_name)
+            if curve_name not in listed:
+                self.ui.curve_list.addItem(curve_name)
 
     def refresh_curve_list(self):
-        """Refresh the curve list with the updated data."""
-        self.ui.curve_list.clear()
+        """Refresh the curve list with the updated data. Items of curves that are still
+        available are kept, such that the selection is not lost."""
+        curve_list = self.ui.curve_list
+        # removing the current item must not display the details of another curve
+        curve_list.blockSignals(True)
+        try:
+            for row in reversed(range(curve_list.count())):
+                if curve_list.item(row).text() not in self.summary_data:
+                    curve_list.takeItem(row)
+        finally:
+            curve_list.blockSignals(False)
         self.populate_curve_list()
 
     def display_fit_details(self, current):
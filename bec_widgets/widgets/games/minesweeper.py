@@ -2,7 +2,6 @@ import enum
 import random
 import time
 
-from bec_qthemes import material_icon
 from qtpy.QtCore import QSize, Qt, QTimer, Signal, Slot
 from qtpy.QtGui import QBrush, QColor, QPainter, QPen
 from qtpy.QtWidgets import (
@@ -17,6 +16,7 @@ from qtpy.QtWidgets import (
 )
 
 from bec_widgets.utils.bec_widget import BECWidget
+from bec_widgets.utils.icon_cache import material_icon
 
 NUM_COLORS = {
     1: QColor("#f44336"),
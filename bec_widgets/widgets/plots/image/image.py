@@ -13,6 +13,8 @@ from qtpy.QtWidgets import QWidget
 from bec_widgets.utils import ConnectionConfig
 from bec_widgets.utils.colors import Colors
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.render_scheduler import get_render_scheduler
+from bec_widgets.utils.shm_transport import SharedMemoryFrame, SharedMemoryFrameReader
 from bec_widgets.utils.toolbar import MaterialIconAction, SwitchableToolBarAction
 from bec_widgets.widgets.plots.image.image_item import ImageItem
 from bec_widgets.widgets.plots.image.toolbar_bundles.image_selection import (
@@ -135,6 +137,15 @@ class Image(PlotBase):
 
         self.plot_item.addItem(self._main_image)
         self.scan_id = None
+        self._pending_image: np.ndarray | SharedMemoryFrame | None = None
+        self._pending_fallback: np.ndarray | None = None
+        self._shm_reader: SharedMemoryFrameReader | None = None
+        # double buffer for frames from shared memory: the displayed frame and the buffer the
+        # next frame is read into, swapped once a frame was read completely
+        self._shm_buffer: np.ndarray | None = None
+        self._shm_scratch: np.ndarray | None = None
+        # 1D monitors build up the image row by row and therefore have to receive every message
+        self.suspend_when_hidden(self.on_image_update_2d)
 
         # Default Color map to plasma
         self.color_map = "plasma"
@@ -844,11 +855,7 @@ class Image(PlotBase):
             self._main_image.buffer = []
             self._main_image.max_len = 0
         image_buffer = self.adjust_image_buffer(self._main_image, data)
-        if self._color_bar is not None:
-            self._color_bar.blockSignals(True)
-        self._main_image.set_data(image_buffer)
-        if self._color_bar is not None:
-            self._color_bar.blockSignals(False)
+        self._schedule_image(image_buffer)
 
     def adjust_image_buffer(self, image: ImageItem, new_data: np.ndarray) -> np.ndarray:
         """
@@ -892,15 +899,68 @@ class Image(PlotBase):
 
         Args:
             msg(dict): The message containing the data.
-            metadata(dict): The metadata associated with the message.
+            metadata(dict): The metadata associated with the message. If it describes a frame in
+                shared memory, the frame is read from there when it is drawn.
         """
-        data = msg["data"]
+        frame = SharedMemoryFrame.from_metadata(metadata)
+        if frame is None:
+            self._schedule_image(msg["data"])
+            return
+        # frames which are replaced before the next repaint are never read
+        data = msg.get("data")
+        self._schedule_image(frame, fallback=data if data is not None and np.size(data) else None)
+
+    def _schedule_image(
+        self, data: np.ndarray | SharedMemoryFrame, fallback: np.ndarray | None = None
+    ):
+        """
+        Show the given data on the next frame of the render scheduler. If new data arrives
+        before that, only the latest data is processed and drawn.
+
+        Args:
+            data(np.ndarray | SharedMemoryFrame): The image data or a frame in shared memory.
+            fallback(np.ndarray, optional): Data to show if the frame in shared memory is not
+                available.
+        """
+        self._pending_image = data
+        self._pending_fallback = fallback
+        get_render_scheduler().schedule(self, "main_image", self._apply_pending_image)
+
+    def _apply_pending_image(self):
+        data, self._pending_image = self._pending_image, None
+        if isinstance(data, SharedMemoryFrame):
+            data = self._read_shared_frame(data)
+        if data is None or self._main_image is None:
+            return
         if self._color_bar is not None:
             self._color_bar.blockSignals(True)
         self._main_image.set_data(data)
         if self._color_bar is not None:
             self._color_bar.blockSignals(False)
 
+    def _read_shared_frame(self, frame: SharedMemoryFrame) -> np.ndarray | None:
+        """
+        Read a frame from shared memory into the scratch buffer, which becomes the display
+        buffer once the frame was read completely. A frame overwritten by the producer while it
+        is read therefore never reaches the displayed data. The buffers are reused as long as
+        the shape and dtype of the frames do not change. Falls back to the data sent along with
+        the message if the shared memory is not accessible or the frame was already overwritten.
+
+        Args:
+            frame(SharedMemoryFrame): The descriptor of the frame.
+
+        Returns:
+            np.ndarray | None: The frame, None if it is not available.
+        """
+        fallback, self._pending_fallback = self._pending_fallback, None
+        if self._shm_reader is None:
+            self._shm_reader = SharedMemoryFrameReader()
+        data = self._shm_reader.read(frame, out=self._shm_scratch)
+        if data is None:
+            return fallback
+        self._shm_buffer, self._shm_scratch = data, self._shm_buffer
+        return data
+
     ################################################################################
     # Clean up
     ################################################################################
@@ -925,6 +985,14 @@ class Image(PlotBase):
         """
         Disconnect the image update signals and clean up the image.
         """
+        get_render_scheduler().cancel(self)
+        self._pending_image = None
+        self._pending_fallback = None
+        if self._shm_reader is not None:
+            self._shm_reader.close()
+            self._shm_reader = None
+        self._shm_buffer = None
+        self._shm_scratch = None
         # Main Image cleanup
         if self._main_image.config.monitor is not None:
             self.disconnect_monitor(self._main_image.config.monitor)
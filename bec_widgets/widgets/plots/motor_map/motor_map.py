@@ -14,6 +14,7 @@ from qtpy.QtWidgets import QHBoxLayout, QMainWindow, QWidget
 from bec_widgets.utils import Colors, ConnectionConfig
 from bec_widgets.utils.colors import set_theme
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.render_scheduler import get_render_scheduler
 from bec_widgets.utils.settings_dialog import SettingsDialog
 from bec_widgets.utils.toolbar import MaterialIconAction
 from bec_widgets.widgets.plots.motor_map.settings.motor_map_settings import MotorMapSettings
@@ -178,10 +179,8 @@ class MotorMap(PlotBase):
         self.coord_label = None
         self.motor_map_settings = None
 
-        # Connect slots
-        self.proxy_update_plot = pg.SignalProxy(
-            self.update_signal, rateLimit=25, slot=self._update_plot
-        )
+        # Connect slots, the plot is updated at most once per frame by the render scheduler
+        self.update_signal.connect(self._schedule_plot_update)
         self._add_motor_map_settings()
 
     ################################################################################
@@ -469,6 +468,11 @@ class MotorMap(PlotBase):
     ################################################################################
     # BEC Update Methods
     ################################################################################
+    @SafeSlot()
+    def _schedule_plot_update(self):
+        """Update the motor map plot on the next frame of the render scheduler."""
+        get_render_scheduler().schedule(self, "motor_map", self._update_plot)
+
     @SafeSlot()
     def _update_plot(self, _=None):
         """Update the motor map plot."""
@@ -796,6 +800,7 @@ class MotorMap(PlotBase):
         return data
 
     def cleanup(self):
+        get_render_scheduler().cancel(self)
         self.motor_selection_bundle.cleanup()
         super().cleanup()
 
@@ -134,6 +134,8 @@ class MultiWaveform(PlotBase):
         self.old_scan_id = None
         self.scan_id = None
         self.connected = False
+        # only the latest trace is processed while the widget is hidden
+        self.suspend_when_hidden(self.on_monitor_1d_update)
         self._current_highlight_index = 0
         self._curves = deque()
         self.visible_curves = []
@@ -10,6 +10,7 @@ from qtpy.QtWidgets import QHBoxLayout, QLabel, QMainWindow, QVBoxLayout, QWidge
 
 from bec_widgets.utils import ConnectionConfig, Crosshair, EntryValidator
 from bec_widgets.utils.bec_widget import BECWidget
+from bec_widgets.utils.colors import apply_graphics_theme
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
 from bec_widgets.utils.fps_counter import FPSCounter
 from bec_widgets.utils.plot_indicator_items import BECArrowItem, BECTickItem
@@ -91,7 +92,7 @@ class PlotBase(BECWidget, QWidget):
         self.state_manager = WidgetStateManager(self)
 
         # Entry Validator
-        self.entry_validator = EntryValidator(self.dev)
+        self.entry_validator = EntryValidator(self.dev, self.bec_dispatcher)
 
         # Base widgets elements
         self._popups = popups
@@ -126,6 +127,7 @@ class PlotBase(BECWidget, QWidget):
 
     def apply_theme(self, theme: str):
         self.round_plot_widget.apply_theme(theme)
+        apply_graphics_theme(self.plot_widget, theme)
 
     def _init_ui(self):
         self.layout.addWidget(self.layout_manager)
@@ -974,6 +976,7 @@ class PlotBase(BECWidget, QWidget):
             self.crosshair.update_markers()
 
     def cleanup(self):
+        self.entry_validator.cleanup()
         self.unhook_crosshair()
         self.unhook_fps_monitor(delete_label=True)
         self.tick_item.cleanup()
@@ -0,0 +1,200 @@
+"""
+Cache for signal data read from the scan history.
+
+Reading a signal of a historical scan (``scan_item.devices[device][entry].read()``) goes to the
+HDF5 file of the scan every time it is called, and every access to ``client.history`` creates a
+new container for the scan. When flipping through the history with several plots, the same
+signals are therefore read over and over again. The cache keeps the data of recently used signals,
+keyed by scan id, device and entry, and allows to load missing signals in a background thread.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+from bec_lib import bec_logger
+
+logger = bec_logger.logger
+
+DEFAULT_MAX_SIGNALS = 512
+
+SignalKey = tuple[str, str, str]
+
+
+class ScanHistoryCache:
+    """
+    Bounded LRU cache of signal data read from scan history items. The cache is thread-safe so
+    that signals can be loaded from a worker thread while the GUI thread reads from it.
+
+    Args:
+        max_signals(int): Maximum number of signals to keep. The least recently used signals
+            are dropped first.
+    """
+
+    def __init__(self, max_signals: int = DEFAULT_MAX_SIGNALS):
+        self.max_signals = max_signals
+        self._data: OrderedDict[SignalKey, dict] = OrderedDict()
+        self._pending: set[SignalKey] = set()
+        self._lock = threading.Condition()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: SignalKey) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, scan_id: str, device: str, entry: str) -> dict | None:
+        """
+        Get the cached data of a signal without reading it from the scan item.
+
+        Args:
+            scan_id(str): The scan id.
+            device(str): The device name.
+            entry(str): The signal entry.
+
+        Returns:
+            dict | None: The signal data as returned by read(), i.e. with the keys 'value' and
+                'timestamp'. Empty if the signal is not part of the scan. None if the signal is
+                not cached.
+        """
+        key = (scan_id, device, entry)
+        with self._lock:
+            data = self._data.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def read(self, scan_item, scan_id: str, device: str, entry: str) -> dict:
+        """
+        Get the data of a signal, reading it from the scan item if it is not cached yet.
+
+        Args:
+            scan_item: The scan history item, i.e. a ScanDataContainer.
+            scan_id(str): The scan id of the scan item.
+            device(str): The device name.
+            entry(str): The signal entry.
+
+        Returns:
+            dict: The signal data. Empty if the signal is not part of the scan.
+        """
+        data = self.get(scan_id, device, entry)
+        if data is None:
+            data = self._read_signal(scan_item, device, entry)
+            self._store((scan_id, device, entry), data)
+        return data
+
+    def missing(self, scan_id: str, signals: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+        Get the signals which are not cached.
+
+        Args:
+            scan_id(str): The scan id.
+            signals(Iterable[tuple[str, str]]): The (device, entry) pairs to check.
+
+        Returns:
+            list[tuple[str, str]]: The (device, entry) pairs which still have to be loaded.
+        """
+        with self._lock:
+            return [
+                signal for signal in dict.fromkeys(signals) if (scan_id, *signal) not in self._data
+            ]
+
+    def load(self, scan_item, scan_id: str, signals: Iterable[tuple[str, str]]) -> None:
+        """
+        Load the given signals of a scan item into the cache. Signals that are already cached are
+        skipped; for signals that are being loaded by another thread, the method waits until
+        they are available. Meant to be run in a worker thread.
+
+        Args:
+            scan_item: The scan history item, i.e. a ScanDataContainer.
+            scan_id(str): The scan id of the scan item.
+            signals(Iterable[tuple[str, str]]): The (device, entry) pairs to load.
+        """
+        requested = [(scan_id, *signal) for signal in dict.fromkeys(signals)]
+        with self._lock:
+            keys = [key for key in requested if key not in self._data and key not in self._pending]
+            self._pending.update(keys)
+        try:
+            for key in keys:
+                self._store(key, self._read_signal(scan_item, key[1], key[2]))
+        finally:
+            with self._lock:
+                self._pending.difference_update(keys)
+                self._lock.notify_all()
+                self._lock.wait_for(lambda: self._pending.isdisjoint(requested))
+
+    def prefetch(self, history, indices: Iterable[int], signals: list[tuple[str, str]]) -> None:
+        """
+        Load the given signals of the scans at the given history indices. Meant to be run in a
+        worker thread, e.g. to load the neighbours of the scan that is currently displayed.
+
+        Args:
+            history: The scan history of the client.
+            indices(Iterable[int]): The history indices of the scans to load.
+            signals(list[tuple[str, str]]): The (device, entry) pairs to load.
+        """
+        for index in indices:
+            try:
+                scan_item = history[index]
+                scan_id = scan_item.metadata["bec"]["scan_id"]
+            except (IndexError, KeyError, TypeError, AttributeError):
+                continue
+            self.load(scan_item, scan_id, signals)
+
+    def clear(self, scan_id: str | None = None) -> None:
+        """
+        Remove signals from the cache.
+
+        Args:
+            scan_id(str, optional): Only remove the signals of this scan. Defaults to None, which
+                removes all signals.
+        """
+        with self._lock:
+            if scan_id is None:
+                self._data.clear()
+                return
+            for key in [key for key in self._data if key[0] == scan_id]:
+                del self._data[key]
+
+    @staticmethod
+    def _read_signal(scan_item, device: str, entry: str) -> dict:
+        signal = scan_item.devices.get(device, {}).get(entry, None)
+        if signal is None:
+            return {}
+        try:
+            return signal.read()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"Could not read {device}-{entry} from the scan history: {exc}")
+            return {}
+
+    def _store(self, key: SignalKey, data: dict) -> None:
+        with self._lock:
+            self._data[key] = data
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_signals:
+                self._data.popitem(last=False)
+
+
+_scan_history_cache: ScanHistoryCache | None = None
+
+
+def get_scan_history_cache() -> ScanHistoryCache:
+    """
+    Get the scan history cache shared by all plots of the process.
+
+    Returns:
+        ScanHistoryCache: The shared cache.
+    """
+    global _scan_history_cache  # pylint: disable=global-statement
+    if _scan_history_cache is None:
+        _scan_history_cache = ScanHistoryCache()
+    return _scan_history_cache
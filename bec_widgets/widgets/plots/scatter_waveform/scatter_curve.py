@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field, ValidationError, field_validator
 from qtpy import QtCore
 
 from bec_widgets.utils import BECConnector, Colors, ConnectionConfig
+from bec_widgets.utils.colors import get_colormap_qcolors
 
 if TYPE_CHECKING:  # pragma: no cover
     from bec_widgets.widgets.plots.scatter_waveform.scatter_waveform import ScatterWaveform
@@ -176,10 +177,10 @@ class ScatterCurve(BECConnector, pg.PlotDataItem):
         z_min, z_max = np.min(data_z), np.max(data_z)
 
         if z_max != z_min:  # Ensure that there is a range in the z values
-            z_values_norm = (data_z - z_min) / (z_max - z_min)
-            colormap = pg.colormap.get(colormap)  # using colormap from global settings
-            colors = [colormap.map(z, mode="qcolor") for z in z_values_norm]
-            return colors
+            z_values_norm = (np.asarray(data_z) - z_min) / (z_max - z_min)
+            lut = get_colormap_qcolors(colormap)  # using colormap from global settings
+            indices = np.rint(z_values_norm * (len(lut) - 1)).astype(int)
+            return [lut[i] for i in indices.tolist()]
         else:
             return None
 
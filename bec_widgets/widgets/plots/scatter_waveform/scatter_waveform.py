@@ -15,6 +15,7 @@ from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
 from bec_widgets.utils.settings_dialog import SettingsDialog
 from bec_widgets.utils.toolbar import MaterialIconAction
 from bec_widgets.widgets.plots.plot_base import PlotBase, UIMode
+from bec_widgets.widgets.plots.scan_history_cache import get_scan_history_cache
 from bec_widgets.widgets.plots.scatter_waveform.scatter_curve import (
     ScatterCurve,
     ScatterCurveConfig,
@@ -120,6 +121,9 @@ class ScatterWaveform(PlotBase):
         self.old_scan_id = None
         self.scan_id = None
         self.scan_item = None
+        self._history_cache = get_scan_history_cache()
+        self._history_loading_scan_id = None
+        self._history_loaded_scan_id = None
 
         # Scan status update loop
         self.bec_dispatcher.connect_slot(self.on_scan_status, MessageEndpoints.scan_status())
@@ -417,9 +421,13 @@ class ScatterWaveform(PlotBase):
             y_data = data.get(y_name, {}).get(y_entry, {}).get(access_key, None)
             z_data = data.get(z_name, {}).get(z_entry, {}).get(access_key, None)
         else:
-            x_data = data.get(x_name, {}).get(x_entry, {}).read().get("value", None)
-            y_data = data.get(y_name, {}).get(y_entry, {}).read().get("value", None)
-            z_data = data.get(z_name, {}).get(z_entry, {}).read().get("value", None)
+            signals = [(x_name, x_entry), (y_name, y_entry), (z_name, z_entry)]
+            if not self._history_data_ready(signals):
+                return
+            x_data, y_data, z_data = (
+                self._history_cache.read(self.scan_item, self.scan_id, name, entry).get("value")
+                for name, entry in signals
+            )
 
         self._main_curve.set_data(x=x_data, y=y_data, z=z_data)
 
@@ -492,6 +500,65 @@ class ScatterWaveform(PlotBase):
         self.scan_id = metadata["bec"]["scan_id"]
 
         self.sync_signal_update.emit()
+        self._prefetch_history_neighbours(scan_index)
+
+    def _history_data_ready(self, signals: list[tuple[str, str]]) -> bool:
+        """
+        Check whether the given signals of the current history scan are cached. If not, they are
+        loaded in a background thread and the curve is updated once they are available.
+
+        Args:
+            signals(list[tuple[str, str]]): The (device, entry) pairs of the curve.
+
+        Returns:
+            bool: True if the curve can be updated from the cache.
+        """
+        if self._history_loaded_scan_id == self.scan_id:
+            return True
+        missing = self._history_cache.missing(self.scan_id, signals)
+        if not missing:
+            return True
+        if self._history_loading_scan_id != self.scan_id:
+            self._history_loading_scan_id = self.scan_id
+            self.submit_task(
+                self._history_cache.load,
+                self.scan_item,
+                self.scan_id,
+                missing,
+                on_complete=self._on_history_data_loaded,
+            )
+        return False
+
+    @SafeSlot()
+    def _on_history_data_loaded(self):
+        """
+        Update the curve once the signals of a history scan were loaded in the background.
+        """
+        if self._history_loading_scan_id != self.scan_id:
+            self._history_loading_scan_id = None
+            return
+        self._history_loaded_scan_id = self._history_loading_scan_id
+        self._history_loading_scan_id = None
+        self.sync_signal_update.emit()
+
+    def _prefetch_history_neighbours(self, scan_index: int):
+        """
+        Load the signals of the scans next to the given history index in the background.
+
+        Args:
+            scan_index(int): The history index of the scan currently displayed.
+        """
+        config = self._main_curve.config
+        devices = [config.x_device, config.y_device, config.z_device]
+        if any(device is None for device in devices):
+            return
+        history_length = len(self.client.history)
+        index = scan_index % history_length
+        neighbours = [i for i in (index - 1, index + 1) if 0 <= i < history_length]
+        if not neighbours:
+            return
+        signals = [(device.name, device.entry) for device in devices]
+        self.submit_task(self._history_cache.prefetch, self.client.history, neighbours, signals)
 
     ################################################################################
     # Cleanup
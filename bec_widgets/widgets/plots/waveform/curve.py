@@ -6,9 +6,12 @@ import numpy as np
 import pyqtgraph as pg
 from bec_lib import bec_logger
 from pydantic import BaseModel, Field, field_validator
+from pyqtgraph.graphicsItems.PlotDataItem import PlotDataset
 from qtpy import QtCore
 
 from bec_widgets.utils import BECConnector, Colors, ConnectionConfig
+from bec_widgets.utils.render_scheduler import get_render_scheduler
+from bec_widgets.widgets.plots.waveform.utils.lod_pyramid import MinMaxPyramid
 
 if TYPE_CHECKING:  # pragma: no cover
     from bec_widgets.widgets.plots.waveform.waveform import Waveform
@@ -57,6 +60,8 @@ class CurveConfig(ConnectionConfig):
 
 
 class Curve(BECConnector, pg.PlotDataItem):
+    # Curves with more points are drawn from a min/max pyramid, see _lod_display_dataset
+    LOD_MIN_POINTS = 2000
     USER_ACCESS = [
         "remove",
         "_rpc_id",
@@ -99,6 +104,9 @@ class Curve(BECConnector, pg.PlotDataItem):
         self.dap_params = None
         self.dap_summary = None
         self.slice_index = None
+        self._lod = MinMaxPyramid()
+        self._lod_dataset = None
+        self._pending_data: tuple[np.ndarray, np.ndarray] | None = None
         if kwargs:
             self.set(**kwargs)
         # Activate setClipToView, to boost performance for large datasets per default
@@ -310,12 +318,39 @@ class Curve(BECConnector, pg.PlotDataItem):
         self.apply_config()
         self.parent_item.update_with_scan_history(-1)
 
+    def setData(self, *args, **kwargs):
+        """Set the data of the curve, replacing data scheduled with schedule_data."""
+        self._pending_data = None
+        super().setData(*args, **kwargs)
+
+    def schedule_data(self, x: np.ndarray, y: np.ndarray):
+        """
+        Set the data of the curve on the next frame of the render scheduler. If new data is
+        scheduled before that, only the latest data is drawn.
+
+        Args:
+            x(np.ndarray): The x data.
+            y(np.ndarray): The y data.
+        """
+        self._pending_data = (x, y)
+        owner = self.parent_item if self.parent_item is not None else self.getViewWidget()
+        if owner is None:
+            self._apply_pending_data()
+            return
+        get_render_scheduler().schedule(owner, self, self._apply_pending_data)
+
+    def _apply_pending_data(self):
+        if self._pending_data is not None:
+            self.setData(*self._pending_data)
+
     def get_data(self) -> tuple[np.ndarray | None, np.ndarray | None]:
         """
-        Get the data of the curve.
+        Get the data of the curve, including data which is scheduled but not drawn yet.
         Returns:
             tuple[np.ndarray,np.ndarray]: X and Y data of the curve.
         """
+        if self._pending_data is not None:
+            return self._pending_data
         try:
             x_data, y_data = self.getOriginalDataset()
         except TypeError:
@@ -334,6 +369,67 @@ class Curve(BECConnector, pg.PlotDataItem):
         self.parent_item.remove_curve(self.name())
         super().remove()
 
+    def _getDisplayDataset(self) -> PlotDataset | None:
+        """
+        Override of pg.PlotDataItem._getDisplayDataset which draws long curves from a min/max
+        pyramid instead of processing the full data set on every view change.
+        """
+        dataset = self._lod_display_dataset()
+        if dataset is None:
+            return super()._getDisplayDataset()
+        return dataset
+
+    def _lod_display_dataset(self) -> PlotDataset | None:
+        """
+        Get the data to display from the level-of-detail pyramid. The pyramid level is chosen
+        from the pixel width of the view, such that the number of drawn points does not depend
+        on the length of the curve.
+
+        Returns:
+            PlotDataset | None: The dataset to display, or None if the curve is not suited for
+                level-of-detail rendering, e.g. because it is short, its x data is not
+                monotonic, clipping to the view is disabled or a data transformation
+                (log, fft, ...) is active.
+        """
+        dataset = self._dataset
+        if getattr(self, "_lod", None) is None or dataset is None:
+            return None
+        if len(dataset.y) < self.LOD_MIN_POINTS:
+            return None
+        opts = self.opts
+        if not (opts["clipToView"] or opts["autoDownsample"]):
+            # the display data is not recomputed on view range changes
+            return None
+        if (
+            opts["fftMode"]
+            or opts["derivativeMode"]
+            or opts["phasemapMode"]
+            or opts["subtractMeanMode"]
+            or True in opts["logMode"]
+        ):
+            return None
+        view = self.getViewBox()
+        if view is None or view.width() <= 0:
+            return None
+        if dataset is not self._lod_dataset:
+            self._lod.set_data(dataset.x, dataset.y)
+            self._lod_dataset = dataset
+        if not self._lod.monotonic:
+            return None
+        if self._datasetDisplay is not None and not self.property("xViewRangeWasChanged"):
+            return self._datasetDisplay
+
+        if view.autoRangeEnabled()[0]:
+            x_min = x_max = None
+        else:
+            view_range = view.viewRect()
+            x_min, x_max = view_range.left(), view_range.right()
+        x, y = self._lod.envelope(x_min, x_max, max_points=2 * int(view.width()))
+        self._datasetDisplay = PlotDataset(x, y, True, dataset.yAllFinite)
+        self.setProperty("xViewRangeWasChanged", False)
+        self.setProperty("yViewRangeWasChanged", False)
+        return self._datasetDisplay
+
     def _get_displayed_data(self) -> tuple[np.ndarray, np.ndarray]:
         """
         Get the displayed data of the curve.
@@ -4,7 +4,6 @@ import json
 from typing import TYPE_CHECKING
 
 from bec_lib.logger import bec_logger
-from bec_qthemes._icon.material_icons import material_icon
 from qtpy.QtGui import QColor
 from qtpy.QtWidgets import (
     QColorDialog,
@@ -25,6 +24,7 @@ from qtpy.QtWidgets import (
 from bec_widgets.utils import ConnectionConfig, EntryValidator
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.colors import Colors
+from bec_widgets.utils.icon_cache import material_icon
 from bec_widgets.utils.toolbar import MaterialIconAction, ModularToolBar
 from bec_widgets.widgets.control.device_input.device_line_edit.device_line_edit import (
     DeviceLineEdit,
@@ -0,0 +1,228 @@
+"""
+Level-of-detail engine for long curves.
+
+The MinMaxPyramid keeps a multi-resolution envelope of a curve: level 0 is the raw data, every
+further level groups FACTOR buckets of the level below and stores their first x value together
+with the minimum and maximum y value. To draw a range of the curve, the level whose bucket count
+matches the pixel width of the view is used, such that the number of points handed to the
+renderer is bounded by the screen resolution instead of by the size of the data. The pyramid is
+extended incrementally when data is appended, which is the common case for scan data.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+FACTOR = 4
+
+
+class _GrowingArray:
+    """Float array with amortised O(1) appends."""
+
+    def __init__(self, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=float)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def view(self) -> np.ndarray:
+        """The valid part of the array, without copying."""
+        return self._data[: self._size]
+
+    def extend(self, values: np.ndarray):
+        """
+        Append values to the array.
+
+        Args:
+            values(np.ndarray): The values to append.
+        """
+        new_size = self._size + len(values)
+        if new_size > len(self._data):
+            data = np.empty(max(new_size, 2 * len(self._data)), dtype=float)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+        self._data[self._size : new_size] = values
+        self._size = new_size
+
+    def clear(self):
+        """Remove all values."""
+        self._size = 0
+
+
+class _Level:
+    """Buckets of one level of the pyramid."""
+
+    def __init__(self):
+        self.x = _GrowingArray()
+        self.y_min = _GrowingArray()
+        self.y_max = _GrowingArray()
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max envelope of a curve.
+
+    The pyramid only gives a faithful representation for monotonically increasing x data,
+    which can be checked with :attr:`monotonic`.
+    """
+
+    def __init__(self):
+        self._x = _GrowingArray()
+        self._y = _GrowingArray()
+        self._levels: list[_Level] = []
+        self.monotonic = True
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    @property
+    def levels(self) -> int:
+        """Number of levels, including the raw data."""
+        return len(self._levels) + 1
+
+    def clear(self):
+        """Remove all data."""
+        self._x.clear()
+        self._y.clear()
+        self._levels.clear()
+        self.monotonic = True
+
+    def set_data(self, x: np.ndarray, y: np.ndarray):
+        """
+        Set the data of the curve. If the new data starts with the current data, only the new
+        points are added to the pyramid; otherwise the pyramid is rebuilt.
+
+        Args:
+            x(np.ndarray): The x data.
+            y(np.ndarray): The y data.
+        """
+        size = len(self._x)
+        if 0 < size <= len(x) and self._extends_current(x, y):
+            self.append(x[size:], y[size:])
+            return
+        self.clear()
+        self.append(x, y)
+
+    def append(self, x: np.ndarray, y: np.ndarray):
+        """
+        Append points to the curve and update the pyramid.
+
+        Args:
+            x(np.ndarray): The x data of the new points.
+            y(np.ndarray): The y data of the new points.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(x) == 0:
+            return
+        if self.monotonic:
+            previous = self._x.view[-1:]
+            self.monotonic = bool(np.all(np.diff(np.concatenate((previous, x))) >= 0))
+        self._x.extend(x)
+        self._y.extend(y)
+        self._update_levels()
+
+    def envelope(
+        self, x_min: float | None, x_max: float | None, max_points: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the curve between x_min and x_max reduced to at most about max_points points. The
+        range is extended by one point on each side, such that the curve reaches the borders of
+        the view. Reduced data is returned as peak pairs, i.e. every bucket contributes its
+        maximum and its minimum at the x position of its first point.
+
+        Args:
+            x_min(float|None): Lower bound of the x range. None for the start of the data.
+            x_max(float|None): Upper bound of the x range. None for the end of the data.
+            max_points(int): Maximum number of points to return, typically the pixel width of
+                the view times two.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The x and y data to draw.
+        """
+        x = self._x.view
+        start = 0 if x_min is None else max(int(np.searchsorted(x, x_min, side="left")) - 1, 0)
+        stop = len(x) if x_max is None else min(int(np.searchsorted(x, x_max, "right")) + 1, len(x))
+        if stop - start <= max_points or not self._levels:
+            return x[start:stop], self._y.view[start:stop]
+        # every bucket is drawn as two points
+        max_buckets = max(max_points // 2, 1)
+        level = 1
+        while level < len(self._levels) and (stop - start) / FACTOR**level > max_buckets:
+            level += 1
+        parts_x, parts_min, parts_max = self._buckets(level, start, stop)
+        bucket_x = np.concatenate(parts_x)
+        y_min = np.concatenate(parts_min)
+        y_max = np.concatenate(parts_max)
+        out_x = np.repeat(bucket_x, 2)
+        out_y = np.empty(len(out_x))
+        out_y[0::2] = y_max
+        out_y[1::2] = y_min
+        return out_x, out_y
+
+    def _buckets(self, level: int, start: int, stop: int) -> tuple[list, list, list]:
+        """
+        Collect the buckets of the given level covering the raw index range [start, stop). The
+        part of the range which is not covered by complete buckets of the level is filled
+        from the levels below.
+        """
+        if level == 0:
+            y = self._y.view[start:stop]
+            return [self._x.view[start:stop]], [y], [y]
+        bucket_size = FACTOR**level
+        buckets = self._levels[level - 1]
+        first = start // bucket_size
+        last = min(-(-stop // bucket_size), len(buckets))
+        parts = (
+            [buckets.x.view[first:last]],
+            [buckets.y_min.view[first:last]],
+            [buckets.y_max.view[first:last]],
+        )
+        covered = max(last, first) * bucket_size
+        if covered < stop:
+            tail = self._buckets(level - 1, max(covered, start), stop)
+            for part, tail_part in zip(parts, tail):
+                part.extend(tail_part)
+        return parts
+
+    def _update_levels(self):
+        source_x = self._x.view
+        source_min = source_max = self._y.view
+        index = 0
+        while True:
+            complete = len(source_x) // FACTOR
+            if complete == 0:
+                return
+            if index == len(self._levels):
+                self._levels.append(_Level())
+            level = self._levels[index]
+            done = len(level)
+            if complete > done:
+                chunk = slice(done * FACTOR, complete * FACTOR)
+                level.x.extend(source_x[chunk][::FACTOR])
+                level.y_min.extend(np.fmin.reduce(source_min[chunk].reshape(-1, FACTOR), axis=1))
+                level.y_max.extend(np.fmax.reduce(source_max[chunk].reshape(-1, FACTOR), axis=1))
+            source_x, source_min, source_max = level.x.view, level.y_min.view, level.y_max.view
+            index += 1
+
+    def _extends_current(self, x: np.ndarray, y: np.ndarray) -> bool:
+        """
+        Check whether the given data starts with the current data. Only the first and the last
+        point of the current data are compared, which is sufficient for data that is appended
+        to, e.g. during a scan.
+        """
+        last = len(self._x) - 1
+        try:
+            return bool(
+                x[0] == self._x.view[0]
+                and x[last] == self._x.view[last]
+                and y[0] == self._y.view[0]
+                and y[last] == self._y.view[last]
+            )
+        except (TypeError, ValueError):
+            return False
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from typing import Literal
+from contextlib import contextmanager
+from typing import Iterator, Literal
 
 import lmfit
 import numpy as np
@@ -17,10 +18,12 @@ from bec_widgets.utils.bec_signal_proxy import BECSignalProxy
 from bec_widgets.utils.colors import Colors, set_theme
 from bec_widgets.utils.container_utils import WidgetContainerUtils
 from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.render_scheduler import get_render_scheduler
 from bec_widgets.utils.settings_dialog import SettingsDialog
 from bec_widgets.utils.toolbar import MaterialIconAction
 from bec_widgets.widgets.dap.lmfit_dialog.lmfit_dialog import LMFitDialog
 from bec_widgets.widgets.plots.plot_base import PlotBase
+from bec_widgets.widgets.plots.scan_history_cache import get_scan_history_cache
 from bec_widgets.widgets.plots.waveform.curve import Curve, CurveConfig, DeviceSignal
 from bec_widgets.widgets.plots.waveform.settings.curve_settings.curve_setting import CurveSetting
 from bec_widgets.widgets.plots.waveform.utils.roi_manager import WaveformROIManager
@@ -95,6 +98,7 @@ class Waveform(PlotBase):
         "color_palette",
         "color_palette.setter",
         "plot",
+        "plot_many",
         "add_dap_curve",
         "remove_curve",
         "update_with_scan_history",
@@ -130,6 +134,16 @@ class Waveform(PlotBase):
     ):
         if config is None:
             config = WaveformConfig(widget_class=self.__class__.__name__)
+        # Curves by label in the order of the plot item, and by source; the version is
+        # increased whenever curves are added or removed
+        self._curve_index: dict[str, Curve] = {}
+        self._curves_by_source: dict[str, dict[str, Curve]] = {
+            "device": {},
+            "dap": {},
+            "custom": {},
+        }
+        self._curve_version = 0
+        self._categorisation: tuple[tuple, str] | None = None
         super().__init__(
             parent=parent, config=config, client=client, gui_id=gui_id, popups=popups, **kwargs
         )
@@ -140,12 +154,19 @@ class Waveform(PlotBase):
         self._slice_index = None
         self._dap_curves = []
         self._mode: Literal["none", "sync", "async", "mixed"] = "none"
+        # state of an ongoing batch, see batch()
+        self._batch_depth = 0
+        self._batch_added: list[Curve] = []
+        self._batch_removed = False
 
         # Scan data
         self.old_scan_id = None
         self.scan_id = None
         self.scan_item = None
         self.readout_priority = None
+        self._history_cache = get_scan_history_cache()
+        self._history_loading_scan_id = None
+        self._history_loaded_scan_id = None
         self.x_axis_mode = {
             "name": "auto",
             "entry": None,
@@ -165,13 +186,9 @@ class Waveform(PlotBase):
         self.bec_dispatcher.connect_slot(self.on_scan_status, MessageEndpoints.scan_status())
         self.bec_dispatcher.connect_slot(self.on_scan_progress, MessageEndpoints.scan_progress())
 
-        # Curve update loop
-        self.proxy_update_sync = pg.SignalProxy(
-            self.sync_signal_update, rateLimit=25, slot=self.update_sync_curves
-        )
-        self.proxy_update_async = pg.SignalProxy(
-            self.async_signal_update, rateLimit=25, slot=self.update_async_curves
-        )
+        # Curve update loop, coalesced to one update per frame by the render scheduler
+        self.sync_signal_update.connect(self._schedule_sync_update)
+        self.async_signal_update.connect(self._schedule_async_update)
         self.proxy_dap_request = BECSignalProxy(
             self.request_dap_update, rateLimit=25, slot=self.request_dap, timeout=10.0
         )
@@ -537,13 +554,14 @@ class Waveform(PlotBase):
         """
         try:
             curve_configs = json.loads(json_data)
-            self.clear_all()
-            for cfg_dict in curve_configs:
-                if cfg_dict.get("source") == "custom":
-                    logger.warning(f"Custom source curve '{cfg_dict['label']}' not loaded.")
-                    continue
-                config = CurveConfig(**cfg_dict)
-                self._add_curve(config=config)
+            with self.batch():
+                self.clear_all()
+                for cfg_dict in curve_configs:
+                    if cfg_dict.get("source") == "custom":
+                        logger.warning(f"Custom source curve '{cfg_dict['label']}' not loaded.")
+                        continue
+                    config = CurveConfig(**cfg_dict)
+                    self._add_curve(config=config)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode JSON: {e}")
 
@@ -555,7 +573,7 @@ class Waveform(PlotBase):
         Returns:
             list: List of curves.
         """
-        return [item for item in self.plot_item.curves if isinstance(item, Curve)]
+        return list(self._curve_index.values())
 
     ################################################################################
     # High Level methods for API
@@ -647,9 +665,7 @@ class Waveform(PlotBase):
         # Decide label if not provided
         if label is None:
             if source == "custom":
-                label = WidgetContainerUtils.generate_unique_name(
-                    "Curve", [c.object_name for c in self.curves]
-                )
+                label = WidgetContainerUtils.generate_unique_name("Curve", self._curve_index)
             else:
                 label = f"{y_name}-{y_entry}"
 
@@ -679,6 +695,86 @@ class Waveform(PlotBase):
 
         return curve
 
+    @SafeSlot(popup_error=True)
+    def plot_many(self, configs: list[dict]) -> list[Curve]:
+        """
+        Plot several curves at once. Colors, the categorisation of the device curves and the
+        data refresh are done once for all curves instead of once per curve.
+
+        Args:
+            configs(list[dict]): The keyword arguments of `plot` for every curve, e.g.
+                [{"arg1": "samx"}, {"y_name": "bpm4i", "dap": "GaussianModel"}].
+
+        Returns:
+            list[Curve]: The curve objects.
+        """
+        with self.batch():
+            return [self.plot(**config) for config in configs]
+
+    @contextmanager
+    def batch(self) -> Iterator[Waveform]:
+        """
+        Context manager to add or remove many curves at once. Within the batch, curves are
+        added without colors and without categorising the device curves or refreshing their
+        data; this is done once when the outermost batch exits.
+
+        Example:
+            >>> with waveform.batch():
+            ...     for name in ["samx", "samy", "samz"]:
+            ...         waveform.plot(name)
+
+        Yields:
+            Waveform: The waveform itself.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._finish_batch()
+
+    def _finish_batch(self):
+        """
+        Assign the colors of the curves added in the batch, categorise the device curves and
+        refresh the data once.
+        """
+        all_curves = self.curves
+        current = {id(curve) for curve in all_curves}
+        added = [curve for curve in self._batch_added if id(curve) in current]
+        added_ids = {id(curve) for curve in added}
+        removed = self._batch_removed
+        self._batch_added = []
+        self._batch_removed = False
+        if removed:
+            self._refresh_colors()
+        elif added:
+            color_list = Colors.golden_angle_color(
+                colormap=self.config.color_palette, num=max(10, len(all_curves)), format="HEX"
+            )
+            for index, curve in enumerate(all_curves):
+                if id(curve) in added_ids and not curve.config.color:
+                    curve.config.color = color_list[index]
+                    curve.apply_config()
+        if not added and not removed:
+            return
+
+        sources = {curve.config.source for curve in added}
+        if "device" in sources and self.scan_item is None:
+            # without a live scan, the device curves show the data of the latest scan
+            self.update_with_scan_history(-1)
+        self._categorise_device_curves()
+        if "device" in sources:
+            for curve in added:
+                if curve in self._async_curves:
+                    self._setup_async_curve(curve)
+            self.async_signal_update.emit()
+            self.sync_signal_update.emit()
+        if "dap" in sources:
+            self.setup_dap_for_scan()
+            self.roi_enable.emit(True)  # Enable the ROI toolbar action
+            self.request_dap()
+
     ################################################################################
     # Curve Management Methods
     @SafeSlot()
@@ -774,9 +870,7 @@ class Waveform(PlotBase):
         label = config.label
         if not label:
             # Fallback label
-            label = WidgetContainerUtils.generate_unique_name(
-                "Curve", [c.object_name for c in self.curves]
-            )
+            label = WidgetContainerUtils.generate_unique_name("Curve", self._curve_index)
             config.label = label
 
         # Check for duplicates
@@ -799,6 +893,13 @@ class Waveform(PlotBase):
         if config.source == "custom" and x_data is not None and y_data is not None:
             curve.setData(x_data, y_data)
 
+        # Within a batch, the rest is done once for all curves in _finish_batch
+        if self._batch_depth:
+            self._batch_added.append(curve)
+            if config.source == "dap":
+                self._dap_curves.append(curve)
+            return curve
+
         # If device => schedule BEC updates
         if config.source == "device":
             if self.scan_item is None:
@@ -828,13 +929,34 @@ class Waveform(PlotBase):
         """
         curve = Curve(config=config, name=name, parent_item=self)
         self.plot_item.addItem(curve)
-        self._categorise_device_curves()
+        self._curve_index[name] = curve
+        self._curves_by_source[config.source][name] = curve
+        self._curve_version += 1
+        if not self._batch_depth:
+            self._categorise_device_curves()
         return curve
 
-    def _generate_color_from_palette(self) -> str:
+    def _remove_curve_object(self, curve: Curve):
+        """
+        Low-level removal of a curve from the plot item and the curve index.
+
+        Args:
+            curve (Curve): The curve to remove.
+        """
+        self.plot_item.removeItem(curve)
+        self._curve_index.pop(curve.name(), None)
+        # the source of the config may have been edited since the curve was added
+        for curves in self._curves_by_source.values():
+            curves.pop(curve.name(), None)
+        self._curve_version += 1
+
+    def _generate_color_from_palette(self) -> str | None:
         """
         Generate a color for the next new curve, based on the current number of curves.
+        Within a batch, None is returned and the color is assigned when the batch exits.
         """
+        if self._batch_depth:
+            return None
         current_count = len(self.curves)
         color_list = Colors.golden_angle_color(
             colormap=self.config.color_palette, num=max(10, current_count + 1), format="HEX"
@@ -868,6 +990,7 @@ class Waveform(PlotBase):
         self._dap_curves = []
         self._sync_curves = []
         self._async_curves = []
+        self._categorisation = None
         for curve in curve_list:
             self.remove_curve(curve.name())
         if self.crosshair is not None:
@@ -883,12 +1006,10 @@ class Waveform(PlotBase):
         Return(Curve|None): The curve object if found, None otherwise.
         """
         if isinstance(curve, int):
-            if curve < len(self.curves):
+            if curve < len(self._curve_index):
                 return self.curves[curve]
         elif isinstance(curve, str):
-            for c in self.curves:
-                if c.name() == curve:
-                    return c
+            return self._curve_index.get(curve)
         return None
 
     @SafeSlot(int, popup_error=True)
@@ -905,6 +1026,9 @@ class Waveform(PlotBase):
         elif isinstance(curve, str):
             self._remove_curve_by_name(curve)
 
+        if self._batch_depth:
+            self._batch_removed = True
+            return
         self._refresh_colors()
         self._categorise_device_curves()
 
@@ -915,11 +1039,10 @@ class Waveform(PlotBase):
         Args:
             name(str): Name of the curve to be removed.
         """
-        for curve in self.curves:
-            if curve.name() == name:
-                self.plot_item.removeItem(curve)
-                self._curve_clean_up(curve)
-                return
+        curve = self._curve_index.get(name)
+        if curve is not None:
+            self._remove_curve_object(curve)
+            self._curve_clean_up(curve)
 
     def _remove_curve_by_order(self, N: int):
         """
@@ -928,9 +1051,9 @@ class Waveform(PlotBase):
         Args:
             N(int): Order of the curve to be removed.
         """
-        if N < len(self.curves):
+        if N < len(self._curve_index):
             curve = self.curves[N]
-            self.plot_item.removeItem(curve)
+            self._remove_curve_object(curve)
             self._curve_clean_up(curve)
 
         else:
@@ -959,9 +1082,9 @@ class Waveform(PlotBase):
             self.dap_summary.remove_dap_data(curve.name())
 
         # find a corresponding dap curve and remove it
-        for c in self.curves:
+        for c in list(self._curves_by_source["dap"].values()):
             if c.config.parent_label == curve.name():
-                self.plot_item.removeItem(c)
+                self._remove_curve_object(c)
                 self._curve_clean_up(c)
 
     def _check_curve_id(self, curve_id: str) -> bool:
@@ -974,10 +1097,7 @@ class Waveform(PlotBase):
         Returns:
             bool: True if the curve ID exists, False otherwise.
         """
-        curve_ids = [curve.name() for curve in self.curves]
-        if curve_id in curve_ids:
-            return True
-        return False
+        return curve_id in self._curve_index
 
     def _find_curve_by_label(self, label: str) -> Curve | None:
         """
@@ -989,10 +1109,7 @@ class Waveform(PlotBase):
         Returns:
             Curve|None: The curve object if found, None otherwise.
         """
-        for c in self.curves:
-            if c.name() == label:
-                return c
-        return None
+        return self._curve_index.get(label)
 
     ################################################################################
     # BEC Update Methods
@@ -1081,6 +1198,16 @@ class Waveform(PlotBase):
             scan_devices = self.scan_item.devices
             return (scan_devices, "value")
 
+    @SafeSlot()
+    def _schedule_sync_update(self):
+        """Update the sync curves on the next frame of the render scheduler."""
+        get_render_scheduler().schedule(self, "sync_curves", self.update_sync_curves)
+
+    @SafeSlot()
+    def _schedule_async_update(self):
+        """Update the async curves on the next frame of the render scheduler."""
+        get_render_scheduler().schedule(self, "async_curves", self.update_async_curves)
+
     def update_sync_curves(self):
         """
         Update the sync curves with the latest data from the scan.
@@ -1089,15 +1216,15 @@ class Waveform(PlotBase):
             logger.info("No scan executed so far; skipping device curves categorisation.")
             return "none"
         data, access_key = self._fetch_scan_data_and_access()
+        if access_key == "value" and not self._history_data_ready():
+            return
         for curve in self._sync_curves:
             device_name = curve.config.signal.name
             device_entry = curve.config.signal.entry
             if access_key == "val":
                 device_data = data.get(device_name, {}).get(device_entry, {}).get(access_key, None)
             else:
-                device_data = (
-                    data.get(device_name, {}).get(device_entry, {}).read().get("value", None)
-                )
+                device_data = self._read_history_signal(device_name, device_entry).get("value")
             x_data = self._get_x_data(device_name, device_entry)
             if x_data is not None:
                 if len(x_data) == 1:
@@ -1124,6 +1251,8 @@ class Waveform(PlotBase):
 
         """
         data, access_key = self._fetch_scan_data_and_access()
+        if access_key == "value" and not self._history_data_ready():
+            return
 
         for curve in self._async_curves:
             device_name = curve.config.signal.name
@@ -1131,9 +1260,7 @@ class Waveform(PlotBase):
             if access_key == "val":  # live access
                 device_data = data.get(device_name, {}).get(device_entry, {}).get(access_key, None)
             else:  # history access
-                device_data = (
-                    data.get(device_name, {}).get(device_entry, {}).read().get("value", None)
-                )
+                device_data = self._read_history_signal(device_name, device_entry).get("value")
 
             # if shape is 2D cast it into 1D and take the last waveform
             if len(np.shape(device_data)) > 1:
@@ -1258,7 +1385,7 @@ class Waveform(PlotBase):
             if plot_mode in ["index", "auto", "timestamp"]:
                 data_plot_x = np.linspace(0, len(data_plot_y) - 1, len(data_plot_y))
                 self._auto_adjust_async_curve_settings(curve, len(data_plot_y))
-                curve.setData(data_plot_x, data_plot_y)
+                curve.schedule_data(data_plot_x, data_plot_y)
                 # Move on in the loop
                 continue
 
@@ -1283,7 +1410,7 @@ class Waveform(PlotBase):
 
             # Plot the data
             self._auto_adjust_async_curve_settings(curve, len(data_plot_y))
-            curve.setData(data_plot_x, data_plot_y)
+            curve.schedule_data(data_plot_x, data_plot_y)
 
         self.request_dap_update.emit()
 
@@ -1301,6 +1428,10 @@ class Waveform(PlotBase):
         symbol will be activated and downsampling will be deactivated. Maximum points will be
         5x the limit.
 
+        Note:
+            Long curves with monotonic x data are drawn from the level-of-detail pyramid of the
+            Curve, the pyqtgraph downsampling is only used as fallback for other curves.
+
         Args:
             curve(Curve): The curve to adjust.
             data_length(int): The length of the data.
@@ -1465,7 +1596,7 @@ class Waveform(PlotBase):
             if access_key == "val":  # live data
                 x_data = data.get(x_name, {}).get(x_entry, {}).get(access_key, [0])
             else:  # history data
-                x_data = data.get(x_name, {}).get(x_entry, {}).read().get("value", [0])
+                x_data = self._read_history_signal(x_name, x_entry).get("value", [0])
             new_suffix = f" [custom: {x_name}-{x_entry}]"
 
         # 2 User wants timestamp
@@ -1473,7 +1604,9 @@ class Waveform(PlotBase):
             if access_key == "val":  # live
                 timestamps = data[device_name][device_entry].timestamps
             else:  # history data
-                timestamps = data[device_name][device_entry].read().get("timestamp", [0])
+                timestamps = self._read_history_signal(device_name, device_entry).get(
+                    "timestamp", [0]
+                )
             x_data = timestamps
             new_suffix = " [timestamp]"
 
@@ -1500,7 +1633,7 @@ class Waveform(PlotBase):
                 if access_key == "val":
                     x_data = data.get(x_name, {}).get(x_entry, {}).get(access_key, None)
                 else:
-                    x_data = data.get(x_name, {}).get(x_entry, {}).read().get("value", None)
+                    x_data = self._read_history_signal(x_name, x_entry).get("value", None)
                 new_suffix = f" [auto: {x_name}-{x_entry}]"
         self._update_x_label_suffix(new_suffix)
         return x_data
@@ -1548,6 +1681,7 @@ class Waveform(PlotBase):
     def _categorise_device_curves(self) -> str:
         """
         Categorise the device curves into sync and async based on the readout priority.
+        The result is cached until the scan or the set of curves changes.
         """
         if self.scan_item is None:
             self.update_with_scan_history(-1)
@@ -1555,6 +1689,10 @@ class Waveform(PlotBase):
                 logger.info("No scan executed so far; skipping device curves categorisation.")
                 return "none"
 
+        key = (self.scan_id, id(self.scan_item), self._curve_version)
+        if self._categorisation is not None and self._categorisation[0] == key:
+            return self._categorisation[1]
+
         if hasattr(self.scan_item, "live_data"):
             readout_priority = self.scan_item.status_message.info["readout_priority"]  # live data
         else:
@@ -1567,13 +1705,11 @@ class Waveform(PlotBase):
         found_sync = False
         mode = "sync"
 
-        readout_priority_async = self._ensure_str_list(readout_priority.get("async", []))
-        readout_priority_sync = self._ensure_str_list(readout_priority.get("monitored", []))
+        readout_priority_async = set(self._ensure_str_list(readout_priority.get("async", [])))
+        readout_priority_sync = set(self._ensure_str_list(readout_priority.get("monitored", [])))
 
-        # Iterate over all curves
-        for curve in self.curves:
-            if curve.config.source != "device":
-                continue
+        # Iterate over all device curves
+        for curve in self._curves_by_source["device"].values():
             dev_name = curve.config.signal.name
             if dev_name in readout_priority_async:
                 self._async_curves.append(curve)
@@ -1595,6 +1731,7 @@ class Waveform(PlotBase):
             mode = "sync"
 
         logger.info(f"Scan {self.scan_id} => mode={self._mode}")
+        self._categorisation = (key, mode)
         return mode
 
     @SafeSlot(int)
@@ -1642,6 +1779,108 @@ class Waveform(PlotBase):
         self.scan_id = metadata["bec"]["scan_id"]
 
         self._emit_signal_update()
+        self._prefetch_history_neighbours(scan_index)
+
+    def _history_signals(self) -> list[tuple[str, str]]:
+        """
+        Get the signals which have to be read from the scan history to plot the current scan,
+        i.e. the signals of all device curves and the signal of the x axis.
+
+        Returns:
+            list[tuple[str, str]]: The (device, entry) pairs.
+        """
+        signals = [
+            (curve.config.signal.name, curve.config.signal.entry)
+            for curve in self._curves_by_source["device"].values()
+        ]
+        x_name = self.x_axis_mode["name"]
+        if x_name in ["timestamp", "index"]:
+            return signals
+        if x_name is None or x_name == "auto":
+            try:
+                x_name = self._ensure_str_list(
+                    self.scan_item.metadata["bec"]["scan_report_devices"]
+                )[0]
+            except (AttributeError, IndexError, KeyError, TypeError):
+                return signals
+            x_entry = None
+        else:
+            x_entry = self.x_axis_mode.get("entry", None)
+        if x_entry is None:
+            x_entry = self.entry_validator.validate_signal(x_name, None)
+        signals.append((x_name, x_entry))
+        return signals
+
+    def _history_data_ready(self) -> bool:
+        """
+        Check whether all signals needed for the current history scan are cached. If not, the
+        missing signals are loaded in a background thread and the curves are updated once
+        they are available.
+
+        Returns:
+            bool: True if the curves can be updated from the cache.
+        """
+        if self._history_loaded_scan_id == self.scan_id:
+            # Already loaded once; signals evicted in the meantime are read on demand.
+            return True
+        missing = self._history_cache.missing(self.scan_id, self._history_signals())
+        if not missing:
+            return True
+        if self._history_loading_scan_id != self.scan_id:
+            self._history_loading_scan_id = self.scan_id
+            self.submit_task(
+                self._history_cache.load,
+                self.scan_item,
+                self.scan_id,
+                missing,
+                on_complete=self._on_history_data_loaded,
+            )
+        return False
+
+    @SafeSlot()
+    def _on_history_data_loaded(self):
+        """
+        Update the curves once the signals of a history scan were loaded in the background.
+        """
+        if self._history_loading_scan_id != self.scan_id:
+            # The scan changed while loading; the new scan triggers its own update.
+            self._history_loading_scan_id = None
+            return
+        self._history_loaded_scan_id = self._history_loading_scan_id
+        self._history_loading_scan_id = None
+        self.sync_signal_update.emit()
+        self.async_signal_update.emit()
+
+    def _read_history_signal(self, device_name: str, device_entry: str) -> dict:
+        """
+        Read the data of a signal of the current history scan through the scan history cache.
+
+        Args:
+            device_name(str): The name of the device.
+            device_entry(str): The entry of the device.
+
+        Returns:
+            dict: The signal data with the keys 'value' and 'timestamp'.
+        """
+        return self._history_cache.read(self.scan_item, self.scan_id, device_name, device_entry)
+
+    def _prefetch_history_neighbours(self, scan_index: int):
+        """
+        Load the signals of the scans next to the given history index in the background, such
+        that browsing through the history does not have to wait for the data.
+
+        Args:
+            scan_index(int): The history index of the scan currently displayed.
+        """
+        history_length = len(self.client.history)
+        if history_length == 0:
+            return
+        index = scan_index % history_length
+        neighbours = [i for i in (index - 1, index + 1) if 0 <= i < history_length]
+        signals = self._history_signals()
+        if not neighbours or not signals:
+            return
+        self.submit_task(self._history_cache.prefetch, self.client.history, neighbours, signals)
 
     def _emit_signal_update(self):
         self._categorise_device_curves()
@@ -1762,6 +2001,7 @@ class Waveform(PlotBase):
         """
         Cleanup the widget by disconnecting signals and closing dialogs.
         """
+        get_render_scheduler().cancel(self)
         self.proxy_dap_request.cleanup()
         self.clear_all()
         if self.curve_settings_dialog is not None:
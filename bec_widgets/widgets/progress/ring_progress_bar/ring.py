@@ -133,11 +133,14 @@ class Ring(BECConnector, QObject):
         Args:
             value(int | float): Value for the ring widget
         """
-        self.config.value = round(
+        value = round(
             float(max(self.config.min_value, min(self.config.max_value, value))),
             self.config.precision,
         )
-        self.parent_progress_widget.update()
+        if value == self.config.value:
+            return
+        self.config.value = value
+        self.parent_progress_widget.update_ring(self)
 
     def set_color(self, color: str | tuple):
         """
@@ -148,7 +151,7 @@ class Ring(BECConnector, QObject):
         """
         self.config.color = color
         self.color = self.convert_color(color)
-        self.parent_progress_widget.update()
+        self.parent_progress_widget.update_ring(self)
 
     def set_background(self, color: str | tuple):
         """
@@ -159,7 +162,7 @@ class Ring(BECConnector, QObject):
         """
         self.config.background_color = color
         self.color = self.convert_color(color)
-        self.parent_progress_widget.update()
+        self.parent_progress_widget.update_ring(self)
 
     def set_line_width(self, width: int):
         """
@@ -179,9 +182,11 @@ class Ring(BECConnector, QObject):
             min_value(int | float): Minimum value for the ring widget
             max_value(int | float): Maximum value for the ring widget
         """
+        if self.config.min_value == min_value and self.config.max_value == max_value:
+            return
         self.config.min_value = min_value
         self.config.max_value = max_value
-        self.parent_progress_widget.update()
+        self.parent_progress_widget.update_ring(self)
 
     def set_start_angle(self, start_angle: int):
         """
@@ -192,7 +197,7 @@ class Ring(BECConnector, QObject):
         """
         self.config.start_position = start_angle
         self.start_position = start_angle * 16
-        self.parent_progress_widget.update()
+        self.parent_progress_widget.update_ring(self)
 
     @staticmethod
     def convert_color(color):
@@ -222,11 +227,7 @@ class Ring(BECConnector, QObject):
             device(str): Device name for the device readback mode, only used when mode is "device"
         """
         if mode == "manual":
-            self.bec_dispatcher.disconnect_slot(
-                getattr(self, self.config.connections.slot), self.config.connections.endpoint
-            )
-            self.config.connections.slot = None
-            self.config.connections.endpoint = None
+            self.reset_connection()
         elif mode == "scan":
             self.set_connections("on_scan_progress", MessageEndpoints.scan_progress())
         elif mode == "device":
@@ -234,32 +235,53 @@ class Ring(BECConnector, QObject):
 
         self.parent_progress_widget.enable_auto_updates(False)
 
-    def set_connections(self, slot: str, endpoint: str | EndpointInfo):
+    def set_connections(self, slot: str, endpoint: str | EndpointInfo) -> bool:
         """
-        Set the connections for the ring widget
+        Set the connections for the ring widget. The dispatcher subscriptions are only touched
+        if the slot or the endpoint differ from the current connection.
 
         Args:
             slot(str): Slot for the ring widget update. Can be "on_scan_progress" or "on_device_readback".
             endpoint(str | EndpointInfo): Endpoint for the ring widget update. Endpoint has to match the slot type.
+
+        Returns:
+            bool: True if the connection was changed.
         """
-        if self.config.connections.endpoint == endpoint and self.config.connections.slot == slot:
-            return
-        if self.config.connections.slot is not None:
-            self.bec_dispatcher.disconnect_slot(
-                getattr(self, self.config.connections.slot), self.config.connections.endpoint
-            )
+        if self.is_connected_to(slot, endpoint):
+            return False
+        self._disconnect_current()
         self.config.connections = ProgressbarConnections(slot=slot, endpoint=endpoint)
         self.bec_dispatcher.connect_slot(getattr(self, slot), endpoint)
+        return True
+
+    def is_connected_to(self, slot: str | None, endpoint: str | EndpointInfo | None) -> bool:
+        """
+        Check whether the ring is connected to the given slot and endpoint.
+
+        Args:
+            slot(str|None): Slot for the ring widget update.
+            endpoint(str|EndpointInfo|None): Endpoint for the ring widget update.
+
+        Returns:
+            bool: True if the current connection matches.
+        """
+        if isinstance(endpoint, EndpointInfo):
+            endpoint = endpoint.endpoint
+        return self.config.connections.slot == slot and self.config.connections.endpoint == endpoint
 
     def reset_connection(self):
         """
         Reset the connections for the ring widget. Disconnect the current slot and endpoint.
         """
-        self.bec_dispatcher.disconnect_slot(
-            self.config.connections.slot, self.config.connections.endpoint
-        )
+        self._disconnect_current()
         self.config.connections = ProgressbarConnections()
 
+    def _disconnect_current(self):
+        connections = self.config.connections
+        if connections.slot is None or connections.endpoint is None:
+            return
+        self.bec_dispatcher.disconnect_slot(getattr(self, connections.slot), connections.endpoint)
+
     def on_scan_progress(self, msg, meta):
         """
         Update the ring widget with the scan progress.
@@ -270,9 +292,9 @@ class Ring(BECConnector, QObject):
         """
         current_RID = meta.get("RID", None)
         if current_RID != self.RID:
+            self.RID = current_RID
             self.set_min_max_values(0, msg.get("max_value", 100))
         self.set_value(msg.get("value", 0))
-        self.parent_progress_widget.update()
 
     def on_device_readback(self, msg, meta):
         """
@@ -289,4 +311,3 @@ class Ring(BECConnector, QObject):
         device = endpoint.split("/")[-1]
         value = msg.get("signals").get(device).get("value")
         self.set_value(value)
-        self.parent_progress_widget.update()
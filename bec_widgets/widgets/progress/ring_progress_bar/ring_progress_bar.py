@@ -3,16 +3,18 @@ from __future__ import annotations
 from typing import Literal, Optional
 
 import pyqtgraph as pg
-from bec_lib.endpoints import MessageEndpoints
+from bec_lib.endpoints import EndpointInfo, MessageEndpoints
 from bec_lib.logger import bec_logger
 from pydantic import Field, field_validator
 from pydantic_core import PydanticCustomError
 from qtpy import QtCore, QtGui
 from qtpy.QtCore import QSize, Slot
+from qtpy.QtGui import QRegion
 from qtpy.QtWidgets import QSizePolicy, QWidget
 
 from bec_widgets.utils import Colors, ConnectionConfig, EntryValidator
 from bec_widgets.utils.bec_widget import BECWidget
+from bec_widgets.utils.render_scheduler import get_render_scheduler
 from bec_widgets.widgets.progress.ring_progress_bar.ring import Ring, RingConfig
 
 logger = bec_logger.logger
@@ -124,6 +126,7 @@ class RingProgressBar(BECWidget, QWidget):
         # For updating bar behaviour
         self._auto_updates = True
         self._rings = []
+        self._dirty_region = QRegion()
 
         if num_bars is not None:
             self.config.num_bars = max(
@@ -492,52 +495,56 @@ class RingProgressBar(BECWidget, QWidget):
                 if report_instructions:
                     instruction_type = list(report_instructions[0].keys())[0]
                     if instruction_type == "scan_progress":
-                        self._hook_scan_progress(ring_index=0)
+                        self._reconcile_rings(
+                            [("on_scan_progress", MessageEndpoints.scan_progress(), None, None)],
+                            adjust_number_of_bars=False,
+                        )
                     elif instruction_type == "readback":
                         devices = report_instructions[0].get("readback").get("devices")
                         start = report_instructions[0].get("readback").get("start")
                         end = report_instructions[0].get("readback").get("end")
-                        if self.config.num_bars != len(devices):
-                            self.set_number_of_bars(len(devices))
-                        for index, device in enumerate(devices):
-                            self._hook_readback(index, device, start[index], end[index])
+                        self._reconcile_rings(
+                            [
+                                (
+                                    "on_device_readback",
+                                    MessageEndpoints.device_readback(device),
+                                    start[index],
+                                    end[index],
+                                )
+                                for index, device in enumerate(devices)
+                            ]
+                        )
                     else:
                         logger.error(f"{instruction_type} not supported yet.")
 
                     # elif instruction_type == "device_progress":
                     #     print("hook device_progress")
 
-    def _hook_scan_progress(self, ring_index: int = None):
-        """
-        Hook the scan progress to the progress bars.
-
-        Args:
-            ring_index(int): Index of the progress bar to hook the scan progress to.
-        """
-        if ring_index is not None:
-            ring = self._find_ring_by_index(ring_index)
-        else:
-            ring = self._rings[0]
-
-        if ring.config.connections.slot == "on_scan_progress":
-            return
-        else:
-            ring.set_connections("on_scan_progress", MessageEndpoints.scan_progress())
-
-    def _hook_readback(self, bar_index: int, device: str, min: float | int, max: float | int):
+    def _reconcile_rings(
+        self,
+        desired: list[tuple[str, EndpointInfo, float | int | None, float | int | None]],
+        adjust_number_of_bars: bool = True,
+    ):
         """
-        Hook the readback values to the progress bars.
+        Bring the connections of the rings in line with the desired state. Rings whose slot,
+        endpoint and limits already match are not touched, such that repeated scan queue status
+        messages do not cause any (un)subscriptions or repaints.
 
         Args:
-            bar_index(int): Index of the progress bar to hook the readback values to.
-            device(str): Device to readback values from.
-            min(float|int): Minimum value for the progress bar.
-            max(float|int): Maximum value for the progress bar.
-        """
-        ring = self._find_ring_by_index(bar_index)
-        ring.set_min_max_values(min, max)
-        endpoint = MessageEndpoints.device_readback(device)
-        ring.set_connections("on_device_readback", endpoint)
+            desired(list[tuple]): (slot, endpoint, min, max) for the rings, starting with the
+                outer ring. Limits that are None are left unchanged.
+            adjust_number_of_bars(bool): If True, the number of rings is adjusted to the number
+                of desired connections.
+        """
+        if adjust_number_of_bars and self.config.num_bars != len(desired):
+            self.set_number_of_bars(len(desired))
+        for index, (slot, endpoint, min_value, max_value) in enumerate(desired):
+            if index >= len(self._rings):
+                break
+            ring = self._find_ring_by_index(index)
+            ring.set_connections(slot, endpoint)
+            if min_value is not None and max_value is not None:
+                ring.set_min_max_values(min_value, max_value)
 
     def _adjust_list_to_bars(self, items: list) -> list:
         """
@@ -575,30 +582,79 @@ class RingProgressBar(BECWidget, QWidget):
             )
         return bar_index
 
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    def _ring_rect(self, index: int) -> QtCore.QRect:
+        """
+        Get the rectangle in which the arc of the ring with the given index is drawn.
+
+        Args:
+            index(int): Index of the ring.
+
+        Returns:
+            QtCore.QRect: The rectangle of the arc.
+        """
         size = min(self.width(), self.height())
+        max_line_width = max(ring.config.line_width for ring in self._rings)
         rect = QtCore.QRect(0, 0, size, size)
-        rect.adjust(
-            max(ring.config.line_width for ring in self._rings),
-            max(ring.config.line_width for ring in self._rings),
-            -max(ring.config.line_width for ring in self._rings),
-            -max(ring.config.line_width for ring in self._rings),
+        rect.adjust(max_line_width, max_line_width, -max_line_width, -max_line_width)
+        offset = self.config.gap * index
+        return QtCore.QRect(
+            rect.left() + offset,
+            rect.top() + offset,
+            rect.width() - 2 * offset,
+            rect.height() - 2 * offset,
         )
 
+    def _ring_region(self, index: int) -> QRegion:
+        """
+        Get the region covered by the ring with the given index, including its line width.
+
+        Args:
+            index(int): Index of the ring.
+
+        Returns:
+            QRegion: The annulus covered by the ring.
+        """
+        rect = self._ring_rect(index)
+        # half of the line width plus some margin for the antialiased edges and round caps
+        margin = self._rings[index].config.line_width // 2 + 2
+        outer = QRegion(rect.adjusted(-margin, -margin, margin, margin), QRegion.Ellipse)
+        inner = QRegion(rect.adjusted(margin, margin, -margin, -margin), QRegion.Ellipse)
+        return outer.subtracted(inner)
+
+    def update_ring(self, ring: Ring):
+        """
+        Schedule a repaint of the region of a single ring. The repaints of all rings are
+        collected and requested once per frame of the render scheduler.
+
+        Args:
+            ring(Ring): The ring to repaint.
+        """
+        try:
+            region = self._ring_region(self._rings.index(ring))
+        except ValueError:
+            # ring is not yet part of the widget
+            region = QRegion(self.rect())
+        self._dirty_region = self._dirty_region.united(region)
+        get_render_scheduler().schedule(self, "rings", self._repaint_dirty_region)
+
+    def _repaint_dirty_region(self):
+        region, self._dirty_region = self._dirty_region, QRegion()
+        if not region.isEmpty():
+            self.update(region)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        dirty_region = event.region()
+
         for i, ring in enumerate(self._rings):
+            if not dirty_region.intersects(self._ring_region(i)):
+                continue
             # Background arc
             painter.setPen(
                 QtGui.QPen(ring.background_color, ring.config.line_width, QtCore.Qt.SolidLine)
             )
-            offset = self.config.gap * i
-            adjusted_rect = QtCore.QRect(
-                rect.left() + offset,
-                rect.top() + offset,
-                rect.width() - 2 * offset,
-                rect.height() - 2 * offset,
-            )
+            adjusted_rect = self._ring_rect(i)
             painter.drawArc(adjusted_rect, ring.config.start_position, 360 * 16)
 
             # Foreground arc
@@ -645,6 +701,7 @@ class RingProgressBar(BECWidget, QWidget):
         self.initialize_bars()
 
     def cleanup(self):
+        get_render_scheduler().cancel(self)
         self.bec_dispatcher.disconnect_slot(
             self.on_scan_queue_status, MessageEndpoints.scan_queue_status()
         )
@@ -1,5 +1,7 @@
 """This module contains the BECStatusBox widget, which displays the status of different BEC services in a collapsible tree widget.
 The widget automatically updates the status of all running BEC services, and displays their status.
+Status and metrics updates are pushed by the services; only the tree items of services whose status
+changed are updated.
 """
 
 from __future__ import annotations
@@ -8,10 +10,12 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from bec_lib.endpoints import MessageEndpoints
 from bec_lib.utils.import_utils import lazy_import_from
 from qtpy.QtCore import QObject, QTimer, Signal, Slot
 from qtpy.QtWidgets import QHBoxLayout, QTreeWidget, QTreeWidgetItem
 
+from bec_widgets.utils.bec_dispatcher import BECDispatcher
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.compact_popup import CompactPopupWidget
 from bec_widgets.widgets.services.bec_status_box.status_item import StatusItem
@@ -21,6 +25,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 # TODO : Put normal imports back when Pydantic gets faster
 BECStatus = lazy_import_from("bec_lib.messages", ("BECStatus",))
+StatusMessage, ServiceMetricMessage = lazy_import_from(
+    "bec_lib.messages", ("StatusMessage", "ServiceMetricMessage")
+)
 
 
 @dataclass
@@ -36,6 +43,10 @@ class BECServiceInfoContainer:
 class BECServiceStatusMixin(QObject):
     """Mixin to receive the latest service status from the BEC server and emit it via services_update signal.
 
+    The services publish their status and metrics, which are received through the dispatcher. The
+    signal is only emitted if the status or metrics of a service changed. As services do not
+    announce their shutdown, the list of running services is additionally polled in a slow interval.
+
     Args:
         client (BECClient): The client object to connect to the BEC server.
     """
@@ -43,22 +54,77 @@ class BECServiceStatusMixin(QObject):
     services_update = Signal(dict, dict)
 
     ICON_NAME = "dns"
+    LIVENESS_INTERVAL = 5000
 
     def __init__(self, parent, client: BECClient):
         super().__init__(parent)
         self.client = client
+        self.bec_dispatcher = BECDispatcher(client=client)
+        self._services_info = {}
+        self._services_metric = {}
+        # updates are only emitted once the list of running services is known
+        self._synced = False
+        self.bec_dispatcher.connect_slot(
+            self._on_service_status, MessageEndpoints.service_status("*")
+        )
+        self.bec_dispatcher.connect_slot(self._on_service_metrics, MessageEndpoints.metrics("*"))
         self._service_update_timer = QTimer()
         self._service_update_timer.timeout.connect(self._get_service_status)
-        self._service_update_timer.start(1000)
+        self._service_update_timer.start(self.LIVENESS_INTERVAL)
+        QTimer.singleShot(0, self._get_service_status)
 
     def _get_service_status(self):
-        """Get the latest service status from the BEC server."""
+        """Get the list of running services and their latest status from the BEC server."""
         # pylint: disable=protected-access
         self.client._update_existing_services()
-        self.services_update.emit(self.client._services_info, self.client._services_metric)
+        self._services_info = dict(self.client._services_info)
+        self._services_metric = dict(self.client._services_metric)
+        self._synced = True
+        self._emit_update()
+
+    @Slot(dict, dict)
+    def _on_service_status(self, content: dict, metadata: dict):
+        """Callback for status updates published by the services.
+
+        Args:
+            content (dict): The content of the StatusMessage.
+            metadata (dict): The metadata of the StatusMessage.
+        """
+        name = content.get("name")
+        previous = self._services_info.get(name)
+        if previous is not None and previous.content == content:
+            return
+        self._services_info[name] = StatusMessage(**content, metadata=metadata)
+        self._emit_update()
+
+    @Slot(dict, dict)
+    def _on_service_metrics(self, content: dict, metadata: dict):
+        """Callback for metrics published by the services.
+
+        Args:
+            content (dict): The content of the ServiceMetricMessage.
+            metadata (dict): The metadata of the ServiceMetricMessage.
+        """
+        name = content.get("name")
+        previous = self._services_metric.get(name)
+        if previous is not None and previous.content == content:
+            return
+        self._services_metric[name] = ServiceMetricMessage(**content, metadata=metadata)
+        if name in self._services_info:
+            self._emit_update()
+
+    def _emit_update(self):
+        if not self._synced:
+            return
+        # the receivers may modify the dictionaries
+        self.services_update.emit(dict(self._services_info), dict(self._services_metric))
 
     def cleanup(self):
         """Cleanup the BECServiceStatusMixin."""
+        self.bec_dispatcher.disconnect_slot(
+            self._on_service_status, MessageEndpoints.service_status("*")
+        )
+        self.bec_dispatcher.disconnect_slot(self._on_service_metrics, MessageEndpoints.metrics("*"))
         self._service_update_timer.stop()
         self._service_update_timer.deleteLater()
 
@@ -94,6 +160,7 @@ class BECStatusBox(BECWidget, CompactPopupWidget):
 
         self.box_name = box_name
         self.status_container = defaultdict(lambda: {"info": None, "item": None, "widget": None})
+        self._core_state = None
 
         if not bec_service_status_mixin:
             bec_service_status_mixin = BECServiceStatusMixin(self, client=self.client)
@@ -174,7 +241,7 @@ class BECStatusBox(BECWidget, CompactPopupWidget):
 
     def _update_status_container(
         self, service_name: str, status: BECStatus, info: dict, metrics: dict = None
-    ) -> None:
+    ) -> bool:
         """Update the status_container with the newest status and metrics for the BEC service.
         If information about the service already exists, it will create a new entry.
 
@@ -183,26 +250,35 @@ class BECStatusBox(BECWidget, CompactPopupWidget):
             status (BECStatus): The status of the service.
             info (dict): The information about the service.
             metrics (dict): The metrics of the service.
+
+        Returns:
+            bool: True if the status or information of the service changed. Changes of the
+                metrics only update the popup dialog of the service, if it is open.
         """
         container = self.status_container[service_name].get("info", None)
+        status = status.name if isinstance(status, BECStatus) else status
 
         if container:
-            container.status = status.name
+            changed = container.status != status or container.info != info
+            metrics_changed = container.metrics != metrics
+            container.status = status
             container.info = info
             container.metrics = metrics
-            return
+            widget = self.status_container[service_name]["widget"]
+            if metrics_changed and not changed and widget is not None:
+                widget.update_metrics()
+            return changed
         service_info_item = BECServiceInfoContainer(
-            service_name=service_name,
-            status=status.name if isinstance(status, BECStatus) else status,
-            info=info,
-            metrics=metrics,
+            service_name=service_name, status=status, info=info, metrics=metrics
         )
         self.status_container[service_name].update({"info": service_info_item})
+        return True
 
     @Slot(dict, dict)
     def update_service_status(self, services_info: dict, services_metric: dict) -> None:
         """Callback function services_metric from BECServiceStatusMixin.
-        It updates the status of all services.
+        It updates the status of all services, the tree items are only updated if the
+        status of their service changed.
 
         Args:
             services_info (dict): A dictionary containing the service status for all running BEC services.
@@ -220,8 +296,8 @@ class BECStatusBox(BECWidget, CompactPopupWidget):
                 if not msg:
                     self.add_tree_item(service_name, "NOTCONNECTED", {}, metrics)
                     continue
-                self._update_status_container(service_name, msg.status, msg.info, metrics)
-                self.service_update.emit(self.status_container[service_name]["info"])
+                if self._update_status_container(service_name, msg.status, msg.info, metrics):
+                    self.service_update.emit(self.status_container[service_name]["info"])
                 continue
 
             self.add_tree_item(service_name, msg.status, msg.info, metrics)
@@ -248,17 +324,23 @@ class BECStatusBox(BECWidget, CompactPopupWidget):
                     continue
                 self.add_tree_item(service_name, msg.status, msg.info, metrics)
                 continue
+            container = self.status_container[service_name]["info"]
             if not msg:
-                self.status_container[service_name]["info"].status = "NOTCONNECTED"
+                changed = container.status != "NOTCONNECTED"
+                container.status = "NOTCONNECTED"
                 core_state = None
             else:
-                self._update_status_container(service_name, msg.status, msg.info, metrics)
+                changed = self._update_status_container(service_name, msg.status, msg.info, metrics)
                 if core_state:
                     core_state = msg.status if msg.status.value < core_state.value else core_state
 
-            self.service_update.emit(self.status_container[service_name]["info"])
+            if changed:
+                self.service_update.emit(container)
 
-        self.bec_core_state.emit(core_state.name if core_state else "NOTCONNECTED")
+        core_state = core_state.name if core_state else "NOTCONNECTED"
+        if core_state != self._core_state:
+            self._core_state = core_state
+            self.bec_core_state.emit(core_state)
         return services_info
 
     def check_redundant_tree_items(self, checked: list) -> None:
@@ -6,13 +6,13 @@ import os
 from datetime import datetime
 
 from bec_lib.utils.import_utils import lazy_import_from
-from bec_qthemes import material_icon
 from qtpy.QtCore import Qt, Slot
 from qtpy.QtGui import QIcon, QPainter
 from qtpy.QtWidgets import QDialog, QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
 import bec_widgets
 from bec_widgets.utils.colors import get_accent_colors
+from bec_widgets.utils.icon_cache import material_icon
 
 # TODO : Put normal imports back when Pydantic gets faster
 BECStatus = lazy_import_from("bec_lib.messages", ("BECStatus",))
@@ -86,6 +86,10 @@ class StatusItem(QWidget):
         self.set_status()
         self._set_popup_text()
 
+    def update_metrics(self) -> None:
+        """Update the metrics shown in the popup dialog, if it is open."""
+        self._set_popup_text()
+
     def set_text(self) -> None:
         """Set the text of the QLabel basae on the config."""
         service = self.config.service_name
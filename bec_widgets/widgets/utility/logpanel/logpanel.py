@@ -91,6 +91,7 @@ class BecLogsQueue(QObject):
         self._log_level: str | None = None
         self._search_query: Pattern | str | None = None
         self._selected_services: set[str] | None = None
+        self._suspended = False
         self._set_formatter_and_update_filter(line_formatter)
         self._conn.register([MessageEndpoints.log()], None, self._process_incoming_log_msg)
 
@@ -102,12 +103,19 @@ class BecLogsQueue(QObject):
         try:
             _msg: LogMessage = msg["data"]
             self._data.append(_msg)
+            if self._suspended:
+                return
             if self.filter is None or self.filter(_msg):
                 self._display_queue.append(self._line_formatter(_msg))
                 self.new_message.emit()
         except Exception as e:
             logger.warning(f"Error in LogPanel incoming message callback: {e}")
 
+    def set_suspended(self, suspended: bool):
+        """While suspended, incoming messages are only stored, not formatted for display"""
+        self._suspended = suspended
+        self._display_queue.clear()
+
     def _set_formatter_and_update_filter(self, line_formatter: LineFormatter = noop_format):
         self._line_formatter: LineFormatter = line_formatter
         self._queue_formatter: LinesHtmlFormatter = create_formatter(
@@ -483,6 +491,15 @@ class LogPanel(TextBox):
         self.set_html_text(self._log_manager.display_all())
         self._cursor_to_end()
 
+    def on_suspend(self):
+        """Stop rendering new log messages while the panel is hidden."""
+        self._log_manager.set_suspended(True)
+
+    def on_resume(self):
+        """Render the stored log messages at once when the panel is shown again."""
+        self._log_manager.set_suspended(False)
+        self._on_redraw()
+
     @SafeSlot()
     def _on_append(self):
         self._cursor_to_end()
@@ -0,0 +1,402 @@
+"""
+Dashboard of the runtime performance of the GUI: frame rates of all plots, lag of the event
+loop, message rates per topic, memory usage and the slowest slots. All metrics are sampled once
+per update interval and kept in fixed-size histories, such that the dashboard can be left
+running for long periods of time.
+"""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass
+
+import pyqtgraph as pg
+from qtpy.QtCore import QTimer
+from qtpy.QtWidgets import (
+    QCheckBox,
+    QGridLayout,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from bec_widgets.utils.bec_widget import BECWidget
+from bec_widgets.utils.colors import apply_graphics_theme
+from bec_widgets.utils.error_popups import SafeProperty, SafeSlot
+from bec_widgets.utils.fps_counter import FPSCounter
+from bec_widgets.utils.icon_cache import get_icon_cache
+from bec_widgets.utils.performance_metrics import (
+    EventLoopLagMonitor,
+    RollingSeries,
+    get_message_rate_meter,
+    plot_buffers,
+    process_memory,
+)
+from bec_widgets.utils.slot_profiler import get_slot_profiler
+from bec_widgets.widgets.plots.plot_base import PlotBase
+
+MB = 1024**2
+
+
+@dataclass
+class _PlotMonitor:
+    """FPS counter attached to the view box of a plot."""
+
+    name: str
+    plot: weakref.ref
+    counter: FPSCounter
+    fps: float = 0.0
+
+
+class PerformanceDashboard(BECWidget, QWidget):
+    """Dashboard of the GUI performance: frame rates, event loop lag, messages and memory."""
+
+    PLUGIN = True
+    RPC = True
+    ICON_NAME = "monitor_heart"
+    USER_ACCESS = ["snapshot", "update_interval", "update_interval.setter", "remove"]
+
+    def __init__(
+        self,
+        parent=None,
+        client=None,
+        gui_id: str | None = None,
+        update_interval: int = 1000,
+        history: int = 300,
+        **kwargs,
+    ):
+        """
+        Args:
+            parent(QWidget, optional): The parent widget.
+            client(BECClient, optional): The BEC client.
+            gui_id(str, optional): The GUI ID.
+            update_interval(int): Interval in milliseconds in which the metrics are sampled.
+            history(int): Number of samples shown in the charts.
+        """
+        super().__init__(parent=parent, client=client, gui_id=gui_id, theme_update=True, **kwargs)
+        self._update_interval = update_interval
+        self._plots: dict[str, _PlotMonitor] = {}
+        self._snapshot: dict = {}
+        self._series = {
+            name: RollingSeries(history)
+            for name in ("lag_max", "lag_mean", "fps_min", "fps_total", "messages", "rss")
+        }
+
+        self._rate_meter = get_message_rate_meter()
+        self._rate_meter.acquire()
+        self._lag_monitor = EventLoopLagMonitor(parent=self)
+        self._lag_monitor.start()
+
+        self._init_ui()
+
+        self._update_timer = QTimer(self)
+        self._update_timer.timeout.connect(self.update_metrics)
+        self._update_timer.start(self._update_interval)
+
+    def _init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header = QHBoxLayout()
+        self.summary_labels: dict[str, QLabel] = {}
+        summary = QGridLayout()
+        for index, (key, title) in enumerate(
+            (
+                ("lag", "Event loop lag"),
+                ("fps", "Plot FPS (min / total)"),
+                ("messages", "Messages"),
+                ("memory", "RSS / Python heap"),
+                ("plots", "Curves / images"),
+                ("buffers", "Plot buffers"),
+                ("icons", "Icon cache (hits / misses)"),
+            )
+        ):
+            row, column = divmod(index, 3)
+            label = QLabel("-", parent=self)
+            summary.addWidget(QLabel(f"{title}:", parent=self), row, 2 * column)
+            summary.addWidget(label, row, 2 * column + 1)
+            self.summary_labels[key] = label
+        header.addLayout(summary)
+        header.addStretch()
+        self.profile_slots_checkbox = QCheckBox("Profile slots", parent=self)
+        self.profile_slots_checkbox.setChecked(get_slot_profiler().enabled)
+        self.profile_slots_checkbox.toggled.connect(self._set_slot_profiling)
+        header.addWidget(self.profile_slots_checkbox)
+        layout.addLayout(header)
+
+        splitter = QSplitter(parent=self)
+        layout.addWidget(splitter)
+        self.charts = pg.GraphicsLayoutWidget(parent=splitter)
+        self._curves: dict[str, pg.PlotDataItem] = {}
+        for row, (title, unit, curves) in enumerate(
+            (
+                ("Event loop lag", "ms", (("lag_max", "r"), ("lag_mean", "y"))),
+                ("Plot FPS", "Hz", (("fps_min", "c"), ("fps_total", "g"))),
+                ("Messages", "1/s", (("messages", "m"),)),
+                ("RSS", "MB", (("rss", "w"),)),
+            )
+        ):
+            plot_item = self.charts.addPlot(row=row, col=0)
+            plot_item.setLabel("left", title, units=unit)
+            plot_item.setMouseEnabled(x=False, y=False)
+            plot_item.hideButtons()
+            plot_item.setMenuEnabled(False)
+            for name, color in curves:
+                self._curves[name] = plot_item.plot(pen=pg.mkPen(color), antialias=False)
+        splitter.addWidget(self.charts)
+
+        self.tabs = QTabWidget(parent=splitter)
+        self.plot_table = self._create_table(["Plot", "FPS", "Curves", "Images", "Buffers [MB]"])
+        self.topic_table = self._create_table(["Topic", "Messages/s", "Slots"])
+        self.slot_table = self._create_table(
+            ["Slot", "Topic", "Calls", "Mean [ms]", "Max [ms]", "Total [ms]", "Queue"]
+        )
+        self.tabs.addTab(self.plot_table, "Plots")
+        self.tabs.addTab(self.topic_table, "Topics")
+        self.tabs.addTab(self.slot_table, "Slowest slots")
+        splitter.addWidget(self.tabs)
+
+    def apply_theme(self, theme: str):
+        """
+        Apply the theme to the charts.
+
+        Args:
+            theme(str): The theme to be applied.
+        """
+        apply_graphics_theme(self.charts, theme)
+
+    def _create_table(self, headers: list[str]) -> QTableWidget:
+        table = QTableWidget(0, len(headers), parent=self)
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    @SafeProperty(int)
+    def update_interval(self) -> int:
+        """Interval in milliseconds in which the metrics are sampled."""
+        return self._update_interval
+
+    @update_interval.setter
+    def update_interval(self, interval: int):
+        """
+        Set the interval in which the metrics are sampled.
+
+        Args:
+            interval(int): The interval in milliseconds.
+        """
+        self._update_interval = max(int(interval), 100)
+        self._update_timer.setInterval(self._update_interval)
+
+    def snapshot(self) -> dict:
+        """
+        Get the metrics of the last update.
+
+        Returns:
+            dict: The frame rate per plot, the event loop lag, the message rates per topic, the
+                memory usage, the number and size of the plotted curves and images, the hits and
+                misses of the icon cache, and the slowest slots if slot profiling is enabled.
+        """
+        return self._snapshot
+
+    @SafeSlot(bool)
+    def _set_slot_profiling(self, enabled: bool):
+        profiler = get_slot_profiler()
+        if enabled:
+            profiler.enable()
+        else:
+            profiler.disable()
+
+    ################################################################################
+    # Sampling
+    ################################################################################
+
+    @SafeSlot()
+    def update_metrics(self):
+        """Sample all metrics and update the dashboard."""
+        plots = self._update_plot_monitors()
+        lag_max, lag_mean = self._lag_monitor.take()
+        message_rates = self._message_rates()
+        memory = process_memory()
+        buffers = {gui_id: plot_buffers([plot.plot_item]) for gui_id, plot in plots.items()}
+        totals = plot_buffers(plot.plot_item for plot in plots.values())
+        fps = {monitor.name: monitor.fps for monitor in self._plots.values()}
+        profiler = get_slot_profiler()
+        slowest = profiler.slowest() if profiler.enabled else []
+
+        self._snapshot = {
+            "fps": fps,
+            "event_loop_lag_ms": {"max": lag_max, "mean": lag_mean},
+            "message_rates": message_rates,
+            "memory": memory,
+            "plots": totals,
+            "icon_cache": get_icon_cache().stats(),
+            "slowest_slots": slowest,
+        }
+        for name, value in (
+            ("lag_max", lag_max),
+            ("lag_mean", lag_mean),
+            ("fps_min", min(fps.values(), default=None)),
+            ("fps_total", sum(fps.values())),
+            ("messages", sum(message_rates.values())),
+            ("rss", memory["rss"] / MB if memory["rss"] is not None else None),
+        ):
+            self._series[name].append(value)
+
+        # the history is always recorded, but drawing is skipped while nobody can see it
+        if not self.isVisible():
+            return
+        self._update_summary()
+        for name, curve in self._curves.items():
+            curve.setData(self._series[name].values())
+        self._fill_table(
+            self.plot_table,
+            [
+                (
+                    monitor.name,
+                    f"{monitor.fps:.1f}",
+                    buffers[gui_id]["curves"],
+                    buffers[gui_id]["images"],
+                    f"{buffers[gui_id]['bytes'] / MB:.1f}",
+                )
+                for gui_id, monitor in sorted(self._plots.items(), key=lambda item: item[1].fps)
+            ],
+        )
+        self._fill_table(
+            self.topic_table,
+            [
+                (topic, f"{rate:.1f}", self.bec_dispatcher.slot_count(topic))
+                for topic, rate in sorted(message_rates.items(), key=lambda item: -item[1])
+            ],
+        )
+        self._fill_table(
+            self.slot_table,
+            [
+                (
+                    entry["slot"],
+                    entry["topic"] or "",
+                    entry["calls"],
+                    f"{entry['execution']['mean_ms']:.2f}",
+                    f"{entry['execution']['max_ms']:.2f}",
+                    f"{entry['execution']['total_ms']:.1f}",
+                    entry["max_queue_depth"],
+                )
+                for entry in slowest
+            ],
+        )
+
+    def _update_plot_monitors(self) -> dict[str, PlotBase]:
+        """
+        Attach FPS counters to new plots and remove the counters of deleted plots. The counters
+        are read out by the update timer of the dashboard instead of by their own timers.
+
+        Returns:
+            dict[str, PlotBase]: The plots by gui_id.
+        """
+        plots = {
+            gui_id: widget
+            for gui_id, widget in self.rpc_register.list_all_connections().items()
+            if isinstance(widget, PlotBase)
+        }
+        for gui_id in list(self._plots):
+            if gui_id not in plots or self._plots[gui_id].plot() is None:
+                self._remove_plot_monitor(gui_id)
+        for gui_id, plot in plots.items():
+            if gui_id in self._plots:
+                self._plots[gui_id].counter.calculate_fps()
+                continue
+            counter = FPSCounter(plot.plot_item.vb)
+            counter.timer.stop()
+            monitor = _PlotMonitor(
+                name=getattr(plot, "object_name", None) or gui_id,
+                plot=weakref.ref(plot),
+                counter=counter,
+            )
+            counter.sigFpsUpdate.connect(lambda fps, monitor=monitor: setattr(monitor, "fps", fps))
+            self._plots[gui_id] = monitor
+        return plots
+
+    def _remove_plot_monitor(self, gui_id: str):
+        monitor = self._plots.pop(gui_id)
+        monitor.counter.cleanup()
+        try:
+            monitor.counter.view_box.sigPaint.disconnect(monitor.counter.increment_count)
+        except (RuntimeError, TypeError):
+            # the view box has already been deleted
+            pass
+        monitor.counter.deleteLater()
+
+    def _message_rates(self) -> dict[str, float]:
+        """
+        Get the message rates per topic. The meter counts the deliveries to the slots, hence
+        the rates are divided by the number of slots connected to the topic.
+        """
+        rates = {}
+        for topic, rate in self._rate_meter.rates().items():
+            rates[topic] = rate / max(self.bec_dispatcher.slot_count(topic), 1)
+        return rates
+
+    def _update_summary(self):
+        snapshot = self._snapshot
+        lag = snapshot["event_loop_lag_ms"]
+        fps = snapshot["fps"]
+        memory = snapshot["memory"]
+        plots = snapshot["plots"]
+        self.summary_labels["lag"].setText(f"{lag['max']:.1f} ms (mean {lag['mean']:.1f} ms)")
+        self.summary_labels["fps"].setText(
+            f"{min(fps.values()):.1f} / {sum(fps.values()):.1f}" if fps else "-"
+        )
+        self.summary_labels["messages"].setText(f"{sum(snapshot['message_rates'].values()):.1f}/s")
+        rss = f"{memory['rss'] / MB:.0f} MB" if memory["rss"] is not None else "-"
+        heap = f"{memory['heap'] / MB:.0f} MB" if memory["heap"] is not None else "-"
+        self.summary_labels["memory"].setText(f"{rss} / {heap}")
+        self.summary_labels["plots"].setText(f"{plots['curves']} / {plots['images']}")
+        self.summary_labels["buffers"].setText(f"{plots['bytes'] / MB:.1f} MB")
+        icons = snapshot["icon_cache"]
+        self.summary_labels["icons"].setText(f"{icons['hits']} / {icons['misses']}")
+
+    @staticmethod
+    def _fill_table(table: QTableWidget, rows: list[tuple]):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    table.setItem(row, column, item)
+                item.setText(str(value))
+
+    def cleanup(self):
+        """Stop sampling and detach the FPS counters from the plots."""
+        self._update_timer.stop()
+        self._lag_monitor.stop()
+        for gui_id in list(self._plots):
+            self._remove_plot_monitor(gui_id)
+        self._rate_meter.release()
+        super().cleanup()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+
+    from qtpy.QtWidgets import QApplication
+
+    from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+    app = QApplication(sys.argv)
+    window = QSplitter()
+    waveform = Waveform(parent=window)
+    waveform.plot([1, 2, 3, 2, 1])
+    dashboard = PerformanceDashboard(parent=window)
+    window.addWidget(waveform)
+    window.addWidget(dashboard)
+    window.resize(1400, 800)
+    window.show()
+    sys.exit(app.exec_())
@@ -0,0 +1,56 @@
+# Copyright (C) 2022 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR BSD-3-Clause
+
+from qtpy.QtDesigner import QDesignerCustomWidgetInterface
+
+from bec_widgets.utils.bec_designer import designer_material_icon
+from bec_widgets.widgets.utility.performance_dashboard.performance_dashboard import (
+    PerformanceDashboard,
+)
+
+DOM_XML = """
+<ui language='c++'>
+    <widget class='PerformanceDashboard' name='performance_dashboard'>
+    </widget>
+</ui>
+"""
+
+
+class PerformanceDashboardPlugin(QDesignerCustomWidgetInterface):  # pragma: no cover
+    def __init__(self):
+        super().__init__()
+        self._form_editor = None
+
+    def createWidget(self, parent):
+        t = PerformanceDashboard(parent)
+        return t
+
+    def domXml(self):
+        return DOM_XML
+
+    def group(self):
+        return "BEC Utils"
+
+    def icon(self):
+        return designer_material_icon(PerformanceDashboard.ICON_NAME)
+
+    def includeFile(self):
+        return "performance_dashboard"
+
+    def initialize(self, form_editor):
+        self._form_editor = form_editor
+
+    def isContainer(self):
+        return False
+
+    def isInitialized(self):
+        return self._form_editor is not None
+
+    def name(self):
+        return "PerformanceDashboard"
+
+    def toolTip(self):
+        return "Dashboard of the GUI performance"
+
+    def whatsThis(self):
+        return self.toolTip()
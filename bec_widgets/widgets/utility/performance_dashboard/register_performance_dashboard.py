@@ -0,0 +1,17 @@
+def main():  # pragma: no cover
+    from qtpy import PYSIDE6
+
+    if not PYSIDE6:
+        print("PYSIDE6 is not available in the environment. Cannot patch designer.")
+        return
+    from PySide6.QtDesigner import QPyDesignerCustomWidgetCollection
+
+    from bec_widgets.widgets.utility.performance_dashboard.performance_dashboard_plugin import (
+        PerformanceDashboardPlugin,
+    )
+
+    QPyDesignerCustomWidgetCollection.addCustomWidget(PerformanceDashboardPlugin())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
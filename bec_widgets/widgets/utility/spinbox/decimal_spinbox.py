@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import sys
 
-from bec_qthemes import material_icon
 from qtpy.QtGui import Qt
 from qtpy.QtWidgets import (
     QApplication,
@@ -15,6 +14,7 @@ from qtpy.QtWidgets import (
 
 from bec_widgets.utils import ConnectionConfig
 from bec_widgets.utils.bec_widget import BECWidget
+from bec_widgets.utils.icon_cache import material_icon
 
 
 class BECSpinBox(BECWidget, QDoubleSpinBox):
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import pyqtgraph as pg
 from qtpy.QtCore import Property, Signal, Slot
-from qtpy.QtGui import QColor, QFontMetrics, QImage
+from qtpy.QtGui import QFontMetrics
 from qtpy.QtWidgets import QApplication, QComboBox, QStyledItemDelegate, QVBoxLayout, QWidget
 
+from bec_widgets.utils.colors import get_colormap_preview
+
 
 class ColormapDelegate(QStyledItemDelegate):
     def __init__(self, parent=None):
@@ -15,8 +17,6 @@ class ColormapDelegate(QStyledItemDelegate):
 
     def paint(self, painter, option, index):
         text = index.data()
-        colormap = pg.colormap.get(text)
-        colors = colormap.getLookupTable(start=0.0, stop=1.0, alpha=False)
 
         font_metrics = QFontMetrics(painter.font())
         text_width = font_metrics.width(text)
@@ -24,14 +24,9 @@ class ColormapDelegate(QStyledItemDelegate):
 
         total_height = max(text_height, self.image_height)
 
-        image = QImage(self.image_width, self.image_height, QImage.Format_RGB32)
-        for i in range(self.image_width):
-            color = QColor(*colors[int(i * (len(colors) - 1) / (self.image_width - 1))])
-            for j in range(self.image_height):
-                image.setPixel(i, j, color.rgb())
-
-        painter.drawImage(
-            option.rect.x(), option.rect.y() + (total_height - self.image_height) // 2, image
+        preview = get_colormap_preview(text, self.image_width, self.image_height)
+        painter.drawPixmap(
+            option.rect.x(), option.rect.y() + (total_height - self.image_height) // 2, preview
         )
         painter.drawText(
             option.rect.x() + self.image_width + self.gap,
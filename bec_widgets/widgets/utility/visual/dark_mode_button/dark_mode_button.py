@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from bec_qthemes import material_icon
 from qtpy.QtCore import Property, Qt, Slot
 from qtpy.QtWidgets import QApplication, QHBoxLayout, QPushButton, QToolButton, QWidget
 
 from bec_widgets.utils.bec_widget import BECWidget
 from bec_widgets.utils.colors import set_theme
+from bec_widgets.utils.icon_cache import material_icon
 
 
 class DarkModeButton(BECWidget, QWidget):
@@ -0,0 +1,29 @@
+"""
+Headless benchmarks for the plotting and dispatch hot paths.
+
+Run all benchmarks and store the results as a baseline::
+
+    python -m tests.benchmarks run --output baseline.json
+
+Compare a later run against the baseline; the command exits with a non-zero status if any
+metric got worse by more than the threshold::
+
+    python -m tests.benchmarks run --output current.json
+    python -m tests.benchmarks compare baseline.json current.json --threshold 0.2
+
+The waveform_load_curves scenarios measure the time to load --size curves into a Waveform, one
+by one and with Waveform.plot_many, e.g. for 100 curves::
+
+    python -m tests.benchmarks run --size 100 --scenario waveform_load_curves \
+        --scenario waveform_load_curves_batch
+
+The dock_area scenarios compare saving a dock area with --size docks as indented json and as a
+msgpack snapshot, and restoring snapshots with and without validation of the configs.
+
+The theme_switch scenario measures the stall of switching the theme of --size mixed widgets::
+
+    python -m tests.benchmarks run --size 2000 --scenario theme_switch
+
+The device_browser_and_queue scenario rebuilds a device browser with 500 and a queue with 200
+rows, which measures the cost of creating the icons of the rows.
+"""
@@ -0,0 +1,127 @@
+"""
+Command line interface of the benchmarks, see the package docstring for the usage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+from tests.benchmarks.compare import DEFAULT_THRESHOLD, compare_results
+from tests.benchmarks.harness import (
+    DEFAULT_FRAME_RATE,
+    BenchmarkParams,
+    create_benchmark_client,
+    ensure_application,
+)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the selected scenarios and write the results to a json file."""
+    app = ensure_application()
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.utils.bec_dispatcher import BECDispatcher
+    from tests.benchmarks.scenarios import SCENARIOS
+
+    names = args.scenario or list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    client = create_benchmark_client()
+    dispatcher = BECDispatcher(client=client)
+    dispatcher.stop_cli_server()
+    params = BenchmarkParams(
+        messages=args.messages, rate=args.rate, size=args.size, frame_rate=args.frame_rate
+    )
+    results = {}
+    try:
+        for name in names:
+            result = SCENARIOS[name](client, params, False)
+            if not args.no_memory:
+                result.peak_memory = SCENARIOS[name](client, params, True).peak_memory
+            app.processEvents()
+            results[name] = result.to_dict()
+            print(
+                f"{name:<28} latency p50 {result.latency_ms.get('p50', 0):8.3f} ms"
+                f"  p95 {result.latency_ms.get('p95', 0):8.3f} ms"
+                f"  throughput {result.throughput:10.1f} msg/s"
+                f"  frame p95 {result.frame_time_ms.get('p95', 0):8.3f} ms"
+                f"  peak memory {result.peak_memory / 1e6:8.1f} MB"
+            )
+    finally:
+        dispatcher.disconnect_all()
+        client.connector.shutdown()
+        BECDispatcher.reset_singleton()
+
+    content = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(content, file, indent=2)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two result files and report regressions."""
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, "r", encoding="utf-8") as file:
+        current = json.load(file)
+    comparisons = compare_results(baseline, current, threshold=args.threshold)
+    for comparison in comparisons:
+        print(comparison)
+    regressions = [comparison for comparison in comparisons if comparison.regression]
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+    print("No regressions")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of the benchmark command line interface."""
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--output", default="benchmark_results.json", help="Result file")
+    run_parser.add_argument(
+        "--scenario", action="append", help="Scenario to run, can be repeated. Defaults to all."
+    )
+    run_parser.add_argument("--messages", type=int, default=500, help="Messages per scenario")
+    run_parser.add_argument(
+        "--rate", type=float, default=0.0, help="Messages per second, 0 for as fast as possible"
+    )
+    run_parser.add_argument("--size", type=int, default=1000, help="Points per message")
+    run_parser.add_argument(
+        "--frame-rate", type=float, default=DEFAULT_FRAME_RATE, help="Repaints per second"
+    )
+    run_parser.add_argument("--no-memory", action="store_true", help="Skip the memory tracing pass")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline", help="Baseline result file")
+    compare_parser.add_argument("current", help="Result file to check")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative change flagged as regression",
+    )
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
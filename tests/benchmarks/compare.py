@@ -0,0 +1,80 @@
+"""
+Comparison of benchmark results against a baseline.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+DEFAULT_THRESHOLD = 0.2
+
+# metric path within a result, and whether larger values are better
+METRICS: dict[str, tuple[tuple[str, ...], bool]] = {
+    "latency p50": (("latency_ms", "p50"), False),
+    "latency p95": (("latency_ms", "p95"), False),
+    "frame time p95": (("frame_time_ms", "p95"), False),
+    "throughput": (("throughput",), True),
+    "peak memory": (("peak_memory",), False),
+}
+
+
+@dataclass
+class Comparison:
+    """Change of a single metric of a scenario."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+    regression: bool
+
+    def __str__(self) -> str:
+        flag = "REGRESSION" if self.regression else "ok"
+        return (
+            f"{self.scenario:<28} {self.metric:<16} {self.baseline:>14.4g} {self.current:>14.4g}"
+            f" {self.change:>+8.1%}  {flag}"
+        )
+
+
+def _lookup(result: dict, path: tuple[str, ...]) -> float | None:
+    value = result
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """
+    Compare the results of two benchmark runs. Only scenarios and metrics present in both runs
+    are compared; metrics that are zero in the baseline, e.g. the peak memory of a run without
+    memory tracing, are skipped.
+
+    Args:
+        baseline(dict): The baseline, as written by the run command.
+        current(dict): The results to check.
+        threshold(float): Relative change in the unfavourable direction above which a metric is
+            flagged as regression.
+
+    Returns:
+        list[Comparison]: The compared metrics.
+    """
+    comparisons = []
+    baseline_results = baseline.get("results", {})
+    current_results = current.get("results", {})
+    for scenario in sorted(baseline_results.keys() & current_results.keys()):
+        for metric, (path, higher_is_better) in METRICS.items():
+            old = _lookup(baseline_results[scenario], path)
+            new = _lookup(current_results[scenario], path)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            comparisons.append(
+                Comparison(scenario, metric, old, new, change, regression=worse > threshold)
+            )
+    return comparisons
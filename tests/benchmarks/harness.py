@@ -0,0 +1,211 @@
+"""
+Measurement harness of the benchmarks.
+
+Widgets are created against a mocked client backed by fakeredis, as in the unit tests. Messages
+are delivered through the slots registered in the BECDispatcher, i.e. exactly as the
+QtRedisConnector would deliver them, but synchronously, such that the time spent in the slots can
+be attributed to every single message.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable
+from unittest.mock import MagicMock
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from qtpy.QtWidgets import QWidget
+
+    from bec_widgets.utils.bec_dispatcher import BECDispatcher
+
+DEFAULT_FRAME_RATE = 60
+
+
+@dataclass
+class BenchmarkParams:
+    """Parameters of a benchmark run."""
+
+    messages: int = 500
+    rate: float = 0.0
+    size: int = 1000
+    frame_rate: float = DEFAULT_FRAME_RATE
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    Result of a single benchmark scenario. Times are given in milliseconds, memory in bytes.
+    """
+
+    name: str
+    params: dict
+    messages: int
+    latency_ms: dict = field(default_factory=dict)
+    throughput: float = 0.0
+    peak_memory: int = 0
+    frame_time_ms: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the result to a dictionary, as stored in the json baseline.
+
+        Returns:
+            dict: The result.
+        """
+        return asdict(self)
+
+
+def summarize(samples: Iterable[float]) -> dict:
+    """
+    Summarize a series of durations given in seconds.
+
+    Args:
+        samples(Iterable[float]): The durations in seconds.
+
+    Returns:
+        dict: Mean, median, 95th and 99th percentile and maximum, in milliseconds.
+    """
+    values = np.asarray(list(samples), dtype=float) * 1e3
+    if values.size == 0:
+        return {}
+    return {
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+def fake_redis_server(host, port):  # pylint: disable=unused-argument
+    """Redis factory of the connector of the benchmark client."""
+    # pylint: disable=import-outside-toplevel
+    import fakeredis
+
+    return fakeredis.FakeRedis()
+
+
+def create_benchmark_client():
+    """
+    Create a client with a fakeredis connector and the device manager of the unit tests.
+
+    Returns:
+        MagicMock: The client.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.tests.utils import DEVICES, DMMock
+    from bec_widgets.utils.bec_dispatcher import QtRedisConnector
+
+    client = MagicMock()
+    client.connector = QtRedisConnector("localhost:1", redis_cls=fake_redis_server)
+    client.device_manager = DMMock()
+    client.device_manager.add_devives(DEVICES)
+    return client
+
+
+def ensure_application():
+    """
+    Get the QApplication, creating it on the offscreen platform if needed.
+
+    Returns:
+        QApplication: The application.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # pylint: disable=import-outside-toplevel
+    from qtpy.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def deliver(dispatcher: BECDispatcher, topic: str, content: dict, metadata: dict) -> int:
+    """
+    Deliver a message to all slots connected to a topic, as QtRedisConnector does for messages
+    received from Redis.
+
+    Args:
+        dispatcher(BECDispatcher): The dispatcher holding the slots.
+        topic(str): The topic of the message.
+        content(dict): The message content.
+        metadata(dict): The message metadata.
+
+    Returns:
+        int: The number of slots the message was delivered to.
+    """
+    # pylint: disable=protected-access
+    slots = tuple(dispatcher._slots_by_topic.get(topic, ()))
+    for slot in slots:
+        slot(content, metadata)
+    return len(slots)
+
+
+def measure(
+    name: str,
+    widget: QWidget,
+    send: Callable[[int], None],
+    params: BenchmarkParams,
+    trace_memory: bool = False,
+) -> BenchmarkResult:
+    """
+    Send messages to a widget and measure the time spent per message, the sustainable message
+    rate and the time needed to repaint the widget.
+
+    Args:
+        name(str): The name of the scenario.
+        widget(QWidget): The widget under test. It is shown for the duration of the run.
+        send(Callable[[int], None]): Function delivering the i-th message.
+        params(BenchmarkParams): The parameters of the run.
+        trace_memory(bool): If True, the peak of the python memory allocations during the run
+            is recorded. Tracing slows down the run, hence latencies are not meaningful in
+            this case.
+
+    Returns:
+        BenchmarkResult: The result of the run.
+    """
+    app = ensure_application()
+    widget.resize(800, 600)
+    widget.show()
+    app.processEvents()
+
+    latencies = []
+    frame_times = []
+    frame_interval = 1.0 / params.frame_rate if params.frame_rate > 0 else None
+    message_interval = 1.0 / params.rate if params.rate > 0 else 0.0
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    next_frame = start
+    for index in range(params.messages):
+        if message_interval:
+            delay = start + index * message_interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        t0 = time.perf_counter()
+        send(index)
+        latencies.append(time.perf_counter() - t0)
+        if frame_interval is not None and time.perf_counter() >= next_frame:
+            t0 = time.perf_counter()
+            app.processEvents()
+            widget.repaint()
+            frame_times.append(time.perf_counter() - t0)
+            next_frame = t0 + frame_interval
+    peak_memory = 0
+    if trace_memory:
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    busy = sum(latencies) + sum(frame_times)
+    return BenchmarkResult(
+        name=name,
+        params=asdict(params),
+        messages=params.messages,
+        latency_ms=summarize(latencies),
+        throughput=params.messages / busy if busy > 0 else 0.0,
+        peak_memory=peak_memory,
+        frame_time_ms=summarize(frame_times),
+    )
@@ -0,0 +1,415 @@
+"""
+Benchmark scenarios. Every scenario creates a widget, connects it the way it is connected in a
+live session, drives it with synthetic messages and measures it with the harness.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import replace
+from typing import Callable
+
+import numpy as np
+from bec_lib import messages
+from bec_lib.endpoints import MessageEndpoints
+from qtpy.QtCore import QObject
+from qtpy.QtWidgets import (
+    QApplication,
+    QComboBox,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QWidget,
+)
+
+from bec_widgets.utils.bec_dispatcher import BECDispatcher
+from bec_widgets.utils.error_popups import SafeSlot
+from tests.benchmarks.harness import BenchmarkParams, BenchmarkResult, deliver, measure
+
+SCAN_ID = "benchmark"
+FANOUT_SUBSCRIBERS = 50
+# loading curves is measured on fewer repetitions and curves than the message scenarios
+LOAD_REPEATS = 5
+MAX_LOAD_CURVES = 500
+MAX_LAYOUT_DOCKS = 100
+# rows of the device browser and the queue in the device_browser_and_queue scenario
+MAX_BROWSER_ROWS = 500
+MAX_QUEUE_ROWS = 200
+# every THEMED_WIDGET_STEP-th widget of the theme_switch scenario is a theme-aware BEC widget
+THEMED_WIDGET_STEP = 10
+
+Scenario = Callable[[object, BenchmarkParams, bool], BenchmarkResult]
+
+
+def _close(widget: QWidget):
+    widget.close()
+    widget.deleteLater()
+
+
+def waveform_async_readback(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Waveform.on_async_readback with 'add' updates of params.size points per message."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+    widget = Waveform(client=client)
+    curve = widget.plot(arg1="async_device")
+    widget.scan_id = SCAN_ID
+    widget._async_curves = [curve]
+    widget._setup_async_curve(curve)
+    topic = MessageEndpoints.device_async_readback(SCAN_ID, "async_device").endpoint
+    rng = np.random.default_rng(0)
+
+    def send(index: int):
+        msg = messages.DeviceMessage(
+            signals={"async_device": {"value": rng.random(params.size), "timestamp": index}},
+            metadata={"async_update": {"type": "add", "max_shape": [None]}},
+        )
+        deliver(widget.bec_dispatcher, topic, msg.content, msg.metadata)
+
+    try:
+        return measure("waveform_async_readback", widget, send, params, trace_memory)
+    finally:
+        _close(widget)
+
+
+def image_update_1d(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Image.on_image_update_1d with one row of params.size points per message."""
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.widgets.plots.image.image import Image
+
+    widget = Image(client=client)
+    widget.image(monitor="eiger", monitor_type="1d")
+    topic = MessageEndpoints.device_monitor_1d("eiger").endpoint
+    rng = np.random.default_rng(0)
+
+    def send(index: int):
+        msg = messages.DeviceMonitor1DMessage(
+            device="eiger", data=rng.random(params.size), metadata={"scan_id": SCAN_ID}
+        )
+        deliver(widget.bec_dispatcher, topic, msg.content, msg.metadata)
+
+    try:
+        return measure("image_update_1d", widget, send, params, trace_memory)
+    finally:
+        _close(widget)
+
+
+def motor_map_update(client, params: BenchmarkParams, trace_memory: bool = False):
+    """MotorMap._update_plot through alternating samx/samy readbacks."""
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.widgets.plots.motor_map.motor_map import MotorMap
+
+    widget = MotorMap(client=client)
+    widget.map("samx", "samy")
+    topics = {name: MessageEndpoints.device_readback(name).endpoint for name in ("samx", "samy")}
+    rng = np.random.default_rng(0)
+
+    def send(index: int):
+        name = "samx" if index % 2 == 0 else "samy"
+        msg = messages.DeviceMessage(
+            signals={name: {"value": float(rng.uniform(-10, 10)), "timestamp": index}}
+        )
+        deliver(widget.bec_dispatcher, topics[name], msg.content, msg.metadata)
+
+    try:
+        return measure("motor_map_update", widget, send, params, trace_memory)
+    finally:
+        _close(widget)
+
+
+def _curve_configs(params: BenchmarkParams) -> list[dict]:
+    x = np.arange(10.0)
+    count = min(params.size, MAX_LOAD_CURVES)
+    return [{"x": x, "y": x * index, "label": f"curve_{index}"} for index in range(count)]
+
+
+def waveform_load_curves(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Waveform loading params.size (at most MAX_LOAD_CURVES) curves, one plot call each."""
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+    widget = Waveform(client=client)
+    configs = _curve_configs(params)
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+
+    def send(index: int):  # pylint: disable=unused-argument
+        widget.clear_all()
+        for config in configs:
+            widget.plot(**config)
+
+    try:
+        return measure("waveform_load_curves", widget, send, params, trace_memory)
+    finally:
+        _close(widget)
+
+
+def waveform_load_curves_batch(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Waveform loading params.size (at most MAX_LOAD_CURVES) curves with plot_many."""
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+    widget = Waveform(client=client)
+    configs = _curve_configs(params)
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+
+    def send(index: int):  # pylint: disable=unused-argument
+        with widget.batch():
+            widget.clear_all()
+            widget.plot_many(configs)
+
+    try:
+        return measure("waveform_load_curves_batch", widget, send, params, trace_memory)
+    finally:
+        _close(widget)
+
+
+def _layout_dock_area(client, params: BenchmarkParams):
+    """
+    Dock area with params.size (at most MAX_LAYOUT_DOCKS) docks stacked as tabs, every dock
+    holding the config of a Waveform which is not built.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.widgets.containers.dock.dock_area import BECDockArea
+    from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+    waveform = Waveform(client=client)
+    widget_config = waveform.config.model_dump()
+    _close(waveform)
+    area = BECDockArea(client=client)
+    first = area.new(name="dock_0")
+    first.set_pending_widgets({"waveform_0": dict(widget_config)})
+    for index in range(1, min(params.size, MAX_LAYOUT_DOCKS)):
+        dock = area.new(name=f"dock_{index}", position="above", relative_to=first)
+        dock.set_pending_widgets({f"waveform_{index}": dict(widget_config)})
+    area.save_state()
+    return area
+
+
+def dock_area_save_json(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Dumping a dock area config with params.size docks to indented json."""
+    area = _layout_dock_area(client, params)
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+
+    def send(index: int):  # pylint: disable=unused-argument
+        area.save_state()
+        json.dumps(area.config.model_dump(mode="json"), indent=2)
+
+    try:
+        return measure("dock_area_save_json", area, send, params, trace_memory)
+    finally:
+        _close(area)
+
+
+def dock_area_save_snapshot(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Dumping a dock area config with params.size docks to a msgpack snapshot."""
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.utils.layout_snapshot import dump_snapshot
+
+    area = _layout_dock_area(client, params)
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+
+    def send(index: int):  # pylint: disable=unused-argument
+        area.save_state()
+        dump_snapshot(area.config)
+
+    try:
+        return measure("dock_area_save_snapshot", area, send, params, trace_memory)
+    finally:
+        _close(area)
+
+
+def _restore_snapshot(name: str, client, params: BenchmarkParams, trusted: bool, trace_memory):
+    area = _layout_dock_area(client, params)
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "layout.snapshot")
+        area.save_snapshot(path)
+
+        def send(index: int):  # pylint: disable=unused-argument
+            area.load_snapshot(path, trusted=trusted)
+
+        try:
+            return measure(name, area, send, params, trace_memory)
+        finally:
+            _close(area)
+
+
+def dock_area_restore_snapshot(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Restoring a snapshot with params.size lazy docks, validating all configs."""
+    return _restore_snapshot("dock_area_restore_snapshot", client, params, False, trace_memory)
+
+
+def dock_area_restore_snapshot_trusted(client, params: BenchmarkParams, trace_memory: bool = False):
+    """Restoring a trusted snapshot with params.size lazy docks, without validation."""
+    return _restore_snapshot(
+        "dock_area_restore_snapshot_trusted", client, params, True, trace_memory
+    )
+
+
+def _theme_widgets(client, params: BenchmarkParams) -> QWidget:
+    """
+    Container with params.size mixed widgets: plain Qt widgets, pyqtgraph plots and theme-aware
+    BEC widgets.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pyqtgraph as pg
+
+    from bec_widgets.widgets.utility.visual.dark_mode_button.dark_mode_button import DarkModeButton
+
+    container = QWidget()
+    layout = QGridLayout(container)
+    factories = (
+        lambda index: QLabel(f"label {index}"),
+        lambda index: QPushButton(f"button {index}"),
+        lambda index: QLineEdit(f"edit {index}"),
+        lambda index: QComboBox(),
+    )
+    for index in range(params.size):
+        if index % THEMED_WIDGET_STEP == 0:
+            widget = DarkModeButton(client=client)
+        elif index % THEMED_WIDGET_STEP == 5:
+            widget = pg.GraphicsLayoutWidget()
+            widget.addPlot()
+        else:
+            widget = factories[index % len(factories)](index)
+        layout.addWidget(widget, *divmod(index, 50))
+    return container
+
+
+def theme_switch(client, params: BenchmarkParams, trace_memory: bool = False):
+    """
+    Switching between the dark and the light theme with params.size mixed widgets, e.g.
+    --size 2000. The latency is the stall of the event loop caused by set_theme; the registered
+    widgets are themed in the frames afterwards.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.utils.colors import set_theme
+    from bec_widgets.utils.theme_registry import get_theme_registry
+    from bec_widgets.widgets.utility.visual.dark_mode_button.dark_mode_button import DarkModeButton
+
+    container = _theme_widgets(client, params)
+    initial_theme = QApplication.instance().theme.theme
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+
+    def send(index: int):
+        set_theme("light" if index % 2 == 0 else "dark")
+
+    try:
+        return measure("theme_switch", container, send, params, trace_memory)
+    finally:
+        set_theme(initial_theme)
+        get_theme_registry().flush()
+        for widget in container.findChildren(DarkModeButton):
+            # runs the cleanup of the BEC widgets
+            widget.close()
+        _close(container)
+
+
+def _queue_content(rows: int) -> dict:
+    info = [
+        {
+            "status": "PENDING",
+            "request_blocks": [
+                {
+                    "content": {"scan_type": "line_scan"},
+                    "scan_number": index,
+                    "scan_id": f"{SCAN_ID}_{index}",
+                }
+            ],
+        }
+        for index in range(rows)
+    ]
+    return {"queue": {"primary": {"info": info}}}
+
+
+def device_browser_and_queue(client, params: BenchmarkParams, trace_memory: bool = False):
+    """
+    Rebuilding a DeviceBrowser with params.size (at most MAX_BROWSER_ROWS) devices and a BECQueue
+    with params.size (at most MAX_QUEUE_ROWS) rows, which create a Material icon per row.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bec_widgets.tests.utils import FakeDevice
+    from bec_widgets.widgets.services.bec_queue.bec_queue import BECQueue
+    from bec_widgets.widgets.services.device_browser.device_browser import DeviceBrowser
+
+    devices = client.device_manager.devices
+    extra_devices = [
+        f"benchmark_device_{index}" for index in range(min(params.size, MAX_BROWSER_ROWS))
+    ]
+    for name in extra_devices:
+        devices[name] = FakeDevice(name)
+    container = QWidget()
+    layout = QHBoxLayout(container)
+    browser = DeviceBrowser(parent=container, client=client)
+    queue = BECQueue(parent=container, client=client)
+    layout.addWidget(browser)
+    layout.addWidget(queue)
+    content = _queue_content(min(params.size, MAX_QUEUE_ROWS))
+    params = replace(params, messages=min(params.messages, LOAD_REPEATS))
+
+    def send(index: int):  # pylint: disable=unused-argument
+        browser.update_device_list()
+        queue.update_queue(content, {})
+
+    try:
+        return measure("device_browser_and_queue", container, send, params, trace_memory)
+    finally:
+        for name in extra_devices:
+            devices.pop(name, None)
+        browser.close()
+        queue.close()
+        _close(container)
+
+
+class _Subscriber(QObject):
+    def __init__(self):
+        super().__init__()
+        self.received = 0
+
+    @SafeSlot(dict, dict)
+    def on_message(self, msg: dict, metadata: dict):  # pylint: disable=unused-argument
+        self.received += 1
+
+
+def dispatcher_fanout(client, params: BenchmarkParams, trace_memory: bool = False):
+    """BECDispatcher delivering a params.size point readback to FANOUT_SUBSCRIBERS slots."""
+    dispatcher = BECDispatcher(client=client)
+    topic = MessageEndpoints.device_readback("samx").endpoint
+    subscribers = [_Subscriber() for _ in range(FANOUT_SUBSCRIBERS)]
+    for subscriber in subscribers:
+        dispatcher.connect_slot(subscriber.on_message, topic)
+    widget = QWidget()
+    rng = np.random.default_rng(0)
+
+    def send(index: int):
+        msg = messages.DeviceMessage(
+            signals={"samx": {"value": rng.random(params.size), "timestamp": index}}
+        )
+        deliver(dispatcher, topic, msg.content, msg.metadata)
+
+    try:
+        return measure("dispatcher_fanout", widget, send, params, trace_memory)
+    finally:
+        for subscriber in subscribers:
+            dispatcher.disconnect_slot(subscriber.on_message, topic)
+        _close(widget)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "waveform_async_readback": waveform_async_readback,
+    "image_update_1d": image_update_1d,
+    "motor_map_update": motor_map_update,
+    "dispatcher_fanout": dispatcher_fanout,
+    "theme_switch": theme_switch,
+    "device_browser_and_queue": device_browser_and_queue,
+    "waveform_load_curves": waveform_load_curves,
+    "waveform_load_curves_batch": waveform_load_curves_batch,
+    "dock_area_save_json": dock_area_save_json,
+    "dock_area_save_snapshot": dock_area_save_snapshot,
+    "dock_area_restore_snapshot": dock_area_restore_snapshot,
+    "dock_area_restore_snapshot_trusted": dock_area_restore_snapshot_trusted,
+}
@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 
 import pytest
@@ -7,6 +8,8 @@ from qtpy.QtWidgets import QApplication
 from bec_widgets.cli.rpc.rpc_register import RPCRegister
 from bec_widgets.utils import bec_dispatcher as bec_dispatcher_module
 from bec_widgets.utils import error_popups
+from bec_widgets.utils.render_scheduler import get_render_scheduler
+from bec_widgets.utils.theme_registry import get_theme_registry
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -60,11 +63,46 @@ def bec_dispatcher(threads_check):  # pylint: disable=unused-argument
     bec_dispatcher_module.BECDispatcher.reset_singleton()
 
 
+@pytest.fixture(autouse=True, scope="session")
+def widget_manifest_cache_dir(tmp_path_factory):
+    """Keep the persisted widget manifests of the test session out of the user's cache."""
+    cache_dir = tmp_path_factory.mktemp("widget_manifest")
+    with mock.patch.dict(os.environ, {"BEC_WIDGETS_CACHE_DIR": str(cache_dir)}):
+        yield cache_dir
+
+
 @pytest.fixture(autouse=True)
 def clean_singleton():
     error_popups._popup_utility_instance = None
 
 
+@pytest.fixture(autouse=True)
+def immediate_rendering():
+    """Apply scheduled repaints right away, such that tests can check the result directly."""
+    scheduler = get_render_scheduler()
+    scheduler.immediate = True
+    yield scheduler
+    scheduler.clear()
+    scheduler.immediate = True
+
+
+@pytest.fixture
+def deferred_rendering(immediate_rendering):
+    """Apply scheduled repaints on the frames of the render scheduler, as in production."""
+    immediate_rendering.immediate = False
+    yield immediate_rendering
+
+
+@pytest.fixture(autouse=True)
+def immediate_theme_updates():
+    """Apply theme changes to all registered widgets right away."""
+    registry = get_theme_registry()
+    registry.immediate = True
+    yield registry
+    registry.clear()
+    registry.immediate = True
+
+
 def create_widget(qtbot, widget, *args, **kwargs):
     """
     Create a widget and add it to the qtbot for testing. This is a helper function that
@@ -1,4 +1,5 @@
 # pylint: disable = no-name-in-module,missing-class-docstring, missing-module-docstring
+import gc
 import threading
 import time
 from unittest import mock
@@ -178,3 +179,102 @@ def test_dispatcher_2_topic_same_cb_with_boundmethod(
 
     send_msg_event.set()
     qtbot.wait(10)
+
+
+@pytest.mark.parametrize("topics_msg_list", [(("topic1", dummy_msg), ("topic2", dummy_msg))])
+def test_dispatcher_reuses_wrapper_per_slot_and_cb_info(bec_dispatcher_w_connector):
+    bec_dispatcher = bec_dispatcher_w_connector
+    cb1 = mock.Mock(spec=[])
+
+    with mock.patch(
+        "bec_widgets.utils.bec_dispatcher.QtThreadSafeCallback", wraps=QtThreadSafeCallback
+    ) as wrapper_cls:
+        bec_dispatcher.connect_slot(cb1, "topic1")
+        bec_dispatcher.connect_slot(cb1, "topic2")
+        assert wrapper_cls.call_count == 1
+        bec_dispatcher.connect_slot(cb1, "topic1", {"scan_id": "1"})
+        assert wrapper_cls.call_count == 2
+
+    assert {topic: len(slots) for topic, slots in bec_dispatcher._slots_by_topic.items()} == {
+        "topic1": 2,
+        "topic2": 1,
+    }
+    bec_dispatcher.disconnect_topics("topic1")
+    assert set(bec_dispatcher._slots_by_topic) == {"topic2"}
+    assert len(bec_dispatcher._registered_slots) == 1
+    bec_dispatcher.disconnect_slot(cb1, "topic2")
+    assert not bec_dispatcher._registered_slots
+    assert not bec_dispatcher._slots_by_callable
+    assert not bec_dispatcher._slots_by_topic
+
+
+@pytest.mark.parametrize("topics_msg_list", [(("topic1", dummy_msg),)])
+def test_dispatcher_releases_slot_of_deleted_object(bec_dispatcher_w_connector):
+    bec_dispatcher = bec_dispatcher_w_connector
+
+    class MockObject:
+        def mock_slot(self, msg, metadata):
+            pass
+
+    obj = MockObject()
+    bec_dispatcher.connect_slot(obj.mock_slot, "topic1")
+    assert len(bec_dispatcher.client.connector._topics_cb) == 1
+
+    del obj
+    gc.collect()
+
+    assert not bec_dispatcher._registered_slots
+    assert not bec_dispatcher._slots_by_topic
+    assert len(bec_dispatcher.client.connector._topics_cb) == 0
+
+
+@pytest.mark.parametrize("topics_msg_list", [(("topic1", dummy_msg), ("topic2", dummy_msg))])
+def test_dispatcher_suspended_slot_keeps_latest_message(qtbot, bec_dispatcher_w_connector):
+    bec_dispatcher = bec_dispatcher_w_connector
+    cb = mock.Mock(spec=[])
+    bec_dispatcher.suspend_slot(cb)
+    bec_dispatcher.connect_slot(cb, ["topic1", "topic2"])
+    (qt_slot,) = bec_dispatcher._registered_slots.values()
+    assert qt_slot.suspended
+
+    for value in range(3):
+        qt_slot({"value": value}, {}, topic="topic1")
+    qt_slot({"value": 10}, {}, topic="topic2")
+    qtbot.wait(10)
+    cb.assert_not_called()
+
+    bec_dispatcher.resume_slot(cb)
+    assert cb.call_args_list == [mock.call({"value": 2}, {}), mock.call({"value": 10}, {})]
+
+    bec_dispatcher.suspend_slot(cb)
+    qt_slot({"value": 3}, {}, topic="topic1")
+    bec_dispatcher.resume_slot(cb, catch_up=False)
+    assert cb.call_count == 2
+
+
+def test_resuming_slot_does_not_lose_messages_of_listener_thread(qtbot):
+    received = []
+
+    def cb(msg, metadata):
+        received.append(msg["value"])
+
+    qt_slot = QtThreadSafeCallback(cb)
+    qt_slot.topics.add("topic")
+    count = 2000
+    done = threading.Event()
+
+    def listener():
+        for value in range(count):
+            qt_slot({"value": value}, {}, topic="topic")
+        done.set()
+
+    qt_slot.set_suspended(True)
+    thread = threading.Thread(target=listener)
+    thread.start()
+    while not done.is_set():
+        qt_slot.set_suspended(False)
+        qt_slot.set_suspended(True)
+    thread.join()
+    qt_slot.set_suspended(False)
+    # the last message is either delivered on resume or queued behind the caught up messages
+    qtbot.waitUntil(lambda: count - 1 in received)
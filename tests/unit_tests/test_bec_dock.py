@@ -164,3 +164,77 @@ def test_toolbar_add_utils_progress_bar(bec_dock_area):
         bec_dock_area.panels["ring_progress_bar_0"].widgets[0].config.widget_class
         == "RingProgressBar"
     )
+
+
+def test_restore_state_builds_visible_docks_only(bec_dock_area, qtbot):
+    names = [f"dock_{index}" for index in range(40)]
+    bec_dock_area.config.docks = {
+        name: {
+            "widget_class": "BECDock",
+            "widgets": {
+                f"waveform_{name}": {"widget_class": "Waveform", "color_palette": "viridis"}
+            },
+        }
+        for name in names
+    }
+    # four tab stacks of ten docks, only the first dock of each stack is visible
+    state = {
+        "main": (
+            "vertical",
+            [
+                ("tab", [("dock", name, {}) for name in names[start : start + 10]], {"index": 0})
+                for start in range(0, 40, 10)
+            ],
+            {"sizes": [100, 100, 100, 100]},
+        ),
+        "float": [],
+    }
+    bec_dock_area.restore_state(state)
+    assert len(bec_dock_area.panels) == 40
+    visible = {"dock_0", "dock_10", "dock_20", "dock_30"}
+    qtbot.waitUntil(lambda: all(bec_dock_area.panels[name].is_materialized for name in visible))
+    qtbot.wait(50)
+    built = {name for name, dock in bec_dock_area.panels.items() if dock.is_materialized}
+    assert built == visible
+    assert list(bec_dock_area.panels["dock_0"].elements) == ["waveform_dock_0"]
+    # the widgets are built from their saved configs
+    assert bec_dock_area.panels["dock_0"].elements["waveform_dock_0"].color_palette == "viridis"
+
+    # RPC access builds the widgets of hidden docks
+    dock = bec_dock_area.panels["dock_5"]
+    assert not dock.is_materialized
+    assert "waveform_dock_5" in dock.config.widgets
+    waveform = dock.elements["waveform_dock_5"]
+    assert waveform.__class__.__name__ == "Waveform"
+    assert waveform.color_palette == "viridis"
+    assert dock.config.widgets["waveform_dock_5"] is waveform.config
+    assert dock.is_materialized
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_save_and_load_snapshot(bec_dock_area, qtbot, tmp_path, trusted):
+    first = bec_dock_area.new(name="dock_0", widget="Waveform", widget_name="waveform_0")
+    bec_dock_area.new(name="dock_1", widget="Waveform", position="above", relative_to=first)
+    first.elements["waveform_0"].color_palette = "viridis"
+    path = str(tmp_path / "layout.snapshot")
+    bec_dock_area.save_snapshot(path)
+    widget_config = bec_dock_area.panels["dock_0"].config.widgets["waveform_0"]
+
+    bec_dock_area.delete_all()
+    qtbot.wait(50)
+    assert bec_dock_area.panels == {}
+    bec_dock_area.load_snapshot(path, trusted=trusted)
+
+    assert set(bec_dock_area.panels) == {"dock_0", "dock_1"}
+    assert bec_dock_area.config.gui_id == bec_dock_area.gui_id
+    dock = bec_dock_area.panels["dock_0"]
+    if not dock.is_materialized:
+        assert dock.config.widgets["waveform_0"]["gui_id"] == widget_config.gui_id
+    waveform = dock.elements["waveform_0"]
+    assert waveform.__class__.__name__ == "Waveform"
+    # the saved widget settings are restored
+    assert waveform.color_palette == "viridis"
+    assert isinstance(waveform.config, type(widget_config))
+    assert waveform.gui_id != widget_config.gui_id
+    other = bec_dock_area.panels["dock_1"].element_list
+    assert [widget.color_palette for widget in other] == ["plasma"]
@@ -2,12 +2,15 @@
 from unittest import mock
 
 import pytest
+from bec_lib.endpoints import MessageEndpoints
 from bec_lib.messages import BECStatus, ServiceMetricMessage, StatusMessage
 
 from bec_widgets.widgets.services.bec_status_box.bec_status_box import (
     BECServiceInfoContainer,
+    BECServiceStatusMixin,
     BECStatusBox,
 )
+from bec_widgets.widgets.services.bec_status_box.status_item import StatusItem
 
 from .client_mocks import mocked_client
 
@@ -124,3 +127,68 @@ def test_double_click_item(status_box):
     with mock.patch.object(status_item, "show_popup") as mock_show_popup:
         status_box.tree.itemDoubleClicked.emit(item, 0)
         assert mock_show_popup.call_count == 1
+
+
+def test_unchanged_services_do_not_update_widgets(status_box):
+    status_box.CORE_SERVICES = ["core_service"]
+    info = {"version": "1.0"}
+    services_status = {
+        "core_service": StatusMessage(name="core_service", status=BECStatus.RUNNING, info=info),
+        "test_service": StatusMessage(name="test_service", status=BECStatus.IDLE, info=info),
+    }
+    services_metrics = {"test_service": ServiceMetricMessage(name="test_service", metrics={})}
+    status_box.update_service_status(dict(services_status), dict(services_metrics))
+    core_state_spy = mock.MagicMock()
+    status_box.bec_core_state.connect(core_state_spy)
+
+    with mock.patch.object(StatusItem, "update_ui") as update_ui:
+        for _ in range(10):
+            status_box.update_service_status(dict(services_status), dict(services_metrics))
+        assert update_ui.call_count == 0
+        assert core_state_spy.call_count == 0
+
+        # metrics only update the popup
+        services_metrics["test_service"] = ServiceMetricMessage(
+            name="test_service", metrics={"cpu_percent": 1}
+        )
+        with mock.patch.object(StatusItem, "update_metrics") as update_metrics:
+            status_box.update_service_status(dict(services_status), dict(services_metrics))
+        assert update_metrics.call_count == 1
+        assert update_ui.call_count == 0
+
+        services_status["test_service"] = StatusMessage(
+            name="test_service", status=BECStatus.BUSY, info=info
+        )
+        status_box.update_service_status(dict(services_status), dict(services_metrics))
+        assert update_ui.call_count == 1
+        assert core_state_spy.call_count == 0
+
+
+def test_service_status_mixin_emits_changes_only(qtbot, mocked_client):
+    mocked_client._services_info = {}
+    mocked_client._services_metric = {}
+    mixin = BECServiceStatusMixin(None, client=mocked_client)
+    spy = mock.MagicMock()
+    mixin.services_update.connect(spy)
+    pattern = MessageEndpoints.service_status("*").endpoint
+    assert mixin.bec_dispatcher.slot_count(pattern) == 1
+
+    msg = StatusMessage(name="test_service", status=BECStatus.RUNNING, info={})
+    # pushed updates are held back until the running services are known
+    mixin._on_service_status(msg.content, msg.metadata)
+    assert spy.call_count == 0
+    qtbot.waitUntil(lambda: spy.call_count == 1)
+
+    for _ in range(5):
+        mixin._on_service_status(msg.content, msg.metadata)
+    assert spy.call_count == 2
+    metrics = ServiceMetricMessage(name="test_service", metrics={"cpu_percent": 1})
+    for _ in range(5):
+        mixin._on_service_metrics(metrics.content, metrics.metadata)
+    assert spy.call_count == 3
+    services_info, services_metric = spy.call_args[0]
+    assert services_info["test_service"].status == BECStatus.RUNNING
+    assert services_metric["test_service"].metrics == {"cpu_percent": 1}
+
+    mixin.cleanup()
+    assert mixin.bec_dispatcher.slot_count(pattern) == 0
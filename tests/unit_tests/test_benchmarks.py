@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from tests.benchmarks.__main__ import main
+from tests.benchmarks.compare import compare_results
+from tests.benchmarks.harness import BenchmarkParams, summarize
+from tests.benchmarks.scenarios import SCENARIOS
+
+from .client_mocks import mocked_client
+
+
+def _results(p50, throughput):
+    return {
+        "results": {
+            "scenario": {
+                "latency_ms": {"p50": p50, "p95": 2 * p50},
+                "throughput": throughput,
+                "peak_memory": 0,
+                "frame_time_ms": {},
+            }
+        }
+    }
+
+
+def test_summarize():
+    summary = summarize([0.001, 0.002, 0.003])
+    assert summary["p50"] == pytest.approx(2.0)
+    assert summary["max"] == pytest.approx(3.0)
+    assert summarize([]) == {}
+
+
+def test_compare_results_flags_regressions():
+    comparisons = compare_results(_results(1.0, 100.0), _results(1.1, 50.0), threshold=0.2)
+    by_metric = {comparison.metric: comparison for comparison in comparisons}
+    assert not by_metric["latency p50"].regression
+    assert by_metric["throughput"].regression
+    # metrics missing or zero in the baseline are not compared
+    assert "peak memory" not in by_metric
+    assert "frame time p95" not in by_metric
+
+
+def test_compare_command_exit_code(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(1.0, 100.0)))
+    current.write_text(json.dumps(_results(1.0, 100.0)))
+    assert main(["compare", str(baseline), str(current)]) == 0
+    current.write_text(json.dumps(_results(2.0, 100.0)))
+    assert main(["compare", str(baseline), str(current)]) == 1
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_scenarios_run(qtbot, mocked_client, scenario):
+    params = BenchmarkParams(messages=5, size=10, frame_rate=0)
+    result = SCENARIOS[scenario](mocked_client, params, True)
+    assert result.messages == 5
+    assert result.latency_ms["p50"] > 0
+    assert result.throughput > 0
+    assert result.peak_memory > 0
+    assert result.frame_time_ms == {}
@@ -86,3 +86,60 @@ def test_client_utils_passes_client_config_to_server(bec_dispatcher):
                 config=mixin._client._service_config.config,
                 logger=mock.ANY,
             )
+
+
+def test_client_utils_start_plot_process_without_gui_class():
+    with mock.patch("bec_widgets.cli.client_utils.subprocess.Popen") as mock_popen:
+        _start_plot_process("gui_id", "bec", None, gui_class=None)
+        command = mock_popen.call_args.args[0]
+        assert command == ["bec-gui-server", "--id", "gui_id", "--gui_class_id", "bec", "--hide"]
+
+
+def test_client_utils_registry_update_signals_readiness(bec_dispatcher):
+    mixin = BECGuiClient()
+    mixin._client = bec_dispatcher.client
+    mixin._startup_timeline = {"requested": 0}
+    state = {
+        "gui_id": {"gui_id": "gui_id", "object_name": "launcher", "widget_class": "LaunchWindow"}
+    }
+    msg = mock.MagicMock()
+    msg.state = state
+    with mock.patch.object(mixin, "_update_dynamic_namespace"):
+        BECGuiClient._handle_registry_update({"data": msg}, parent=mixin)
+        assert not mixin._gui_started_event.is_set()
+        msg.state = state | {"bec": {}}
+        BECGuiClient._handle_registry_update({"data": msg}, parent=mixin)
+    assert mixin._gui_started_event.is_set()
+    assert "ready" in mixin.startup_timeline
+
+
+def test_client_utils_adopts_warm_spare(bec_dispatcher):
+    mixin = BECGuiClient(warm_spare=True, gui_id="gui_id")
+    mixin._client = bec_dispatcher.client
+    spare_process = mock.MagicMock()
+    spare_process.poll.return_value = None
+    with (
+        mock.patch(
+            "bec_widgets.cli.client_utils._start_plot_process", return_value=(spare_process, None)
+        ) as mock_start_plot,
+        mock.patch.object(mixin, "_launch_on_adopted_spare") as mock_launch,
+    ):
+        mixin.warm_spare = True
+        spare = mixin._warm_spare
+        assert spare is not None
+        mock_start_plot.assert_called_once_with(
+            spare.gui_id, gui_class_id="bec", config=mock.ANY, gui_class=None, logger=mock.ANY
+        )
+
+        mixin._start(wait=False)
+        mixin._spare_launch_thread.join()
+        mock_launch.assert_called_once_with(spare)
+        assert mixin._gui_id == spare.gui_id
+        assert mixin._process is spare_process
+        # a new spare is started in the background
+        assert mixin._warm_spare is not None and mixin._warm_spare is not spare
+        assert mixin._warm_spare.gui_id.startswith("gui_id_spare_")
+        assert mock_start_plot.call_count == 2
+
+        mixin.warm_spare = False
+        assert mixin._warm_spare is None
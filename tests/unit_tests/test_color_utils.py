@@ -1,3 +1,4 @@
+import numpy as np
 import pyqtgraph as pg
 import pytest
 from pydantic import ValidationError
@@ -6,7 +7,16 @@ from qtpy.QtWidgets import QVBoxLayout, QWidget
 
 from bec_widgets.utils import Colors, ConnectionConfig
 from bec_widgets.utils.bec_widget import BECWidget
-from bec_widgets.utils.colors import apply_theme
+from bec_widgets.utils.colors import (
+    apply_graphics_theme,
+    apply_theme,
+    get_colormap,
+    get_colormap_lut,
+    get_colormap_preview,
+    get_colormap_qcolors,
+    get_stylesheet,
+    get_theme_colors,
+)
 from bec_widgets.widgets.plots.waveform.curve import CurveConfig
 from tests.unit_tests.client_mocks import mocked_client
 from tests.unit_tests.conftest import create_widget
@@ -134,7 +144,9 @@ class ExamplePlotWidget(BECWidget, QWidget):
     ) -> None:
         if config is None:
             config = ConnectionConfig(widget_class=self.__class__.__name__)
-        super().__init__(parent=parent, client=client, gui_id=gui_id, config=config, **kwargs)
+        super().__init__(
+            parent=parent, client=client, gui_id=gui_id, config=config, theme_update=True, **kwargs
+        )
 
         self.layout = QVBoxLayout(self)
         self.glw = pg.GraphicsLayoutWidget()
@@ -144,6 +156,9 @@ class ExamplePlotWidget(BECWidget, QWidget):
         self.glw.addItem(self.pi)
         self.pi.plot([1, 2, 3, 4, 5], pen="r")
 
+    def apply_theme(self, theme: str):
+        apply_graphics_theme(self.glw, theme)
+
 
 def test_apply_theme(qtbot, mocked_client):
     widget = create_widget(qtbot, ExamplePlotWidget, client=mocked_client)
@@ -168,3 +183,51 @@ def test_apply_theme(qtbot, mocked_client):
     assert light_bg == "#e9ecef"
     assert light_axis_color == "#666666"
     assert light_label_color == "#000000"
+
+
+def test_theme_resources_are_cached(qtbot):
+    assert get_stylesheet("dark") is get_stylesheet("dark")
+    assert get_stylesheet("dark") != get_stylesheet("light")
+    colors = get_theme_colors("light")
+    assert get_theme_colors("light") is colors
+    assert colors.axis_pen.color().name() == "#666666"
+    assert colors.text_pen.color().name() == "#000000"
+
+
+def test_colormap_cache():
+    assert get_colormap("viridis") is get_colormap("viridis")
+
+    lut = get_colormap_lut("viridis")
+    assert lut.shape == (256, 3)
+    assert lut.dtype == np.uint8
+    assert not lut.flags.writeable
+    np.testing.assert_array_equal(
+        lut, pg.colormap.get("viridis").getLookupTable(start=0.0, stop=1.0, alpha=False)
+    )
+    assert get_colormap_lut("viridis") is lut
+    assert get_colormap_lut("viridis", 0.2, 1.0) is not lut
+
+    qcolors = get_colormap_qcolors("viridis")
+    assert len(qcolors) == 256
+    assert qcolors[0].getRgb()[:3] == tuple(lut[0])
+
+
+def test_colormap_preview_cache(qtbot):
+    preview = get_colormap_preview("magma", 25, 10)
+    assert preview.width() == 25
+    assert preview.height() == 10
+    assert get_colormap_preview("magma", 25, 10) is preview
+    image = preview.toImage()
+    lut = get_colormap_lut("magma")
+    assert image.pixelColor(0, 5).getRgb()[:3] == tuple(lut[0])
+    assert image.pixelColor(24, 5).getRgb()[:3] == tuple(lut[-1])
+
+
+def test_evenly_spaced_colors_are_cached():
+    get_colormap.cache_clear()
+    first = Colors.evenly_spaced_colors(colormap="plasma", num=7, format="HEX", theme="dark")
+    info = get_colormap.cache_info()
+    second = Colors.evenly_spaced_colors(colormap="plasma", num=7, format="HEX", theme="dark")
+    assert first == second
+    assert first is not second
+    assert get_colormap.cache_info().misses == info.misses
@@ -0,0 +1,91 @@
+# pylint: skip-file
+from collections import Counter
+from unittest import mock
+
+import pytest
+
+from bec_widgets.tests.utils import FakeDevice, FakePositioner
+from bec_widgets.utils.entry_validator import EntryValidator
+from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+from .client_mocks import mocked_client
+from .conftest import create_widget
+
+
+@pytest.fixture
+def describe_calls():
+    calls = Counter()
+
+    def counting(original):
+        def describe(device):
+            calls[device.name] += 1
+            return original(device)
+
+        return describe
+
+    with (
+        mock.patch.object(FakeDevice, "describe", counting(FakeDevice.describe)),
+        mock.patch.object(FakePositioner, "describe", counting(FakePositioner.describe)),
+    ):
+        yield calls
+
+
+def test_validate_signal_is_cached(mocked_client, describe_calls):
+    validator = EntryValidator(mocked_client.device_manager.devices)
+    for _ in range(3):
+        assert validator.validate_signal("samx", None) == "samx"
+        assert validator.validate_signal("samx", "samx_setpoint") == "samx_setpoint"
+        assert validator.validate_signal("bpm4i", "") == "bpm4i"
+    assert describe_calls == {"samx": 1, "bpm4i": 1}
+
+    with pytest.raises(ValueError):
+        validator.validate_signal("samx", "non_existent")
+    with pytest.raises(ValueError):
+        validator.validate_signal("non_existent", None)
+
+
+def test_validation_cache_is_invalidated_by_config_updates(mocked_client, describe_calls):
+    validator = EntryValidator(mocked_client.device_manager.devices)
+    validator.validate_signal("samx", None)
+    validator.validate_signal("bpm4i", None)
+
+    validator.on_device_config_update({"action": "update", "config": {"samx": {}}}, {})
+    validator.validate_signal("samx", None)
+    validator.validate_signal("bpm4i", None)
+    assert describe_calls == {"samx": 2, "bpm4i": 1}
+
+    validator.on_device_config_update({"action": "reload", "config": {}}, {})
+    validator.validate_signal("samx", None)
+    validator.validate_signal("bpm4i", None)
+    assert describe_calls == {"samx": 3, "bpm4i": 2}
+
+
+def test_restoring_many_curves_describes_each_device_once(qtbot, mocked_client, describe_calls):
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    devices = ["bpm4i", "bpm3a", "gauss_bpm", "gauss_adc1", "samx"]
+    configs = [
+        {"y_name": devices[index % len(devices)], "x_name": "samy", "label": f"curve-{index}"}
+        for index in range(100)
+    ]
+    wf.plot_many(configs)
+    assert len(wf.curves) == 100
+    assert set(describe_calls) == {*devices, "samy"}
+    assert max(describe_calls.values()) == 1
+
+
+def test_restoring_curve_json_describes_each_device_once(qtbot, mocked_client, describe_calls):
+    devices = ["bpm4i", "bpm3a", "gauss_bpm", "gauss_adc1", "samx"]
+    source = create_widget(qtbot, Waveform, client=mocked_client)
+    source.plot_many(
+        [
+            {"y_name": devices[index % len(devices)], "x_name": "samy", "label": f"curve-{index}"}
+            for index in range(100)
+        ]
+    )
+    layout = source.curve_json
+
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    describe_calls.clear()
+    wf.curve_json = layout
+    assert len(wf.curves) == 100
+    assert max(describe_calls.values(), default=0) <= 1
@@ -1,3 +1,4 @@
+import time
 from textwrap import dedent
 from unittest import mock
 
@@ -5,8 +6,9 @@ import black
 import isort
 import pytest
 
-from bec_widgets.cli.generate_cli import ClientGenerator
-from bec_widgets.utils.plugin_utils import BECClassContainer, BECClassInfo
+from bec_widgets.cli import client, generate_cli
+from bec_widgets.cli.generate_cli import ClientGenerator, format_client_code, generate_client_file
+from bec_widgets.utils.plugin_utils import BECClassContainer, BECClassInfo, get_custom_classes
 
 # pylint: disable=missing-function-docstring
 
@@ -257,3 +259,86 @@ c = a + b"""
         content = file.read()
 
     assert corrected in content
+
+
+def _mock_container() -> BECClassContainer:
+    container = BECClassContainer()
+    for cls in (MockBECWaveform1D, MockBECFigure):
+        container.add_class(
+            BECClassInfo(
+                name=cls.__name__,
+                module="test_module",
+                file="test_file",
+                obj=cls,
+                is_connector=True,
+                is_widget=True,
+                is_plugin=False,
+            )
+        )
+    return container
+
+
+def test_write_formats_stubs_like_full_file(tmp_path):
+    generator = ClientGenerator(base=True)
+    generator.generate_client(_mock_container())
+    file_name = tmp_path / "client.py"
+
+    assert generator.write(str(file_name))
+    assert file_name.read_text() == format_client_code(generator.header + "\n" + generator.content)
+    assert set(generator.stub_cache) == {"__preamble__", "MockBECWaveform1D", "MockBECFigure"}
+
+
+def test_write_reuses_formatted_stubs(tmp_path):
+    file_name = tmp_path / "client.py"
+    first = ClientGenerator(base=True)
+    first.generate_client(_mock_container())
+    first.write(str(file_name))
+    content = file_name.read_text()
+
+    second = ClientGenerator(base=True)
+    second.generate_client(_mock_container())
+    with mock.patch.object(generate_cli, "format_client_code") as format_code:
+        assert not second.write(str(file_name), stub_cache=first.stub_cache)
+    format_code.assert_not_called()
+    assert file_name.read_text() == content
+
+
+def test_noop_client_generation_is_fast(tmp_path, monkeypatch):
+    widgets_dir = tmp_path / "fake_plugin_repo" / "bec_widgets"
+    (widgets_dir / "widgets").mkdir(parents=True)
+    (tmp_path / "fake_plugin_repo" / "__init__.py").touch()
+    (widgets_dir / "__init__.py").touch()
+    widget_file = widgets_dir / "widgets" / "widget.py"
+    widget_file.write_text("USER_ACCESS = []\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    client_path = str(widgets_dir / "widgets" / "client.py")
+
+    with mock.patch.object(
+        generate_cli, "get_custom_classes", return_value=_mock_container()
+    ) as get_classes:
+        assert generate_client_file("fake_plugin_repo.bec_widgets", client_path) is not None
+        content = widget_file.parent.joinpath("client.py").read_text()
+        assert "class MockBECFigure(RPCBase):" in content
+
+        start = time.perf_counter()
+        assert generate_client_file("fake_plugin_repo.bec_widgets", client_path) is None
+        assert time.perf_counter() - start < 0.5
+        get_classes.assert_called_once()
+
+        # changed sources or a forced run generate the client again
+        widget_file.write_text("USER_ACCESS = ['method']\n")
+        assert generate_client_file("fake_plugin_repo.bec_widgets", client_path) is not None
+        assert generate_client_file("fake_plugin_repo.bec_widgets", client_path, force=True)
+        assert get_classes.call_count == 3
+
+
+def test_client_is_in_sync_with_widgets():
+    """
+    The generated client must be regenerated with bw-generate-cli whenever the RPC interface or
+    the docstrings of USER_ACCESS methods change.
+    """
+    generator = ClientGenerator(base=True)
+    generator.generate_client(get_custom_classes("bec_widgets"))
+    expected = format_client_code(generator.header + "\n" + generator.content)
+    with open(client.__file__, "r", encoding="utf-8") as file:
+        assert file.read() == expected, "cli/client.py is outdated, run bw-generate-cli"
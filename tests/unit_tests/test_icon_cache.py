@@ -0,0 +1,75 @@
+# pylint: skip-file
+from unittest import mock
+
+import pytest
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QColor, QIcon, QPixmap
+from qtpy.QtWidgets import QApplication
+
+from bec_widgets.utils import icon_cache
+from bec_widgets.utils.colors import set_theme
+from bec_widgets.utils.icon_cache import IconCache, get_icon_cache, material_icon
+
+
+@pytest.fixture
+def render():
+    get_icon_cache().clear()
+    with mock.patch.object(
+        icon_cache, "_render_material_icon", wraps=icon_cache._render_material_icon
+    ) as render:
+        yield render
+    get_icon_cache().clear()
+
+
+def test_material_icon_is_rendered_once(render):
+    cache = get_icon_cache()
+    hits, misses = cache.hits, cache.misses
+    first = material_icon("cancel", size=(20, 20), color="#cc181e", filled=True)
+    second = material_icon("cancel", size=QSize(20, 20), color="#cc181e", filled=True)
+    assert render.call_count == 1
+    assert isinstance(first, QPixmap)
+    assert first is not second
+    assert first.cacheKey() == second.cacheKey()
+    assert (cache.hits - hits, cache.misses - misses) == (1, 1)
+
+    icon = material_icon("cancel", color="#cc181e", filled=True, convert_to_pixmap=False)
+    assert isinstance(icon, QIcon)
+    material_icon("cancel", color="#cc181e", filled=True, convert_to_pixmap=False)
+    assert render.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"size": (30, 30)},
+        {"color": "#000000"},
+        {"color": QColor("#cc181e")},
+        {"color": {"dark": "#cc181e", "light": "#000000"}},
+        {"filled": False},
+        {"rotate": 90},
+    ],
+)
+def test_material_icon_arguments_are_part_of_the_key(render, kwargs):
+    arguments = {"size": (20, 20), "color": "#cc181e", "filled": True}
+    material_icon("cancel", **arguments)
+    material_icon("cancel", **{**arguments, **kwargs})
+    material_icon("cancel", **{**arguments, **kwargs})
+    assert render.call_count == 2
+
+
+def test_icon_cache_drops_least_recently_used():
+    cache = IconCache(max_size=2)
+    for key in ("a", "b"):
+        cache.put(key, QPixmap(1, 1))
+    assert cache.get("a") is not None
+    cache.put("c", QPixmap(1, 1))
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 2, "max_size": 2}
+
+
+def test_icon_cache_is_cleared_on_theme_change(qtbot, render):
+    set_theme("dark")
+    material_icon("cancel")
+    assert len(get_icon_cache()) == 1
+    QApplication.instance().theme_signal.theme_updated.emit("light")
+    assert len(get_icon_cache()) == 0
@@ -0,0 +1,61 @@
+# pylint: skip-file
+from typing import Any, Optional
+
+import pytest
+from bec_lib.serialization import msgpack
+from pydantic import BaseModel
+
+from bec_widgets.utils.layout_snapshot import (
+    SNAPSHOT_VERSION,
+    construct_model,
+    dump_snapshot,
+    load_snapshot,
+)
+
+
+class ItemConfig(BaseModel):
+    label: str = "item"
+    size: int = 1
+
+
+class ContainerConfig(BaseModel):
+    items: dict[str, ItemConfig] = {}
+    selected: Optional[ItemConfig] = None
+    extra: dict[str, Any] = {}
+
+
+@pytest.fixture
+def config():
+    yield ContainerConfig(
+        items={"a": ItemConfig(label="a"), "b": ItemConfig(size=2)},
+        selected=ItemConfig(label="selected"),
+        extra={"state": {"main": ("vertical", [("dock", "a", {})], {})}},
+    )
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_snapshot_round_trip(config, trusted):
+    restored = load_snapshot(dump_snapshot(config), ContainerConfig, trusted=trusted)
+    assert isinstance(restored.items["b"], ItemConfig)
+    assert isinstance(restored.selected, ItemConfig)
+    assert restored.items == config.items
+    assert restored.selected == config.selected
+    assert restored.extra["state"]["main"][1][0][1] == "a"
+
+
+def test_construct_model_skips_validation():
+    config = construct_model(ContainerConfig, {"items": {"a": {"size": "not validated"}}})
+    assert config.items["a"].size == "not validated"
+    assert config.items["a"].label == "item"
+
+
+def test_load_snapshot_rejects_invalid_data(config):
+    with pytest.raises(ValueError):
+        load_snapshot(b"no snapshot", ContainerConfig)
+    with pytest.raises(ValueError):
+        load_snapshot(msgpack.dumps({"config": {}}), ContainerConfig)
+    newer = msgpack.dumps(
+        {"schema": "bec_widgets.snapshot", "version": SNAPSHOT_VERSION + 1, "config": {}}
+    )
+    with pytest.raises(ValueError):
+        load_snapshot(newer, ContainerConfig)
@@ -2,6 +2,7 @@ from unittest import mock
 
 import numpy as np
 import pytest
+from qtpy.QtWidgets import QPushButton, QTreeWidgetItem
 
 from bec_widgets.widgets.dap.lmfit_dialog.lmfit_dialog import LMFitDialog
 
@@ -182,3 +183,36 @@ def test_update_summary_tree(lmfit_dialog, lmfit_message):
     assert lmfit_dialog.ui.param_tree.topLevelItemCount() == 4
     assert lmfit_dialog.ui.param_tree.topLevelItem(0).text(0) == "amplitude"
     assert lmfit_dialog.ui.param_tree.topLevelItem(0).text(1) == "1.582"
+
+
+def test_update_summary_tree_reuses_items(lmfit_dialog, lmfit_message):
+    lmfit_dialog.active_action_list = ["center"]
+    lmfit_dialog.update_summary_tree(data=lmfit_message, metadata={"curve_id": "test_curve_id"})
+    param_tree = lmfit_dialog.ui.param_tree
+    first_row = param_tree.topLevelItem(0)
+    param_tree.setCurrentItem(first_row)
+    button = lmfit_dialog.action_buttons["center"]
+    move_action = mock.MagicMock()
+    lmfit_dialog.move_action.connect(move_action)
+
+    module = "bec_widgets.widgets.dap.lmfit_dialog.lmfit_dialog"
+    with (
+        mock.patch(f"{module}.QTreeWidgetItem", wraps=QTreeWidgetItem) as item_cls,
+        mock.patch(f"{module}.QPushButton", wraps=QPushButton) as button_cls,
+    ):
+        for index in range(1000):
+            data = dict(lmfit_message, chisqr=float(index))
+            data["params"] = [[param[0], param[1] + index, *param[2:]] for param in data["params"]]
+            lmfit_dialog.update_summary_tree(data=data, metadata={"curve_id": "test_curve_id"})
+        assert item_cls.call_count == 0
+        assert button_cls.call_count == 0
+
+    assert lmfit_dialog.ui.summary_tree.topLevelItemCount() == 6
+    assert lmfit_dialog.ui.summary_tree.topLevelItem(2).text(1) == "999.000"
+    assert param_tree.topLevelItemCount() == 4
+    assert param_tree.topLevelItem(0).text(1) == f"{1.5824142042890903 + 999:.3f}"
+    assert param_tree.currentItem() is first_row
+    assert lmfit_dialog.ui.curve_list.count() == 1
+    assert lmfit_dialog.action_buttons["center"] is button
+    button.click()
+    assert move_action.call_args == mock.call(("center", -2.8415356591834326 + 999))
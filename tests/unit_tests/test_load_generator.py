@@ -0,0 +1,87 @@
+from collections import Counter
+from unittest import mock
+
+import pytest
+from bec_lib import messages
+from bec_lib.endpoints import MessageEndpoints
+from bec_lib.redis_connector import MessageObject
+
+from bec_widgets.utils.load_generator import (
+    LoadGenerator,
+    StreamConfig,
+    StreamRecorder,
+    endpoint_from_string,
+    load_recording,
+    replay,
+)
+
+
+def test_stream_config_from_string():
+    config = StreamConfig.from_string("device_monitor_1d:5:512:waveform1d")
+    assert config == StreamConfig(kind="device_monitor_1d", rate=5, size=512, device="waveform1d")
+    assert StreamConfig.from_string("device_readback:10").device == "samx"
+    with pytest.raises(ValueError):
+        StreamConfig.from_string("unknown:10")
+    with pytest.raises(ValueError):
+        StreamConfig.from_string("log")
+
+
+def test_load_generator_schedule():
+    streams = [StreamConfig("scan", rate=100, size=2), StreamConfig("device_readback", rate=10)]
+    generator = LoadGenerator(mock.MagicMock(), streams, scan_points=10, seed=0)
+    schedule = list(generator.schedule(0.5))
+
+    assert [due for due, _, _ in schedule] == sorted(due for due, _, _ in schedule)
+    counts = Counter(type(msg).__name__ for _, _, msg in schedule)
+    assert counts == {"ScanMessage": 50, "DeviceMessage": 5, "ScanStatusMessage": 10}
+    segment = next(msg for _, _, msg in schedule if isinstance(msg, messages.ScanMessage))
+    assert set(segment.data) == {"samx", "bpm4i", "bpm3a"}
+
+
+def test_load_generator_run_publishes_by_endpoint_type():
+    connector = mock.MagicMock()
+    streams = [
+        StreamConfig("device_readback", rate=10),
+        StreamConfig("device_monitor_1d", rate=10, size=20),
+        StreamConfig("log", rate=10),
+    ]
+    sent = LoadGenerator(connector, streams).run(0.2, speed=0)
+
+    assert sent == 6
+    assert connector.set_and_publish.call_count == 2
+    assert connector.xadd.call_count == 4
+    endpoint, payload = connector.xadd.call_args_list[0].args
+    assert endpoint == MessageEndpoints.device_monitor_1d("waveform1d")
+    assert payload["data"].data.shape == (20,)
+
+
+def test_record_and_replay(tmp_path):
+    connector = mock.MagicMock()
+    endpoints = [endpoint_from_string("device_readback:samx"), MessageEndpoints.log()]
+    recorder = StreamRecorder(connector, endpoints)
+    recorder.start()
+    assert connector.register.call_count == 2
+
+    readback = messages.DeviceMessage(signals={"samx": {"value": 1.0, "timestamp": 0}})
+    log = messages.LogMessage(log_type="info", log_msg="test")
+    recorder._on_message(
+        MessageObject(topic="info/devices/readback/samx", value=readback),
+        topic="info/devices/readback/samx",
+        op="set_and_publish",
+    )
+    recorder._on_message({"data": log}, topic="user/log", op="xadd")
+    recorder.stop()
+    path = str(tmp_path / "recording.jsonl")
+    recorder.save(path)
+
+    records = load_recording(path)
+    assert [(topic, op) for _, topic, op, _ in records] == [
+        ("info/devices/readback/samx", "set_and_publish"),
+        ("user/log", "xadd"),
+    ]
+    assert records[0][3] == readback
+
+    target = mock.MagicMock()
+    assert replay(target, records, speed=0) == 2
+    target.set_and_publish.assert_called_once_with("info/devices/readback/samx", readback)
+    assert target.xadd.call_args.args[1] == {"data": log}
@@ -0,0 +1,61 @@
+import numpy as np
+
+from bec_widgets.widgets.plots.waveform.utils.lod_pyramid import FACTOR, MinMaxPyramid
+
+
+def test_min_max_pyramid_envelope_keeps_extrema():
+    y = np.random.default_rng(42).normal(size=100_003)
+    x = np.arange(len(y), dtype=float)
+    pyramid = MinMaxPyramid()
+    pyramid.set_data(x, y)
+
+    env_x, env_y = pyramid.envelope(None, None, max_points=1000)
+    assert len(env_x) == len(env_y) <= 1000
+    assert env_y.max() == y.max()
+    assert env_y.min() == y.min()
+    assert np.all(np.diff(env_x) >= 0)
+
+    env_x, env_y = pyramid.envelope(5000.5, 20000.5, max_points=1000)
+    assert len(env_x) <= 1000
+    # buckets are drawn at their first x position, i.e. the ends are accurate to one bucket
+    bucket_width = FACTOR * (20000 - 5000) / (1000 // 2)
+    assert env_x[0] <= 5000.5 and env_x[-1] >= 20000 - bucket_width
+    assert env_y.max() >= y[5001:20001].max()
+    assert env_y.min() <= y[5001:20001].min()
+
+
+def test_min_max_pyramid_returns_raw_data_if_small_enough():
+    pyramid = MinMaxPyramid()
+    pyramid.set_data(np.arange(100), np.arange(100) * 2)
+    env_x, env_y = pyramid.envelope(10, 20, max_points=1000)
+    np.testing.assert_array_equal(env_x, np.arange(9, 22))
+    np.testing.assert_array_equal(env_y, np.arange(9, 22) * 2)
+
+
+def test_min_max_pyramid_incremental_append_matches_rebuild():
+    y = np.random.default_rng(1).normal(size=50_000)
+    x = np.arange(len(y), dtype=float)
+    incremental = MinMaxPyramid()
+    for stop in range(1000, len(y) + 1, 1000):
+        incremental.set_data(x[:stop], y[:stop])
+    rebuilt = MinMaxPyramid()
+    rebuilt.set_data(x, y)
+
+    assert incremental.levels == rebuilt.levels
+    assert len(incremental._levels[0]) == len(y) // FACTOR
+    for level_a, level_b in zip(incremental._levels, rebuilt._levels):
+        np.testing.assert_array_equal(level_a.x.view, level_b.x.view)
+        np.testing.assert_array_equal(level_a.y_min.view, level_b.y_min.view)
+        np.testing.assert_array_equal(level_a.y_max.view, level_b.y_max.view)
+
+
+def test_min_max_pyramid_rebuilds_on_new_data():
+    pyramid = MinMaxPyramid()
+    pyramid.set_data(np.arange(1000), np.ones(1000))
+    pyramid.set_data(np.arange(500), np.zeros(500))
+    assert len(pyramid) == 500
+    assert pyramid._levels[0].y_max.view.max() == 0
+    assert pyramid.monotonic
+
+    pyramid.set_data(np.array([0, 2, 1]), np.array([0, 1, 2]))
+    assert not pyramid.monotonic
@@ -111,6 +111,21 @@ def test_logpanel_output(qtbot, log_panel: LogPanel):
     assert log_panel.plain_text == TEST_COMBINED_PLAINTEXT + next_text + "\n"
 
 
+def test_logpanel_suspended_while_hidden(qtbot, log_panel: LogPanel):
+    log_panel.hide()
+    assert log_panel.suspended
+    for msg in TEST_LOG_MESSAGES:
+        log_panel._log_manager._process_incoming_log_msg({"data": msg})
+    assert len(log_panel._log_manager._data) == 3
+    assert len(log_panel._log_manager._display_queue) == 0
+    assert log_panel.plain_text == ""
+
+    log_panel.show()
+    qtbot.waitExposed(log_panel)
+    assert not log_panel.suspended
+    assert log_panel.plain_text == TEST_COMBINED_PLAINTEXT
+
+
 def test_level_filter(log_panel: LogPanel):
     log_panel._log_manager._data = deque(TEST_LOG_MESSAGES)
     log_panel._log_manager.update_level_filter("INFO")
@@ -0,0 +1,117 @@
+# pylint: skip-file
+import time
+
+import numpy as np
+import pyqtgraph as pg
+import pytest
+
+from bec_widgets.utils.performance_metrics import (
+    MessageRateMeter,
+    RollingSeries,
+    get_message_rate_meter,
+    plot_buffers,
+    process_memory,
+)
+from bec_widgets.widgets.plots.waveform.waveform import Waveform
+from bec_widgets.widgets.utility.performance_dashboard.performance_dashboard import (
+    PerformanceDashboard,
+)
+
+from .client_mocks import mocked_client
+from .conftest import create_widget
+
+
+@pytest.fixture
+def dashboard(qtbot, mocked_client):
+    widget = create_widget(qtbot, PerformanceDashboard, client=mocked_client)
+    yield widget
+
+
+def test_rolling_series_keeps_latest_values():
+    series = RollingSeries(3)
+    assert series.last() is None
+    for value in (1, 2, None, 4):
+        series.append(value)
+    assert len(series) == 3
+    np.testing.assert_array_equal(series.values(), [2, np.nan, 4])
+    assert series.last() == 4
+
+
+def test_message_rate_meter_counts_only_while_acquired():
+    meter = MessageRateMeter()
+    meter.acquire()
+    meter.acquire()
+    meter.release()
+    assert meter.enabled
+    meter.count("topic")
+    meter.count("topic")
+    meter.count(None)
+    time.sleep(0.01)
+    rates = meter.rates()
+    assert set(rates) == {"topic", "<unknown>"}
+    assert rates["topic"] == pytest.approx(2 * rates["<unknown>"])
+    assert meter.rates() == {}
+    meter.release()
+    assert not meter.enabled
+
+
+def test_plot_buffers_counts_curves_and_images():
+    plot_item = pg.PlotItem()
+    plot_item.plot(np.arange(10.0), np.arange(10.0))
+    plot_item.addItem(pg.ImageItem(np.zeros((10, 10))))
+    assert plot_buffers([plot_item]) == {"curves": 1, "images": 1, "bytes": 960}
+
+
+def test_process_memory():
+    memory = process_memory()
+    assert memory["rss"] > 0
+    assert memory["allocated_blocks"] > 0
+
+
+def test_dashboard_monitors_plots(qtbot, dashboard, mocked_client):
+    assert get_message_rate_meter().enabled
+    waveform = create_widget(qtbot, Waveform, client=mocked_client)
+    waveform.plot(np.arange(100.0))
+
+    dashboard.update_metrics()
+    assert waveform.gui_id in dashboard._plots
+    snapshot = dashboard.snapshot()
+    assert list(snapshot["fps"]) == [waveform.object_name]
+    assert snapshot["plots"]["curves"] == 1
+    assert snapshot["plots"]["bytes"] == 2 * 100 * 8
+    assert snapshot["event_loop_lag_ms"]["max"] >= 0
+    assert set(snapshot["icon_cache"]) == {"hits", "misses", "size", "max_size"}
+    assert dashboard.plot_table.rowCount() == 1
+
+    waveform.close()
+    waveform.deleteLater()
+    dashboard.update_metrics()
+    assert dashboard._plots == {}
+
+
+def test_dashboard_message_rates_per_message(dashboard):
+    def slot_a(msg, metadata):
+        pass
+
+    def slot_b(msg, metadata):
+        pass
+
+    dispatcher = dashboard.bec_dispatcher
+    dispatcher.connect_slot(slot_a, "test_topic")
+    dispatcher.connect_slot(slot_b, "test_topic")
+    for qt_slot in dispatcher._slots_by_topic["test_topic"]:
+        qt_slot({"value": 1}, {}, topic="test_topic")
+
+    dashboard.update_metrics()
+    rates = dashboard.snapshot()["message_rates"]
+    # two slots received the same message, which is counted once
+    assert list(rates) == ["test_topic"]
+    assert dashboard.topic_table.item(0, 2).text() == "2"
+
+
+def test_dashboard_cleanup_releases_meter(dashboard):
+    dashboard.update_interval = 500
+    assert dashboard._update_timer.interval() == 500
+    dashboard.close()
+    assert not get_message_rate_meter().enabled
+    assert not dashboard._update_timer.isActive()
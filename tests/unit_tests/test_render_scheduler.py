@@ -0,0 +1,149 @@
+# pylint: skip-file
+import gc
+import weakref
+from unittest import mock
+
+import numpy as np
+import pytest
+from qtpy.QtWidgets import QTabWidget, QWidget
+
+from bec_widgets.utils.render_scheduler import RenderScheduler, is_rendered
+from bec_widgets.widgets.plots.image.image import Image
+from bec_widgets.widgets.plots.motor_map.motor_map import MotorMap
+from bec_widgets.widgets.plots.waveform.waveform import Waveform
+from bec_widgets.widgets.progress.ring_progress_bar.ring_progress_bar import RingProgressBar
+
+from .client_mocks import mocked_client
+from .conftest import create_widget
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = RenderScheduler(max_fps=50)
+    yield scheduler
+    scheduler.clear()
+    scheduler.deleteLater()
+
+
+@pytest.fixture
+def tabs(qtbot):
+    tabs = QTabWidget()
+    tabs.addTab(QWidget(), "first")
+    tabs.addTab(QWidget(), "second")
+    tabs.resize(300, 200)
+    qtbot.addWidget(tabs)
+    tabs.show()
+    qtbot.waitExposed(tabs)
+    yield tabs
+
+
+def test_scheduler_applies_latest_update_once_per_frame(qtbot, scheduler, tabs):
+    widget = tabs.widget(0)
+    calls = []
+    for value in range(10):
+        scheduler.schedule(widget, "data", lambda value=value: calls.append(value))
+    assert calls == []
+    assert scheduler.is_pending(widget, "data")
+    qtbot.waitUntil(lambda: calls == [9])
+    assert not scheduler.is_pending(widget)
+
+
+def test_scheduler_skips_hidden_tabs(qtbot, scheduler, tabs):
+    visible, hidden = tabs.widget(0), tabs.widget(1)
+    assert is_rendered(visible)
+    assert not is_rendered(hidden)
+    calls = []
+    scheduler.schedule(visible, "data", lambda: calls.append("visible"))
+    scheduler.schedule(hidden, "data", lambda: calls.append("hidden"))
+    qtbot.waitUntil(lambda: calls == ["visible"])
+    qtbot.wait(50)
+    assert calls == ["visible"]
+    assert scheduler.is_pending(hidden)
+
+    tabs.setCurrentIndex(1)
+    qtbot.waitUntil(lambda: calls == ["visible", "hidden"])
+
+
+def test_scheduler_pause_cancel_and_flush(qtbot, scheduler, tabs):
+    widget = tabs.widget(0)
+    calls = []
+    scheduler.pause()
+    scheduler.schedule(widget, "data", lambda: calls.append("paused"))
+    qtbot.wait(50)
+    assert calls == []
+    scheduler.resume()
+    qtbot.waitUntil(lambda: calls == ["paused"])
+
+    scheduler.schedule(widget, "data", lambda: calls.append("cancelled"))
+    scheduler.cancel(widget)
+    scheduler.schedule(tabs.widget(1), "data", lambda: calls.append("flushed"))
+    scheduler.flush()
+    assert calls == ["paused", "flushed"]
+
+    scheduler.immediate = True
+    scheduler.schedule(widget, "data", lambda: calls.append("immediate"))
+    assert calls[-1] == "immediate"
+
+
+class _Updatable(QWidget):
+    def __init__(self, calls):
+        super().__init__()
+        self.calls = calls
+
+    def update_data(self):
+        self.calls.append(self)
+
+
+def test_pending_updates_do_not_keep_widgets_alive(qtbot, scheduler, tabs):
+    calls = []
+    widget = _Updatable(calls)
+    scheduler.schedule(widget, "data", widget.update_data)
+    ref = weakref.ref(widget)
+    del widget
+    gc.collect()
+    assert ref() is None
+    scheduler.flush()
+    assert calls == []
+
+
+def test_image_updates_are_coalesced(qtbot, mocked_client, deferred_rendering):
+    image = create_widget(qtbot, Image, client=mocked_client)
+    for value in range(5):
+        image.on_image_update_2d({"data": np.full((10, 10), value)}, {})
+    assert image._main_image.raw_data is None
+    assert deferred_rendering.is_pending(image, "main_image")
+    qtbot.waitUntil(lambda: not deferred_rendering.is_pending(image))
+    np.testing.assert_array_equal(image._main_image.raw_data, np.full((10, 10), 4))
+
+
+def test_waveform_curve_updates_are_coalesced(qtbot, mocked_client, deferred_rendering):
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    with mock.patch.object(wf, "update_sync_curves") as update:
+        for _ in range(5):
+            wf.sync_signal_update.emit()
+        update.assert_not_called()
+        assert deferred_rendering.is_pending(wf, "sync_curves")
+        qtbot.waitUntil(lambda: update.call_count == 1)
+        qtbot.wait(50)
+        update.assert_called_once()
+
+
+def test_motor_map_updates_are_coalesced(qtbot, mocked_client, deferred_rendering):
+    mm = create_widget(qtbot, MotorMap, client=mocked_client)
+    with mock.patch.object(mm, "_update_plot") as update:
+        for _ in range(5):
+            mm.update_signal.emit()
+        update.assert_not_called()
+        qtbot.waitUntil(lambda: update.call_count == 1)
+        qtbot.wait(50)
+        update.assert_called_once()
+
+
+def test_ring_repaints_are_coalesced(qtbot, mocked_client, deferred_rendering):
+    bar = create_widget(qtbot, RingProgressBar, client=mocked_client)
+    for value in range(5):
+        bar.set_value(value * 10)
+    assert deferred_rendering.is_pending(bar, "rings")
+    assert not bar._dirty_region.isEmpty()
+    qtbot.waitUntil(lambda: not deferred_rendering.is_pending(bar))
+    assert bar._dirty_region.isEmpty()
@@ -1,5 +1,7 @@
 # pylint: disable=missing-function-docstring, missing-module-docstring, unused-import
 
+from unittest import mock
+
 import pytest
 from bec_lib.endpoints import MessageEndpoints
 from pydantic import ValidationError
@@ -335,3 +337,71 @@ def test_auto_update(ring_progress_bar):
     assert ring_progress_bar._rings[0].config.max_value == 10
     assert ring_progress_bar._rings[1].config.min_value == 2
     assert ring_progress_bar._rings[1].config.max_value == 20
+
+
+def test_auto_update_reconciles_subscriptions(ring_progress_bar):
+    ring_progress_bar.enable_auto_updates(True)
+    msg = {
+        "queue": {
+            "primary": {
+                "info": [
+                    {
+                        "active_request_block": {
+                            "report_instructions": [
+                                {
+                                    "readback": {
+                                        "devices": ["samx", "samy"],
+                                        "start": [1, 2],
+                                        "end": [10, 20],
+                                    }
+                                }
+                            ]
+                        }
+                    }
+                ]
+            }
+        }
+    }
+    ring_progress_bar.on_scan_queue_status(msg, {})
+    dispatcher = ring_progress_bar.bec_dispatcher
+
+    with (
+        mock.patch.object(dispatcher, "connect_slot") as connect_slot,
+        mock.patch.object(dispatcher, "disconnect_slot") as disconnect_slot,
+        mock.patch.object(ring_progress_bar, "update") as update,
+    ):
+        for _ in range(10):
+            ring_progress_bar.on_scan_queue_status(msg, {})
+        connect_slot.assert_not_called()
+        disconnect_slot.assert_not_called()
+        update.assert_not_called()
+
+        # only the ring whose device changed is reconnected
+        readback = msg["queue"]["primary"]["info"][0]["active_request_block"][
+            "report_instructions"
+        ][0]["readback"]
+        readback["devices"] = ["samx", "samz"]
+        ring_progress_bar.on_scan_queue_status(msg, {})
+        ring_1 = ring_progress_bar._rings[1]
+        disconnect_slot.assert_called_once_with(
+            ring_1.on_device_readback, MessageEndpoints.device_readback("samy").endpoint
+        )
+        connect_slot.assert_called_once_with(
+            ring_1.on_device_readback, MessageEndpoints.device_readback("samz")
+        )
+
+
+def test_set_value_repaints_only_the_ring(ring_progress_bar):
+    ring_progress_bar.set_number_of_bars(3)
+    ring = ring_progress_bar._rings[1]
+    with mock.patch.object(ring_progress_bar, "update") as update:
+        ring.set_value(50)
+        update.assert_called_once()
+        region = update.call_args[0][0]
+        assert region == ring_progress_bar._ring_region(1)
+        assert not region.intersects(ring_progress_bar._ring_region(0))
+        assert not region.intersects(ring_progress_bar._ring_region(2))
+
+        # setting the same value again does not trigger a repaint
+        ring.set_value(50)
+        update.assert_called_once()
@@ -50,3 +50,46 @@ def test_reset_singleton(rpc_register):
 
     assert len(all_connections) == 0
     assert all_connections == {}
+
+
+def test_call_on_registration(rpc_register):
+    obj1 = FakeObject("id1")
+    obj2 = FakeObject("id2")
+    registered = []
+
+    rpc_register.add_rpc(obj1)
+    rpc_register.call_on_registration(obj1, registered.append)
+    assert registered == [obj1]
+
+    rpc_register.call_on_registration(obj2, registered.append)
+    assert registered == [obj1]
+    rpc_register.add_rpc(obj2)
+    assert registered == [obj1, obj2]
+
+    # callbacks are only called once
+    rpc_register.remove_rpc(obj2)
+    rpc_register.add_rpc(obj2)
+    assert registered == [obj1, obj2]
+
+
+def test_cancel_registration_callbacks(rpc_register):
+    obj1 = FakeObject("id1")
+    registered = []
+
+    rpc_register.call_on_registration(obj1, registered.append)
+    rpc_register.cancel_registration_callbacks(obj1)
+    rpc_register.add_rpc(obj1)
+    assert registered == []
+
+
+def test_cancel_single_registration_callback(rpc_register):
+    obj1 = FakeObject("id1")
+    registered = []
+    cancelled = []
+
+    rpc_register.call_on_registration(obj1, registered.append)
+    rpc_register.call_on_registration(obj1, cancelled.append)
+    rpc_register.cancel_registration_callbacks(obj1, cancelled.append)
+    rpc_register.add_rpc(obj1)
+    assert registered == [obj1]
+    assert cancelled == []
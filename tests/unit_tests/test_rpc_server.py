@@ -1,9 +1,15 @@
 import argparse
+from unittest import mock
 
 import pytest
 from bec_lib.service_config import ServiceConfig
+from qtpy.QtCore import QObject
 
 from bec_widgets.cli.server import GUIServer
+from bec_widgets.utils.bec_connector import BECConnector
+from bec_widgets.utils.rpc_server import RPCServer
+
+from .client_mocks import mocked_client
 
 
 @pytest.fixture
@@ -30,3 +36,72 @@ def test_gui_server_get_service_config(gui_server):
     Test that the server is started with the correct arguments.
     """
     assert gui_server._get_service_config().config is ServiceConfig().config
+
+
+class BECConnectorQObject(BECConnector, QObject): ...
+
+
+@pytest.fixture
+def rpc_server(mocked_client, bec_dispatcher):
+    server = RPCServer("rpc_test", dispatcher=bec_dispatcher, client=mocked_client)
+    yield server
+    server.shutdown()
+
+
+def test_rpc_server_defers_response_until_registered(qtbot, rpc_server, mocked_client):
+    """
+    Newly created objects are registered from the event loop. The response must only be sent
+    once they are registered, without blocking the event loop in the meantime.
+    """
+    connector = BECConnectorQObject(client=mocked_client)
+    assert not rpc_server.rpc_register.object_is_registered(connector)
+
+    with mock.patch.object(rpc_server, "send_response") as send_response:
+        rpc_server.send_result_when_registered("request_id", connector)
+        send_response.assert_not_called()
+        assert "request_id" in rpc_server._deferred_responses
+
+        qtbot.waitUntil(lambda: send_response.call_count == 1)
+        request_id, accepted, msg = send_response.call_args.args
+        assert request_id == "request_id"
+        assert accepted is True
+        assert msg["result"]["gui_id"] == connector.gui_id
+        assert msg["result"]["__rpc__"] is True
+        assert rpc_server._deferred_responses == {}
+
+
+def test_rpc_server_sends_registered_result_immediately(qtbot, rpc_server, mocked_client):
+    connector = BECConnectorQObject(client=mocked_client)
+    qtbot.waitUntil(lambda: rpc_server.rpc_register.object_is_registered(connector))
+
+    with mock.patch.object(rpc_server, "send_response") as send_response:
+        rpc_server.send_result_when_registered("request_id", [connector, 1])
+        send_response.assert_called_once()
+        result = send_response.call_args.args[2]["result"]
+        assert result[0]["gui_id"] == connector.gui_id
+        assert result[1] == 1
+
+
+def test_rpc_server_releases_callbacks_of_objects_deleted_before_registration(
+    qtbot, rpc_server, mocked_client
+):
+    connector = BECConnectorQObject(client=mocked_client)
+    other = BECConnectorQObject(client=mocked_client)
+    register = rpc_server.rpc_register
+
+    with mock.patch.object(rpc_server, "send_response") as send_response:
+        rpc_server.send_result_when_registered("request_id", [connector, other])
+        assert connector.gui_id in register._registration_callbacks
+        connector.destroyed.emit(connector)
+
+        send_response.assert_called_once()
+        assert send_response.call_args.args[1] is False
+        assert rpc_server._deferred_responses == {}
+        # the registration callbacks holding the result are removed
+        assert connector.gui_id not in register._registration_callbacks
+        assert other.gui_id not in register._registration_callbacks
+
+        # destroying the other object does not send a second response
+        other.destroyed.emit(other)
+        qtbot.wait(10)
+        send_response.assert_called_once()
@@ -7,6 +7,7 @@ from bec_widgets.cli import client
 from bec_widgets.cli.rpc.rpc_base import RPCBase
 from bec_widgets.cli.rpc.rpc_widget_handler import RPCWidgetHandler
 from bec_widgets.utils.bec_widget import BECWidget
+from bec_widgets.utils.widget_manifest import WidgetManifestEntry
 from bec_widgets.widgets.containers.dock.dock import BECDock
 
 
@@ -20,8 +21,11 @@ class _TestPluginWidget(BECWidget): ...
 
 
 @patch(
-    "bec_widgets.cli.rpc.rpc_widget_handler.get_all_plugin_widgets",
-    return_value={"DeviceComboBox": _TestPluginWidget, "NewPluginWidget": _TestPluginWidget},
+    "bec_widgets.cli.rpc.rpc_widget_handler.get_plugin_widget_manifest",
+    return_value={
+        "DeviceComboBox": WidgetManifestEntry.from_class(_TestPluginWidget, is_widget=True),
+        "NewPluginWidget": WidgetManifestEntry.from_class(_TestPluginWidget, is_widget=True),
+    },
 )
 def test_duplicate_plugins_not_allowed(_):
     handler = RPCWidgetHandler()
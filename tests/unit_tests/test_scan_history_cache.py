@@ -0,0 +1,79 @@
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from bec_widgets.widgets.plots.scan_history_cache import ScanHistoryCache
+
+
+class DummyHistorySignal:
+    def __init__(self, value):
+        self.value = value
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return {"value": self.value, "timestamp": np.arange(len(self.value))}
+
+
+def create_history_item(scan_id: str, signals: dict[str, list]):
+    item = MagicMock()
+    item.metadata = {"bec": {"scan_id": scan_id}}
+    item.devices = {name: {name: DummyHistorySignal(value)} for name, value in signals.items()}
+    return item
+
+
+def test_scan_history_cache_reads_signal_once():
+    cache = ScanHistoryCache()
+    item = create_history_item("scan_1", {"samx": [1, 2, 3], "bpm4i": [4, 5, 6]})
+
+    for _ in range(5):
+        data = cache.read(item, "scan_1", "samx", "samx")
+    np.testing.assert_array_equal(data["value"], [1, 2, 3])
+    assert item.devices["samx"]["samx"].reads == 1
+    assert item.devices["bpm4i"]["bpm4i"].reads == 0
+    assert cache.hits == 4
+    assert cache.misses == 1
+
+
+def test_scan_history_cache_missing_signal():
+    cache = ScanHistoryCache()
+    item = create_history_item("scan_1", {"samx": [1, 2, 3]})
+    assert cache.read(item, "scan_1", "not_a_device", "entry") == {}
+    assert cache.missing("scan_1", [("samx", "samx"), ("not_a_device", "entry")]) == [
+        ("samx", "samx")
+    ]
+
+
+def test_scan_history_cache_lru_eviction():
+    cache = ScanHistoryCache(max_signals=2)
+    item = create_history_item("scan_1", {"a": [1], "b": [2], "c": [3]})
+    cache.read(item, "scan_1", "a", "a")
+    cache.read(item, "scan_1", "b", "b")
+    # touch "a" so that "b" is the least recently used signal
+    cache.read(item, "scan_1", "a", "a")
+    cache.read(item, "scan_1", "c", "c")
+    assert len(cache) == 2
+    assert ("scan_1", "a", "a") in cache
+    assert ("scan_1", "b", "b") not in cache
+    assert ("scan_1", "c", "c") in cache
+
+
+def test_scan_history_cache_load_and_prefetch():
+    cache = ScanHistoryCache()
+    items = [create_history_item(f"scan_{ii}", {"samx": [ii], "bpm4i": [ii]}) for ii in range(3)]
+    signals = [("samx", "samx"), ("bpm4i", "bpm4i")]
+
+    thread = threading.Thread(target=cache.prefetch, args=(items, [0, 2, 5], signals))
+    thread.start()
+    thread.join()
+
+    assert cache.missing("scan_0", signals) == []
+    assert cache.missing("scan_2", signals) == []
+    assert cache.missing("scan_1", signals) == signals
+    cache.load(items[0], "scan_0", signals)
+    assert items[0].devices["samx"]["samx"].reads == 1
+
+    cache.clear("scan_0")
+    assert cache.missing("scan_0", signals) == signals
+    assert cache.missing("scan_2", signals) == []
@@ -0,0 +1,110 @@
+# pylint: skip-file
+import numpy as np
+import pytest
+
+from bec_widgets.utils.shm_transport import (
+    SHM_METADATA_KEY,
+    SharedMemoryFrame,
+    SharedMemoryFrameReader,
+    SharedMemoryFrameRing,
+)
+from bec_widgets.widgets.plots.image.image import Image
+
+from .client_mocks import mocked_client
+from .conftest import create_widget
+
+
+@pytest.fixture
+def ring():
+    ring = SharedMemoryFrameRing(frame_shape=(8, 8), dtype="uint16", slots=2)
+    yield ring
+    ring.close()
+
+
+@pytest.fixture
+def reader():
+    reader = SharedMemoryFrameReader()
+    yield reader
+    reader.close()
+
+
+def test_reader_reuses_output_buffer(ring, reader):
+    frame = np.arange(64, dtype=np.uint16).reshape(8, 8)
+    descriptor = ring.write(frame)
+    out = np.empty((8, 8), dtype=np.uint16)
+    data = reader.read(descriptor, out=out)
+    assert data is out
+    np.testing.assert_array_equal(data, frame)
+
+    # smaller frames fit into the slots as well
+    descriptor = ring.write(np.ones((2, 3), dtype=np.uint16))
+    np.testing.assert_array_equal(reader.read(descriptor, out=out), np.ones((2, 3)))
+
+
+def test_reader_drops_overwritten_frames(ring, reader):
+    first = ring.write(np.zeros((8, 8), dtype=np.uint16))
+    ring.write(np.ones((8, 8), dtype=np.uint16))
+    assert reader.read(first) is not None
+    ring.write(np.full((8, 8), 2, dtype=np.uint16))
+    assert reader.read(first) is None
+
+
+def test_reader_handles_missing_segments(reader):
+    descriptor = SharedMemoryFrame(name="bec_missing", offset=0, shape=(2, 2), dtype="<f8", seq=0)
+    assert reader.read(descriptor) is None
+
+
+def test_ring_rejects_oversized_frames(ring):
+    with pytest.raises(ValueError):
+        ring.write(np.zeros((16, 16), dtype=np.uint16))
+
+
+def test_ring_message_carries_descriptor(ring):
+    msg = ring.message("eiger", np.ones((8, 8), dtype=np.uint16))
+    assert msg.data.size == 0
+    frame = SharedMemoryFrame.from_metadata(msg.metadata)
+    assert frame.name == ring.name
+    assert frame.shape == (8, 8)
+    assert SharedMemoryFrame.from_metadata({}) is None
+    assert SharedMemoryFrame.from_metadata({SHM_METADATA_KEY: {"name": "x"}}) is None
+
+
+def test_image_reads_frames_from_shared_memory(qtbot, mocked_client, ring):
+    image = create_widget(qtbot, Image, client=mocked_client)
+    frame = np.arange(64, dtype=np.uint16).reshape(8, 8)
+    msg = ring.message("eiger", frame)
+    image.on_image_update_2d(msg.content, msg.metadata)
+    np.testing.assert_array_equal(image._main_image.raw_data, frame)
+    assert image._main_image.raw_data is image._shm_buffer
+
+    # a frame overwritten while it is read leaves the displayed frame untouched
+    displayed = image._main_image.raw_data
+    torn = ring.message("eiger", np.zeros((8, 8), dtype=np.uint16))
+    real_read = image._shm_reader.read
+
+    def overwritten_read(descriptor, out=None):
+        assert out is not displayed
+        data = real_read(descriptor, out=out)
+        data[:] = 7
+        return None
+
+    image._shm_reader.read = overwritten_read
+    image.on_image_update_2d(torn.content, torn.metadata)
+    image._shm_reader.read = real_read
+    assert image._main_image.raw_data is displayed
+    np.testing.assert_array_equal(displayed, frame)
+
+    # the next complete frame is shown from the scratch buffer, the buffers are swapped
+    msg = ring.message("eiger", frame + 1)
+    image.on_image_update_2d(msg.content, msg.metadata)
+    np.testing.assert_array_equal(image._main_image.raw_data, frame + 1)
+    assert image._main_image.raw_data is image._shm_buffer
+    assert image._shm_scratch is displayed
+
+    # frames that cannot be read from shared memory fall back to the inline data
+    stale = ring.message("eiger", frame, inline=True)
+    ring.write(frame)
+    ring.write(frame)
+    image.on_image_update_2d(stale.content, stale.metadata)
+    np.testing.assert_array_equal(image._main_image.raw_data, frame)
+    assert image._main_image.raw_data is not image._shm_buffer
@@ -0,0 +1,102 @@
+import pytest
+from qtpy.QtCore import QObject
+
+from bec_widgets.utils import slot_profiler
+from bec_widgets.utils.bec_dispatcher import QtThreadSafeCallback
+from bec_widgets.utils.error_popups import SafeSlot
+from bec_widgets.utils.slot_profiler import DurationHistogram, get_slot_profiler
+
+
+class Receiver(QObject):
+    def __init__(self):
+        super().__init__()
+        self.setObjectName("receiver")
+        self.received = []
+
+    @SafeSlot(dict, dict, verify_sender=True)
+    def on_message(self, msg, metadata):
+        if msg.get("fail"):
+            raise ValueError("failed")
+        self.received.append(msg)
+
+    @SafeSlot()
+    def on_click(self):
+        pass
+
+
+@pytest.fixture
+def profiler():
+    profiler = get_slot_profiler()
+    profiler.enable(reset=True)
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def _stats(profiler, slot, topic):
+    return next(
+        entry for entry in profiler.snapshot() if entry["slot"] == slot and entry["topic"] == topic
+    )
+
+
+def test_duration_histogram():
+    histogram = DurationHistogram()
+    histogram.add(0.00005)
+    histogram.add(0.002)
+    histogram.add(2)
+    result = histogram.to_dict()
+    assert result["count"] == 3
+    assert result["counts"][0] == 1
+    assert result["counts"][3] == 1
+    assert result["counts"][-1] == 1
+    assert result["max_ms"] == pytest.approx(2000)
+
+
+def test_profiles_dispatcher_deliveries(qtbot, profiler):
+    receiver = Receiver()
+    callback = QtThreadSafeCallback(receiver.on_message)
+    callback.topics.add("topic1")
+
+    callback({"value": 1}, {}, topic="topic1")
+    callback({"value": 2}, {})
+    callback({"fail": True}, {}, topic="topic1")
+
+    assert receiver.received == [{"value": 1}, {"value": 2}]
+    stats = _stats(profiler, "Receiver.on_message [receiver]", "topic1")
+    assert stats["calls"] == 3
+    assert stats["errors"] == 1
+    assert stats["queue_latency"]["count"] == 3
+    assert stats["execution"]["count"] == 3
+    assert stats["queue_depth"] == 0
+    assert stats["max_queue_depth"] == 1
+
+
+def test_profiles_safe_slot_calls(qtbot, profiler):
+    receiver = Receiver()
+    receiver.on_click()
+    # called directly, the sender is None and verify_sender drops the call
+    receiver.on_message({}, {})
+
+    assert _stats(profiler, "Receiver.on_click [receiver]", None)["calls"] == 1
+    dropped = _stats(profiler, "Receiver.on_message [receiver]", None)
+    assert dropped["calls"] == 0
+    assert dropped["drops"] == 1
+
+
+def test_profiling_can_be_toggled(qtbot, profiler):
+    receiver = Receiver()
+    callback = QtThreadSafeCallback(receiver.on_message)
+    profiler.disable()
+    callback({"value": 1}, {}, topic="topic1")
+    assert profiler.snapshot() == []
+
+    profiler.enable()
+    callback({"value": 2}, {}, topic="topic1")
+    assert receiver.received == [{"value": 1}, {"value": 2}]
+    assert _stats(profiler, "Receiver.on_message [receiver]", "topic1")["calls"] == 1
+
+
+def test_profiler_enabled_by_environment(monkeypatch):
+    monkeypatch.setattr(slot_profiler, "_slot_profiler", None)
+    monkeypatch.setenv(slot_profiler.PROFILE_ENV, "1")
+    assert get_slot_profiler().enabled
@@ -0,0 +1,91 @@
+# pylint: skip-file
+from unittest import mock
+
+import pytest
+from qtpy.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from bec_widgets.utils import theme_registry
+from bec_widgets.utils.theme_registry import ThemeRegistry
+from bec_widgets.widgets.utility.visual.dark_mode_button.dark_mode_button import DarkModeButton
+
+from .client_mocks import mocked_client
+from .conftest import create_widget
+
+
+@pytest.fixture
+def registry():
+    registry = ThemeRegistry()
+    yield registry
+    registry.clear()
+    registry.deleteLater()
+
+
+@pytest.fixture
+def widgets(qtbot):
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    widgets = [QLabel(f"label {index}", container) for index in range(5)]
+    for widget in widgets:
+        layout.addWidget(widget)
+    container.resize(200, 200)
+    qtbot.addWidget(container)
+    yield container, widgets
+
+
+def test_theme_is_applied_in_chunks(qtbot, registry, widgets):
+    _, children = widgets
+    applied = []
+    for widget in children:
+        registry.register(widget, lambda widget, theme: applied.append((widget, theme)))
+
+    registry.apply("light")
+    assert applied == []
+    assert registry.is_pending(children[0])
+    assert registry._timer.isActive()
+    # drive the chunks by hand, the timer would drain the queue within one event loop slice
+    registry._timer.stop()
+    with mock.patch.object(theme_registry, "CHUNK_BUDGET", 0):
+        for count in range(1, len(children) + 1):
+            registry._tick()
+            assert len(applied) == count
+    assert not registry.is_pending()
+    assert not registry._timer.isActive()
+    assert [widget for widget, _ in applied] == children
+    assert {theme for _, theme in applied} == {"light"}
+
+
+def test_visible_widgets_are_themed_first(qtbot, registry, widgets):
+    container, children = widgets
+    hidden = QWidget()
+    qtbot.addWidget(hidden)
+    container.show()
+    qtbot.waitExposed(container)
+    applied = []
+    registry.register(hidden, lambda widget, theme: applied.append(widget))
+    registry.register(children[0], lambda widget, theme: applied.append(widget))
+
+    registry.apply("dark")
+    registry.flush()
+    assert applied == [children[0], hidden]
+
+
+def test_new_theme_replaces_pending_change(qtbot, registry, widgets):
+    _, children = widgets
+    applied = []
+    registry.register(children[0], lambda widget, theme: applied.append(theme))
+    registry.apply("light")
+    registry.apply("dark")
+    qtbot.waitUntil(lambda: not registry.is_pending())
+    assert applied == ["dark"]
+    assert registry.theme == "dark"
+
+
+def test_bec_widgets_register_for_theme_updates(qtbot, mocked_client, immediate_theme_updates):
+    button = create_widget(qtbot, DarkModeButton, client=mocked_client)
+    assert immediate_theme_updates.is_registered(button)
+    with mock.patch.object(button, "apply_theme") as apply_theme:
+        immediate_theme_updates.apply("light")
+    apply_theme.assert_called_once_with("light")
+
+    button.close()
+    assert not immediate_theme_updates.is_registered(button)
@@ -9,6 +9,7 @@ import pytest
 from pyqtgraph.graphicsItems.DateAxisItem import DateAxisItem
 
 from bec_widgets.widgets.plots.plot_base import UIMode
+from bec_widgets.widgets.plots.scan_history_cache import ScanHistoryCache
 from bec_widgets.widgets.plots.waveform.curve import DeviceSignal
 from bec_widgets.widgets.plots.waveform.waveform import Waveform
 from tests.unit_tests.client_mocks import (
@@ -315,6 +316,81 @@ def test_curve_json_setter_ignores_custom(qtbot, mocked_client):
     assert curves[0].name() == "device_curve"
 
 
+def test_batch_defers_colors_and_refresh(qtbot, mocked_client):
+    """
+    Test that curves added within a batch get the same colors as curves added one by one,
+    while the device curves are categorised and refreshed only once.
+    """
+    reference = create_widget(qtbot, Waveform, client=mocked_client)
+    for label in ("a", "b", "c"):
+        reference.plot(x=[1, 2], y=[3, 4], label=label)
+
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    sync_spy = MagicMock()
+    wf.sync_signal_update.connect(sync_spy)
+    with mock.patch.object(wf, "_categorise_device_curves") as categorise:
+        with wf.batch():
+            for label in ("a", "b", "c"):
+                curve = wf.plot(x=[1, 2], y=[3, 4], label=label)
+                assert curve.config.color is None
+            wf.plot(arg1="bpm4i")
+            wf.plot(arg1="bpm3a")
+            with pytest.raises(ValueError):
+                wf._add_curve(config=wf.curves[0].config.model_copy())
+            categorise.assert_not_called()
+            sync_spy.assert_not_called()
+        categorise.assert_called_once()
+        sync_spy.assert_called_once()
+
+    assert [c.config.color for c in wf.curves[:3]] == [c.config.color for c in reference.curves]
+    assert len(set(c.config.color for c in wf.curves)) == 5
+
+
+def test_plot_many(qtbot, mocked_client):
+    """
+    Test that plot_many adds all curves and generates unique labels within the batch.
+    """
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    wf.plot([1, 2, 3])
+    curves = wf.plot_many([{"arg1": [1, 2, 3]}, {"arg1": [4, 5, 6]}, {"arg1": "bpm4i"}])
+    assert [c.name() for c in curves] == ["Curve_1", "Curve_2", "bpm4i-bpm4i"]
+    assert len(wf.curves) == 4
+    assert all(c.config.color for c in wf.curves)
+    assert wf._batch_depth == 0
+
+    with wf.batch():
+        wf.clear_all()
+        wf.plot([1, 2, 3])
+    assert [c.name() for c in wf.curves] == ["Curve_0"]
+
+
+@pytest.mark.parametrize("use_json", [False, True])
+def test_batch_loads_history_without_live_scan(qtbot, mocked_client, monkeypatch, use_json):
+    """
+    Test that device curves added in a batch, e.g. from saved curve configs, are loaded with the
+    data of the latest scan if no scan is live.
+    """
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    wf.scan_item = None
+
+    def load_history(scan_index):
+        wf.scan_item = create_dummy_scan_item()
+
+    hist_mock = MagicMock(side_effect=load_history)
+    monkeypatch.setattr(wf, "update_with_scan_history", hist_mock)
+
+    configs = [{"arg1": "bpm4i", "label": "bpm4i-0"}, {"arg1": "bpm3a", "label": "bpm3a-0"}]
+    if use_json:
+        source = create_widget(qtbot, Waveform, client=mocked_client)
+        source.plot_many(configs)
+        wf.curve_json = source.curve_json
+    else:
+        wf.plot_many(configs)
+
+    assert [c.name() for c in wf.curves] == ["bpm4i-0", "bpm3a-0"]
+    hist_mock.assert_called_once_with(-1)
+
+
 ##################################################
 # Waveform widget scan logic tests
 ##################################################
@@ -414,6 +490,42 @@ def test_categorise_device_curves(monkeypatch, qtbot, mocked_client):
     assert c_async in wf._async_curves
 
 
+class _CountingList(list):
+    """List counting how often it is iterated."""
+
+    traversals = 0
+
+    def __iter__(self):
+        self.traversals += 1
+        return super().__iter__()
+
+
+def test_live_scan_does_not_traverse_plot_item_curves(qtbot, mocked_client, monkeypatch):
+    """
+    Test that the curves of a live scan are looked up in the curve index instead of the
+    curves of the plot item, and that the categorisation is cached.
+    """
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    dummy_scan = create_dummy_scan_item()
+    monkeypatch.setattr(wf.queue.scan_storage, "find_scan_by_ID", lambda scan_id: dummy_scan)
+    wf.plot_many([{"arg1": "bpm4i", "label": f"bpm4i-{index}"} for index in range(200)])
+    wf.plot_item.curves = _CountingList(wf.plot_item.curves)
+
+    wf.on_scan_status({"scan_id": "1234"}, {})
+    categorisation = wf._categorisation
+    for _ in range(10):
+        wf.on_scan_progress({"done": False}, {})
+        assert wf._categorise_device_curves() == "sync"
+    assert wf.get_curve("bpm4i-199") is wf._find_curve_by_label("bpm4i-199")
+    assert wf._categorisation is categorisation
+    assert len(wf._sync_curves) == 200
+    assert wf.plot_item.curves.traversals == 0
+
+    wf.remove_curve("bpm4i-0")
+    assert len(wf._sync_curves) == 199
+    assert wf.get_curve(0).name() == "bpm4i-1"
+
+
 @pytest.mark.parametrize(
     ["mode", "calls"], [("sync", (1, 0)), ("async", (0, 1)), ("mixed", (1, 1))]
 )
@@ -819,3 +931,94 @@ def test_show_dap_summary_popup(qtbot, mocked_client):
     wf.dap_summary_dialog.close()
     assert wf.dap_summary_dialog is None
     assert fit_action.isChecked() is False
+
+
+def test_update_with_scan_history_uses_cache(qtbot, mocked_client, monkeypatch):
+    """
+    Test that history data is loaded once in the background and served from the scan history
+    cache afterwards, and that the neighbouring scans are prefetched.
+    """
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    wf._history_cache = ScanHistoryCache()
+    c = wf.plot(arg1="bpm4i")
+
+    reads = {}
+
+    def create_history_item(scan_id):
+        item = MagicMock()
+        del item.live_data
+        item.metadata = {
+            "bec": {
+                "scan_id": scan_id,
+                "scan_report_devices": ["samx"],
+                "readout_priority": {"monitored": ["bpm4i", "samx"], "async": []},
+            }
+        }
+
+        def make_signal(name, value):
+            signal = MagicMock()
+
+            def read():
+                reads[(scan_id, name)] = reads.get((scan_id, name), 0) + 1
+                return {"value": value, "timestamp": [1, 2, 3]}
+
+            signal.read.side_effect = read
+            return signal
+
+        item.devices = {
+            "samx": {"samx": make_signal("samx", [1, 2, 3])},
+            "bpm4i": {"bpm4i": make_signal("bpm4i", [4, 5, 6])},
+        }
+        return item
+
+    history = [create_history_item(f"scan_{ii}") for ii in range(3)]
+    monkeypatch.setattr(mocked_client, "history", history, raising=False)
+
+    wf.update_with_scan_history(scan_index=1)
+    qtbot.waitUntil(lambda: c.get_data()[1] is not None and len(c.get_data()[1]) == 3)
+    qtbot.waitUntil(lambda: not wf._history_cache.missing("scan_0", [("bpm4i", "bpm4i")]))
+    qtbot.waitUntil(lambda: not wf._history_cache.missing("scan_2", [("bpm4i", "bpm4i")]))
+    qtbot.waitUntil(lambda: len(wf._workers) == 0)
+    np.testing.assert_array_equal(c.get_data()[0], [1, 2, 3])
+    np.testing.assert_array_equal(c.get_data()[1], [4, 5, 6])
+
+    for _ in range(5):
+        wf.update_sync_curves()
+    assert reads[("scan_1", "samx")] == 1
+    assert reads[("scan_1", "bpm4i")] == 1
+
+    # The neighbour was prefetched, browsing to it does not read again
+    wf.update_with_scan_history(scan_index=2)
+    wf.update_sync_curves()
+    assert reads[("scan_2", "bpm4i")] == 1
+    qtbot.waitUntil(lambda: len(wf._workers) == 0)
+
+
+def test_curve_lod_rendering(qtbot, mocked_client):
+    """
+    Test that long curves are drawn from the level-of-detail pyramid, such that the number of
+    displayed points is bounded by the width of the view.
+    """
+    wf = create_widget(qtbot, Waveform, client=mocked_client)
+    c = wf.plot(x=np.arange(10), y=np.arange(10), label="lod_curve")
+    width = int(wf.plot_item.vb.width())
+    assert width > 0
+
+    y = np.sin(np.linspace(0, 100, 1_000_000))
+    c.setData(np.arange(len(y)), y)
+    x_disp, y_disp = c.getData()
+    assert len(x_disp) <= 2 * width
+    assert y_disp.max() == y.max()
+    assert y_disp.min() == y.min()
+    # the original data is not touched
+    assert len(c.get_data()[1]) == len(y)
+
+    # zooming in selects a finer level, but still bounded by the view width
+    wf.plot_item.vb.setXRange(1000, 2000, padding=0)
+    x_disp, y_disp = c.getData()
+    assert len(x_disp) <= 2 * width
+    assert x_disp[0] <= 1000 and x_disp[-1] >= 2000 - 4 * 1000 / width
+
+    # non-monotonic data falls back to the pyqtgraph processing
+    c.setData(np.random.default_rng(0).random(5000), np.arange(5000))
+    assert c._lod_display_dataset() is None
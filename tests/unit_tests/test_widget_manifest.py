@@ -0,0 +1,90 @@
+import os
+from unittest import mock
+
+import pytest
+
+from bec_widgets.utils import widget_manifest
+from bec_widgets.utils.ui_loader import translate_bec_widgets_header
+from bec_widgets.utils.widget_manifest import (
+    LazyWidgetClasses,
+    WidgetManifest,
+    WidgetManifestEntry,
+    get_widget_manifest,
+)
+from bec_widgets.widgets.plots.waveform.waveform import Waveform
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    with mock.patch.dict(os.environ, {"BEC_WIDGETS_CACHE_DIR": str(tmp_path / "cache")}):
+        yield tmp_path / "cache"
+
+
+def test_widget_manifest_is_persisted(cache_dir):
+    entries = get_widget_manifest("bec_widgets")
+    assert entries["Waveform"].is_widget
+    assert entries["Waveform"].is_connector
+    assert entries["Waveform"].icon_name == Waveform.ICON_NAME
+    assert entries["Waveform"].load() is Waveform
+    assert len(os.listdir(cache_dir)) == 1
+
+    with mock.patch.object(widget_manifest, "_discover_custom_classes") as discover:
+        cached = get_widget_manifest("bec_widgets")
+    discover.assert_not_called()
+    assert cached == entries
+
+
+def test_widget_manifest_force_update(cache_dir):
+    get_widget_manifest("bec_widgets")
+    with mock.patch.object(
+        widget_manifest, "_discover_custom_classes", return_value={}
+    ) as discover:
+        assert get_widget_manifest("bec_widgets", force_update=True) == {}
+    discover.assert_called_once_with("bec_widgets")
+
+
+def test_widget_manifest_stale_on_source_change(cache_dir, tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    module_file = source_dir / "module.py"
+    module_file.write_text("a = 1\n")
+    entry = WidgetManifestEntry(name="Waveform", module=Waveform.__module__, file="")
+
+    manifest = WidgetManifest("test", str(source_dir), "1.0")
+    manifest.save({"Waveform": entry})
+    assert WidgetManifest("test", str(source_dir), "1.0").load() == {"Waveform": entry}
+    assert WidgetManifest("test", str(source_dir), "2.0").load() is None
+
+    module_file.write_text("a = 12\n")
+    assert WidgetManifest("test", str(source_dir), "1.0").load() is None
+
+
+def test_widget_manifest_corrupt_file(cache_dir, tmp_path):
+    manifest = WidgetManifest("test", str(tmp_path), "1.0")
+    os.makedirs(cache_dir)
+    with open(manifest.path, "w", encoding="utf-8") as file:
+        file.write("not json")
+    assert manifest.load() is None
+
+
+def test_lazy_widget_classes_only_loads_on_access():
+    entry = WidgetManifestEntry(name="Waveform", module=Waveform.__module__, file="")
+    classes = LazyWidgetClasses({"Waveform": entry})
+    with mock.patch.object(WidgetManifestEntry, "load", return_value=Waveform) as load:
+        assert "Waveform" in classes
+        assert list(classes) == ["Waveform"]
+        load.assert_not_called()
+        assert classes["Waveform"] is Waveform
+        assert classes["Waveform"] is Waveform
+        load.assert_called_once()
+    assert classes.get("NotAWidget") is None
+
+
+def test_ui_header_translation_does_not_import_widgets():
+    entry = WidgetManifestEntry(name="Waveform", module=Waveform.__module__, file="")
+    classes = LazyWidgetClasses({"Waveform": entry})
+    with mock.patch.object(WidgetManifestEntry, "load") as load:
+        assert translate_bec_widgets_header("waveform", classes) == Waveform.__module__
+        assert translate_bec_widgets_header("qlabel.h", classes) == "qlabel.h"
+        load.assert_not_called()
+    assert translate_bec_widgets_header("waveform", {"Waveform": Waveform}) == Waveform.__module__